@@ -1,115 +1,69 @@
+import hashlib
+import io
 import os
 import re
+import time
 import streamlit as st
-from PyPDF2 import PdfReader
-import pytesseract
-from pdf2image import convert_from_bytes
-from PIL import Image
-import io
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
 # Add these lines right after the other imports at the top of app.py
 from dotenv import load_dotenv
 import os
 
+from ats import metrics
+from ats.batch import score_pdf
+from ats.cache import get_default_cache
+from ats.extract import MAX_PDF_BYTES
+from ats.jobs import ensure_local_workers, get_default_queue
+from ats.llm import get_default_client
+from ats.profile import get_profile, jd_hash
+from ats.prompt import DEFAULT_BUDGET, compact_prompt
+from ats.report import render_html, render_pdf, render_text
+from ats.text import word_tokenize
+
 # Load environment variables
 load_dotenv()
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+PROMPT_BUDGET = int(os.getenv("GEMINI_PROMPT_BUDGET", DEFAULT_BUDGET))
+# Download formats for the analysis report: label -> (renderer, file extension, MIME type)
+REPORT_FORMATS = {
+    "Text": (render_text, "txt", "text/plain"),
+    "HTML": (render_html, "html", "text/html"),
+    "PDF": (render_pdf, "pdf", "application/pdf"),
+}
+# Directory of open-role job descriptions (.txt) to rank for each resume
+ROLES_DIR = os.getenv("ATS_ROLES_DIR")
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+# Load and display the AI-generated image
 
-# Common resume sections
-RESUME_SECTIONS = [
-    'experience', 'education', 'skills', 'summary', 
-    'work experience', 'projects', 'certifications',
-    'languages', 'interests', 'awards', 'publications'
-]
 
-# Load and display the AI-generated image
+@st.cache_resource
+def load_resources():
+    """Per-process resources: choose the tokenizer and open the extraction cache once."""
+    word_tokenize("warm up")
+    return get_default_cache()
 
 
-class ATSAnalyzer:
-    @staticmethod
-    def extract_text_from_pdf(uploaded_file):
-        """Extract text from a PDF resume, with OCR fallback for image-based PDFs."""
-        try:
-            pdf_reader = PdfReader(uploaded_file)
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text() or ""
-                text += page_text
-            
-            # If no text is extracted, try OCR on each page
-            if not text.strip():
-                st.warning("No text detected. Attempting OCR on image-based PDF...")
-                images = convert_from_bytes(uploaded_file.read(), first_page=1, last_page=len(pdf_reader.pages))
-                for image in images:
-                    text += pytesseract.image_to_string(image) + "\n"
-            
-            return text.strip() if text.strip() else None
-        except Exception as e:
-            st.error(f"Error extracting PDF text: {str(e)}")
-            return None
+@st.cache_resource
+def load_roles(path):
+    """Precompile the open roles once per process."""
+    from ats.roles import RoleSet
+    return RoleSet.from_directory(path)
 
-    @staticmethod
-    def extract_keywords(text, top_n=20):
-        """Extract top keywords from text."""
-        stop_words = set(stopwords.words('english'))
-        words = word_tokenize(text.lower())
-        words = [word for word in words if word.isalnum() and word not in stop_words and len(word) > 2]
-        word_freq = {}
-        for word in words:
-            word_freq[word] = word_freq.get(word, 0) + 1
-        return sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
 
-    @staticmethod
-    def analyze_resume_sections(text):
-        """Analyze resume sections and return found sections."""
-        text_lower = text.lower()
-        found_sections = [section for section in RESUME_SECTIONS if section in text_lower]
-        return found_sections
+@st.cache_data(max_entries=64, show_spinner=False)
+def score_resume(pdf_bytes, job_description):
+    """Score a text PDF once per (file, job description).
+
+    ``needs_ocr`` is set when the PDF has no text layer; any other failure
+    (a corrupt or oversized file) only sets ``error``, since OCR cannot fix it.
+    """
+    try:
+        record = score_pdf(io.BytesIO(pdf_bytes), job_description, cache=load_resources(),
+                           keep_text=True, ocr=False, raise_errors=True)
+    except Exception as e:
+        return {"error": str(e), "needs_ocr": False}
+    # With errors raised, "no text extracted" can only mean there was no text layer
+    return {**record, "needs_ocr": bool(record["error"])}
 
-    @staticmethod
-    def perform_ats_checks(pdf_text, job_description):
-        """Perform comprehensive ATS compatibility checks."""
-        # Extract keywords from job description
-        job_keywords = [word[0] for word in ATSAnalyzer.extract_keywords(job_description, top_n=20)]
-        
-        # Check for resume sections
-        found_sections = ATSAnalyzer.analyze_resume_sections(pdf_text)
-        
-        # Basic ATS checks
-        checks = {
-            "Keywords Match": sum(1 for keyword in job_keywords if keyword in pdf_text.lower()) / len(job_keywords) * 100 if job_keywords else 0,
-            "Has Experience Section": any(sec in ['experience', 'work experience'] for sec in found_sections),
-            "Has Education Section": 'education' in found_sections,
-            "Has Skills Section": 'skills' in found_sections,
-            "Ideal Length (500-1000 words)": 500 <= len(pdf_text.split()) <= 1000,
-            "No Complex Formatting": not ("table" in pdf_text.lower() or "image" in pdf_text.lower()),
-            "Contact Information Present": any(info in pdf_text.lower() for info in ['@', 'phone', 'email', 'linkedin', 'github'])
-        }
-        
-        # Calculate overall score (weighted average)
-        weights = {
-            "Keywords Match": 0.4,
-            "Has Experience Section": 0.15,
-            "Has Education Section": 0.1,
-            "Has Skills Section": 0.1,
-            "Ideal Length (500-1000 words)": 0.1,
-            "No Complex Formatting": 0.1,
-            "Contact Information Present": 0.05
-        }
-        
-        score = sum(checks[check] * weights[check] for check in checks if check in weights)
-        
-        return score, checks, job_keywords, found_sections
 
 def main():
     # Page configuration with theme
@@ -120,6 +74,10 @@ def main():
         initial_sidebar_state="expanded"
     )
 
+    # Optional per-stage timings, filled in once the page has rendered
+    show_metrics = st.sidebar.checkbox("Show performance metrics", value=os.getenv("ATS_DEBUG_PANEL") == "1")
+    metrics_panel = st.sidebar.empty()
+
     # Custom CSS for enhanced UI with animations
     st.markdown("""
     <style>
@@ -423,8 +381,9 @@ def main():
         )
 
         if uploaded_file:
-            if uploaded_file.size > 2 * 1024 * 1024:  # 2MB limit
+            if uploaded_file.size > MAX_PDF_BYTES:  # 2MB limit
                 st.error("❌ File size exceeds 2MB. Please upload a smaller file.")
+                uploaded_file = None
             else:
                 st.success("✅ Resume uploaded successfully!")
         
@@ -444,23 +403,70 @@ def main():
         
         st.markdown("</div>", unsafe_allow_html=True)
 
+    # The last analysis is reused across reruns (changing the analysis type, downloading
+    # the report) for as long as the resume and job description stay the same
+    inputs = (hashlib.sha256(uploaded_file.getvalue()).hexdigest(), job_description) if uploaded_file else None
+    saved = st.session_state.get("analysis")
+    result = saved["result"] if saved is not None and saved["inputs"] == inputs else None
+    if result is not None:
+        job_description = saved["job_description"]
+
+    # A scanned resume sent to the OCR queue; the job id is kept in the URL so a refresh does not lose it
+    queued_job = st.query_params.get("job")
+    if queued_job:
+        job = get_default_queue().get(queued_job)
+        if job is None:
+            del st.query_params["job"]
+        elif job["status"] in ("queued", "running"):
+            ensure_local_workers()
+            st.info(f"⏳ Running OCR on your scanned resume (attempt {max(1, job['attempts'])} of {job['max_attempts']})...")
+            st.progress(job["progress"])
+            time.sleep(1)
+            st.rerun()
+        elif job["status"] == "failed":
+            del st.query_params["job"]
+            st.error(f"OCR of the scanned resume failed: {job['error']}")
+        else:
+            del st.query_params["job"]
+            result = job["result"]
+            job_description = job["payload"]["job_description"]
+            analysis_type = job["payload"]["analysis_type"]
+            if not result["error"]:
+                st.session_state["analysis"] = {"inputs": inputs, "result": result,
+                                                "job_description": job_description}
+
     # Analysis button and results
-    if uploaded_file and job_description.strip():
+    if result is not None or (uploaded_file and job_description.strip()):
         st.markdown("""
         <div style="text-align: center; margin: 2rem 0;">
         """, unsafe_allow_html=True)
         
-        if st.button("✨ Analyze Resume Now", key="analyze_btn"):
+        if result is not None or st.button("✨ Analyze Resume Now", key="analyze_btn"):
             with st.spinner("Analyzing your resume... Please wait"):
-                # Extract PDF text with OCR fallback
-                pdf_text = ATSAnalyzer.extract_text_from_pdf(uploaded_file)
+                if result is None:
+                    # Text PDFs are scored right away, through the same core as the HTTP service;
+                    # PDFs without a text layer go to the background OCR queue
+                    pdf_bytes = uploaded_file.getvalue()
+                    result = score_resume(pdf_bytes, job_description)
+                    if result["needs_ocr"]:
+                        ensure_local_workers()
+                        st.query_params["job"] = get_default_queue().enqueue(
+                            "score", {"job_description": job_description, "analysis_type": analysis_type}, pdf_bytes)
+                        st.rerun()
+                    st.session_state["analysis"] = {"inputs": inputs, "result": result,
+                                                    "job_description": job_description}
                 
-                if not pdf_text:
+                if result["error"] and not result.get("needs_ocr", True):
+                    st.error(f"❌ The resume could not be read: {result['error']}")
+                    return
+                if result["error"]:
                     st.error("No text could be extracted from the resume. Please check the file or ensure it’s a text-based PDF. For scanned PDFs, OCR is attempted.")
                     return
 
-                # Perform ATS checks and get detailed analysis
-                ats_score, ats_checks, job_keywords, found_sections = ATSAnalyzer.perform_ats_checks(pdf_text, job_description)
+                pdf_text = result["text"]
+                ats_score, ats_checks, found_sections = result["score"], result["checks"], result["sections"]
+                job_keywords = get_profile(job_description).terms
+                timer = metrics.StageTimer()
                 
                 # Display ATS Score prominently
                 st.markdown("## 🎯 ATS Compatibility Score")
@@ -478,6 +484,7 @@ def main():
                     st.error("❌ Your resume needs significant improvements for ATS optimization.")
                 
                 st.markdown("---")
+                timer.lap("render_summary")
 
                 # Prepare Gemini prompt based on analysis type
                 if analysis_type == "Detailed Resume Review":
@@ -503,8 +510,7 @@ def main():
                     Start with the percentage match prominently displayed, followed by detailed analysis in bullet points.
                     """
 
-                # Perform ATS analysis
-                ats_score, ats_checks, job_keywords, found_sections = ATSAnalyzer.perform_ats_checks(pdf_text, job_description)
+                timer.lap("build_prompt")
                 
                 # Results Section
                 st.markdown("""
@@ -574,6 +580,7 @@ def main():
                         """, unsafe_allow_html=True)
                 
                 st.markdown("</div></div>", unsafe_allow_html=True)
+                timer.lap("render_results")
                 
                 # Keywords Analysis
                 st.markdown("""
@@ -584,8 +591,8 @@ def main():
                     </p>
                 """, unsafe_allow_html=True)
                 
-                keywords_found = [kw for kw in job_keywords if kw in pdf_text.lower()]
-                keywords_missing = [kw for kw in job_keywords if kw not in pdf_text.lower()]
+                keywords_found = result["keywords_found"]
+                keywords_missing = result["keywords_missing"]
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -603,7 +610,7 @@ def main():
                         </span>
                         """, unsafe_allow_html=True)
                     
-                    st.markdown("</div></div>", unsafe_help_html=True)
+                    st.markdown("</div></div>", unsafe_allow_html=True)
                 
                 with col2:
                     if keywords_missing:
@@ -611,7 +618,7 @@ def main():
                         <div style="background: #ffebee; padding: 1rem; border-radius: 8px; height: 100%;">
                             <h4 style="margin-top: 0; color: #c62828;">❌ Missing Keywords</h4>
                             <div style="display: flex; flex-wrap: wrap; gap: 0.5rem; margin-top: 0.5rem;">
-                        """, unsafe_help_html=True)
+                        """, unsafe_allow_html=True)
                         
                         for kw in keywords_missing[:15]:
                             st.markdown(f"""
@@ -619,11 +626,12 @@ def main():
                                         border-radius: 20px; font-size: 0.85em; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
                                 {kw}
                             </span>
-                            """, unsafe_help_html=True)
+                            """, unsafe_allow_html=True)
                         
-                        st.markdown("</div></div>", unsafe_help_html=True)
+                        st.markdown("</div></div>", unsafe_allow_html=True)
                 
-                st.markdown("</div>", unsafe_help_html=True)
+                st.markdown("</div>", unsafe_allow_html=True)
+                timer.lap("render_keywords")
                 
                 # Missing Sections
                 missing_sections = [s for s in ['experience', 'education', 'skills'] 
@@ -634,7 +642,7 @@ def main():
                         <h3 style="margin-top: 0; color: #e65100;">⚠️ Recommended Improvements</h3>
                         <p style="color: #666;">Consider adding these important sections to your resume:</p>
                         <div style="display: flex; gap: 0.5rem; flex-wrap: wrap; margin-top: 0.5rem;">
-                    """, unsafe_help_html=True)
+                    """, unsafe_allow_html=True)
                     
                     for section in missing_sections:
                         st.markdown(f"""
@@ -642,44 +650,65 @@ def main():
                                     border-radius: 6px; font-weight: 500; display: inline-flex; align-items: center;">
                             ✨ {section.capitalize()}
                         </span>
-                        """, unsafe_help_html=True)
+                        """, unsafe_allow_html=True)
                     
-                    st.markdown("</div></div>", unsafe_help_html=True)
+                    st.markdown("</div></div>", unsafe_allow_html=True)
+                timer.lap("render_sections")
+
+                # Other open roles this resume fits, scored in one pass over all of them
+                if ROLES_DIR:
+                    roles = load_roles(ROLES_DIR)
+                    if len(roles):
+                        st.markdown("## 🧭 Best-Fit Open Roles")
+                        st.dataframe([{
+                            "Role": match["role"],
+                            "Score": f"{match['score']:.1f}%",
+                            "Keywords Match": f"{match['keyword_score']:.0f}%",
+                            "Missing Keywords": ", ".join(match["keywords_missing"][:8]),
+                        } for match in roles.match(pdf_text, top_n=5)], hide_index=True, use_container_width=True)
+                    timer.lap("render_roles")
+                
+                # AI Review (streams in below the local results). A finished review is kept per
+                # (resume, job description, analysis type), so reruns show it without calling the model
+                llm_client = get_default_client()
+                review_key = (inputs[0] if inputs else None, jd_hash(job_description), analysis_type)
+                saved_review = st.session_state.get("ai_review")
+                if saved_review is not None and saved_review["key"] == review_key:
+                    st.markdown("## 🤖 AI Review")
+                    st.caption(saved_review["caption"])
+                    st.markdown(saved_review["text"])
+                elif llm_client is not None:
+                    st.markdown("## 🤖 AI Review")
+                    review_resume, review_jd, prompt_stats = compact_prompt(
+                        pdf_text, job_description, found_sections, job_keywords,
+                        keyword_weights=get_profile(job_description).weights, budget=PROMPT_BUDGET)
+                    caption = f"Prompt compacted from ~{prompt_stats['tokens_before']} to ~{prompt_stats['tokens_after']} tokens"
+                    st.caption(caption)
+                    try:
+                        review = st.write_stream(llm_client.stream_sync(prompt, review_resume, review_jd))
+                        if inputs is not None and review:
+                            st.session_state["ai_review"] = {"key": review_key, "caption": caption, "text": review}
+                    except Exception as e:
+                        st.warning(f"AI review is unavailable right now: {str(e)}")
+                else:
+                    st.info("Set GOOGLE_API_KEY to enable the AI review.")
+                timer.lap("ai_review")
                 
                 # Export Option
                 st.markdown("""
                 <div style="margin: 2rem 0; text-align: center;">
-                """, unsafe_help_html=True)
-                
-                # Prepare the analysis text for export
-                analysis_text = f"""
-                ⭐ Resume Analysis Report ⭐
-                
-                📊 Overall ATS Score: {ats_score:.1f}%
-                
-                🔍 Key Metrics:
-                """
-                for check, value in ats_checks.items():
-                    status = "✅" if (isinstance(value, bool) and value) else "❌"
-                    value_str = "Yes" if isinstance(value, bool) and value else "No" if isinstance(value, bool) else f"{value:.1f}%"
-                    analysis_text += f"\n{status} {check}: {value_str}"
-                
-                analysis_text += "\n\n🔑 Keywords Analysis:"
-                analysis_text += "\n\n✅ Found Keywords:\n" + "\n".join(f"- {kw}" for kw in keywords_found[:15])
-                if keywords_missing:
-                    analysis_text += "\n\n❌ Missing Keywords:\n" + "\n".join(f"- {kw}" for kw in keywords_missing[:15])
-                
-                if missing_sections:
-                    analysis_text += "\n\n⚠️ Recommended Sections to Add:\n" + "\n".join(f"- {s.capitalize()}" for s in missing_sections)
+                """, unsafe_allow_html=True)
                 
-                analysis_text += "\n\nGenerated by Resume Analyzer Pro"
+                # The report is rendered from the same record in whichever format is picked
+                report_format = st.radio("Report format", list(REPORT_FORMATS), horizontal=True)
+                render, extension, mime = REPORT_FORMATS[report_format]
                 
                 # Download Button with better styling
                 st.download_button(
                     label="💾 Download Full Analysis Report",
-                    data=analysis_text,
-                    file_name=f"resume_analysis_{pd.Timestamp.now().strftime('%Y%m%d_%H%M%S')}.txt",
-                    mime="text/plain",
+                    data=render(result),
+                    file_name=f"resume_analysis_{time.strftime('%Y%m%d_%H%M%S')}.{extension}",
+                    mime=mime,
                     help="Download a detailed report of your resume analysis"
                 )
                 
@@ -688,7 +717,8 @@ def main():
                     💡 Tip: Save this report to track your resume improvements over time!
                 </p>
                 </div>
-                """, unsafe_help_html=True)
+                """, unsafe_allow_html=True)
+                timer.lap("render_export")
 
     else:
         # Empty state with illustration
@@ -719,7 +749,7 @@ def main():
                 </div>
             </div>
         </div>
-        """, unsafe_help_html=True)
+        """, unsafe_allow_html=True)
 
     # Footer with disclaimer and additional links
     st.markdown("""
@@ -765,7 +795,14 @@ def main():
             </div>
         </div>
     </footer>
-    """, unsafe_help_html=True)
+    """, unsafe_allow_html=True)
+
+    if show_metrics:
+        with metrics_panel.container():
+            st.markdown("### ⏱️ Performance")
+            st.table(metrics.REGISTRY.stage_summary())
+            with st.expander("Prometheus"):
+                st.code(metrics.REGISTRY.to_prometheus(), language="text")
 
     
 if __name__ == "__main__":
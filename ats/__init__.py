@@ -0,0 +1,16 @@
+"""Headless core of the ATS Resume Analyzer.
+
+The Streamlit app in ``app.py`` is a thin UI over this package; everything
+here can also be driven from scripts or the ``python -m ats`` command line.
+"""
+
+from .analyzer import ATSAnalyzer, RESUME_SECTIONS
+from .batch import iter_scores, rank_corpus
+from .incremental import IncrementalAnalyzer
+from .parser import ParsedResume, parse_resume
+from .profile import JobProfile, get_profile
+
+__all__ = [
+    "ATSAnalyzer", "RESUME_SECTIONS", "IncrementalAnalyzer", "JobProfile", "ParsedResume",
+    "get_profile", "iter_scores", "parse_resume", "rank_corpus",
+]
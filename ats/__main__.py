@@ -0,0 +1,191 @@
+"""Command line entry point: ``python -m ats <command> ...``."""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+
+def _read_text(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+def cmd_batch(args):
+    from .batch import find_resumes, rank_corpus
+
+    job_description = _read_text(args.jd)
+    summary = rank_corpus(job_description, find_resumes(args.resumes), args.out,
+                          workers=args.workers, progress_every=args.progress_every,
+                          cache_path=args.cache, strategy=args.strategy, dedup_threshold=args.dedup)
+    print(json.dumps(summary), file=sys.stderr)
+    return 0
+
+
+def cmd_index(args):
+    from .analyzer import ATSAnalyzer
+    from .batch import find_resumes
+    from .cache import ExtractionCache
+    from .index import ResumeIndex
+    from .profile import get_profile
+
+    vectors = None
+    if args.semantic:
+        from .semantic import EmbeddingCache, VectorIndex
+
+        vectors = VectorIndex(os.path.join(args.index, "vectors"))
+        embeddings = EmbeddingCache(os.path.join(args.index, "vectors", "embeddings.sqlite3"))
+
+    with ResumeIndex(args.index) as index:
+        if args.action == 'add':
+            cache = ExtractionCache(args.cache) if args.cache else None
+            added = 0
+            for path in find_resumes(args.target):
+                if vectors is None:
+                    added += bool(index.add_pdf(path, cache=cache))
+                    continue
+                with open(path, 'rb') as f:
+                    text = ATSAnalyzer.extract_text_from_pdf(f, cache=cache)
+                if text:
+                    index.add(path, text)
+                    vectors.add_texts([(path, text)], cache=embeddings)
+                    added += 1
+            if vectors is not None:
+                vectors.save()
+            print(json.dumps({"added": added, "documents": len(index)}), file=sys.stderr)
+        elif args.action == 'delete':
+            deleted = index.delete(args.target)
+            if vectors is not None and vectors.delete(args.target):
+                deleted = deleted or 1
+            print(json.dumps({"deleted": deleted}), file=sys.stderr)
+        elif args.action == 'compact':
+            index.compact()
+        elif args.action == 'query' and vectors is not None:
+            for key, similarity in vectors.search([_read_text(args.target)], top_k=args.top, cache=embeddings)[0]:
+                print(json.dumps({"key": key, "similarity": round(similarity, 4)}))
+        elif args.action == 'query':
+            profile = get_profile(_read_text(args.target))
+            for result in index.query(profile.terms, profile.weights, top_k=args.top):
+                print(json.dumps(result))
+    return 0
+
+
+def cmd_jobs(args):
+    from .jobs import JobQueue, get_default_queue, run_worker_processes
+
+    queue = JobQueue(args.queue) if args.queue else get_default_queue()
+    if args.action == 'work':
+        run_worker_processes(queue.path, args.workers)
+    elif args.action == 'batch':
+        if not (args.jd and args.resumes and args.out):
+            raise SystemExit("jobs batch needs --jd, --resumes and --out")
+        payload = {"job_description": _read_text(args.jd), "resumes": os.path.abspath(args.resumes),
+                   "out": os.path.abspath(args.out), "strategy": args.strategy, "cache": args.cache,
+                   "dedup_threshold": args.dedup}
+        print(queue.enqueue("batch", payload))
+    elif args.action == 'status':
+        job = queue.get(args.target) if args.target else None
+        if args.target and job is None:
+            print(json.dumps({"error": "unknown job"}))
+            return 1
+        print(json.dumps(job if job else queue.counts()))
+    return 0
+
+
+def cmd_roles(args):
+    from .analyzer import ATSAnalyzer
+    from .cache import ExtractionCache
+    from .roles import RoleSet
+
+    roles = RoleSet.from_directory(args.jds)
+    with open(args.resume, 'rb') as f:
+        text = ATSAnalyzer.extract_text_from_pdf(f, cache=ExtractionCache(args.cache) if args.cache else None)
+    if not text:
+        print(json.dumps({"error": "no text could be extracted from the resume"}))
+        return 1
+    for result in roles.match(text, strategy=args.strategy, top_n=args.top):
+        print(json.dumps(result))
+    return 0
+
+
+def cmd_serve(args):
+    from .service import serve
+
+    serve(args.host, args.port, workers=args.workers, cache_path=args.cache)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m ats", description="ATS Resume Analyzer")
+    parser.add_argument('-v', '--verbose', action='store_true', help="log progress to stderr")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    batch = sub.add_parser('batch', help="rank a directory of resumes against one job description")
+    batch.add_argument('--jd', required=True, help="job description text file")
+    batch.add_argument('--resumes', required=True, help="directory of PDF resumes (or a single PDF)")
+    batch.add_argument('--out', required=True, help="output file: .jsonl, .csv, .parquet or .arrow")
+    batch.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    batch.add_argument('--progress-every', type=int, default=100, help="log throughput every N resumes")
+    batch.add_argument('--cache', default=None, help="SQLite extraction cache to reuse across runs")
+    batch.add_argument('--strategy', choices=["keywords", "bm25"], default="keywords",
+                       help="how Keywords Match is scored (bm25 uses corpus-wide IDF)")
+    batch.add_argument('--dedup', type=float, nargs='?', const=0.8, default=None, metavar='THRESHOLD',
+                       help="flag near-duplicate resumes (MinHash similarity, default 0.8) and reuse "
+                            "the record of exact copies")
+    batch.set_defaults(func=cmd_batch)
+
+    index = sub.add_parser('index', help="maintain and query a persistent resume index")
+    index.add_argument('action', choices=['add', 'delete', 'compact', 'query'])
+    index.add_argument('target', nargs='?', default='',
+                       help="add: PDF or directory; delete: document key; query: job description file")
+    index.add_argument('--index', required=True, help="index directory")
+    index.add_argument('--top', type=int, default=20, help="query: number of candidates to return")
+    index.add_argument('--cache', default=None, help="add: SQLite extraction cache")
+    index.add_argument('--semantic', action='store_true',
+                       help="add: also store resume embeddings; delete: also drop them; "
+                            "query: rank by embedding similarity")
+    index.set_defaults(func=cmd_index)
+
+    jobs = sub.add_parser('jobs', help="run workers for, submit to and inspect the background job queue")
+    jobs.add_argument('action', choices=['work', 'batch', 'status'])
+    jobs.add_argument('target', nargs='?', default='', help="status: job id (omit for queue counts)")
+    jobs.add_argument('--queue', default=None, help="queue file (default: jobs.sqlite3 under ATS_CACHE_DIR)")
+    jobs.add_argument('--workers', type=int, default=None, help="work: worker processes (default: CPU count)")
+    jobs.add_argument('--jd', help="batch: job description text file")
+    jobs.add_argument('--resumes', help="batch: directory of PDF resumes")
+    jobs.add_argument('--out', help="batch: output file: .jsonl, .csv, .parquet or .arrow")
+    jobs.add_argument('--strategy', choices=["keywords", "bm25"], default="keywords")
+    jobs.add_argument('--cache', default=None, help="batch: SQLite extraction cache")
+    jobs.add_argument('--dedup', type=float, nargs='?', const=0.8, default=None, metavar='THRESHOLD',
+                      help="batch: flag near-duplicate resumes")
+    jobs.set_defaults(func=cmd_jobs)
+
+    roles = sub.add_parser('roles', help="rank open roles for one resume")
+    roles.add_argument('resume', help="PDF resume")
+    roles.add_argument('--jds', required=True, help="directory of job description .txt files, one per role")
+    roles.add_argument('--top', type=int, default=10, help="number of roles to return")
+    roles.add_argument('--strategy', choices=["keywords", "tfidf", "bm25"], default="keywords",
+                       help="how Keywords Match is scored for each role")
+    roles.add_argument('--cache', default=None, help="SQLite extraction cache")
+    roles.set_defaults(func=cmd_roles)
+
+    serve = sub.add_parser('serve', help="run the HTTP scoring service")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8080)
+    serve.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    serve.add_argument('--cache', default=None, help="SQLite extraction cache shared by the workers")
+    serve.set_defaults(func=cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(asctime)s %(name)s %(message)s")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+import logging
+import time
+
+from . import metrics
+from .backends import candidate_backends, looks_usable, open_document
+from .cache import content_key
+from .extract import MAX_PAGES, MAX_PDF_BYTES, MAX_SECONDS, ExtractionLimitError, iter_pages, read_limited
+from .matcher import KeywordMatcher
+from .ocr import DEFAULT_DPI, DEFAULT_WORKERS, ocr_pdf
+from .parser import ParsedResume, parse_resume
+from . import text as textnorm
+from .text import RESUME_SECTIONS, STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+# Weight of each check in the overall score
+CHECK_WEIGHTS = {
+    "Keywords Match": 0.4,
+    "Has Experience Section": 0.15,
+    "Has Education Section": 0.1,
+    "Has Skills Section": 0.1,
+    "Ideal Length (500-1000 words)": 0.1,
+    "No Complex Formatting": 0.1,
+    "Contact Information Present": 0.05
+}
+
+# Bumped whenever extraction output changes, so cached text is not reused
+EXTRACTOR_VERSION = "3"
+
+
+class ATSAnalyzer:
+    @staticmethod
+    @metrics.timed("extract")
+    def extract_text_from_pdf(uploaded_file, ocr_dpi=DEFAULT_DPI, ocr_workers=DEFAULT_WORKERS,
+                              ocr_min_chars=None, cache=None, max_bytes=MAX_PDF_BYTES,
+                              max_pages=MAX_PAGES, max_seconds=MAX_SECONDS, max_words=None,
+                              backend=None, ocr=True, ocr_progress=None, raise_errors=False):
+        """Extract text from a PDF resume, with OCR fallback for image-based PDFs.
+
+        Files over ``max_bytes`` are rejected before parsing. Pages are read
+        one at a time and extraction stops at ``max_pages`` pages, after
+        ``max_seconds``, or once ``max_words`` words have been collected.
+        The OCR fallback gets whatever is left of ``max_seconds``. Each
+        page's latency is recorded as the ``pdf_page`` stage.
+        Installed PDF backends are tried fastest first until one returns
+        usable text (``backend`` or ATS_PDF_BACKEND pins one).
+        When ``cache`` (an ``ExtractionCache``) is given, text for a file that
+        was already extracted with the same settings is returned without
+        parsing the PDF again. With ``ocr=False`` a PDF without a text layer
+        returns None instead of being OCRed, while a file no backend can
+        open is an error; ``ocr_progress(done, total)`` is called after each
+        OCR page. Errors are logged and give None, unless ``raise_errors``
+        is set, in which case they are re-raised.
+        """
+        start = time.perf_counter()
+        try:
+            # Read the bytes once so the OCR fallback does not re-read a consumed stream
+            pdf_bytes = read_limited(uploaded_file, max_bytes)
+            if cache is not None:
+                key = content_key(pdf_bytes, extractor=EXTRACTOR_VERSION, backends=candidate_backends(backend),
+                                  ocr_dpi=ocr_dpi, ocr_min_chars=ocr_min_chars,
+                                  max_pages=max_pages, max_words=max_words)
+                cached = cache.get(key)
+                metrics.inc("ats_cache_total", result="miss" if cached is None else "hit")
+                if cached is not None:
+                    metrics.inc("ats_documents_total", outcome="cached")
+                    return cached
+
+            text = ""
+            page_count = 0
+            # Text cut short by the time limit depends on machine load, so it is not cached
+            timed_out = []
+            failures = []
+            backends = candidate_backends(backend)
+            for name in backends:
+                try:
+                    document = open_document(name, pdf_bytes)
+                    page_count = document.page_count
+                    pages = []
+                    with metrics.span("pdf_backend", backend=name):
+                        for page in iter_pages(document, max_pages, max_seconds, max_words,
+                                               on_timeout=lambda: timed_out.append(name)):
+                            # Per-page latency, so slow PDFs show up in the stage histogram
+                            metrics.observe("ats_stage_seconds", page.ms / 1000, stage="pdf_page", backend=name)
+                            pages.append(page.text)
+                    metrics.observe("ats_pdf_pages", len(pages), metrics.COUNT_BUCKETS, backend=name)
+                except Exception as e:
+                    logger.info("PDF backend %s failed: %s", name, e)
+                    failures.append(e)
+                    continue
+                candidate = "\n".join(pages)
+                if looks_usable(candidate):
+                    text = candidate
+                    break
+                # Keep garbled text as a last resort rather than nothing
+                text = text or candidate
+                logger.info("PDF backend %s returned no usable text; trying the next one", name)
+            
+            # If no text is extracted, try OCR on each page
+            if not text.strip() and not ocr:
+                if backends and len(failures) == len(backends):
+                    # No backend could open the file, so it is broken rather than scanned
+                    raise failures[-1]
+                metrics.inc("ats_documents_total", outcome="needs_ocr")
+                return None
+            if not text.strip():
+                logger.warning("No text detected. Attempting OCR on image-based PDF...")
+                # OCR gets whatever is left of the time limit
+                remaining = max(max_seconds - (time.perf_counter() - start), 0.0) if max_seconds else None
+                with metrics.span("ocr"):
+                    text, ocr_timings = ocr_pdf(pdf_bytes, min(page_count, max_pages) if max_pages else page_count,
+                                                dpi=ocr_dpi, workers=ocr_workers, min_chars=ocr_min_chars,
+                                                progress=ocr_progress, max_seconds=remaining,
+                                                on_timeout=lambda: timed_out.append("ocr"))
+                metrics.observe("ats_ocr_pages", len(ocr_timings), metrics.COUNT_BUCKETS)
+                outcome = "ocr"
+            else:
+                outcome = "text"
+            
+            text = text.strip()
+            if text and cache is not None and not timed_out:
+                cache.put(key, text)
+            metrics.inc("ats_documents_total", outcome=outcome if text else "empty")
+            return text if text else None
+        except ExtractionLimitError as e:
+            metrics.inc("ats_documents_total", outcome="rejected")
+            logger.error(f"Rejected PDF: {str(e)}")
+            if raise_errors:
+                raise
+            return None
+        except Exception as e:
+            metrics.inc("ats_documents_total", outcome="error")
+            logger.error(f"Error extracting PDF text: {str(e)}")
+            if raise_errors:
+                raise
+            return None
+
+    @staticmethod
+    def stop_words():
+        """Return the English stopword set."""
+        return STOPWORDS
+
+    @staticmethod
+    def rank_words(words, top_n=20):
+        """Count words and return the ``top_n`` most frequent as (word, count) pairs."""
+        return textnorm.rank_words(words, top_n)
+
+    @staticmethod
+    @metrics.timed("keywords")
+    def extract_keywords(text, top_n=20):
+        """Extract top keywords from text."""
+        return textnorm.extract_keywords(text, top_n)
+
+    @staticmethod
+    @metrics.timed("parse")
+    def parse_resume(pdf_text):
+        """Parse resume text once into a ``ParsedResume`` (passed through if already parsed)."""
+        return pdf_text if isinstance(pdf_text, ParsedResume) else parse_resume(pdf_text)
+
+    @staticmethod
+    def analyze_resume_sections(text):
+        """Analyze resume sections and return found sections."""
+        return ATSAnalyzer.parse_resume(text).section_names
+
+    @staticmethod
+    def match_keywords(pdf_text, job_keywords):
+        """Match JD keywords against the resume on word boundaries in a single pass."""
+        parsed = ATSAnalyzer.parse_resume(pdf_text)
+        return KeywordMatcher(job_keywords).match(tokens=parsed.tokens, offsets=parsed.offsets)
+
+    @staticmethod
+    def build_checks(keyword_score, found_sections, word_count, complex_formatting, contact_present):
+        """Build the ATS check table from already-computed resume measurements."""
+        # Basic ATS checks
+        return {
+            "Keywords Match": keyword_score,
+            "Has Experience Section": any(sec in ['experience', 'work experience'] for sec in found_sections),
+            "Has Education Section": 'education' in found_sections,
+            "Has Skills Section": 'skills' in found_sections,
+            "Ideal Length (500-1000 words)": 500 <= word_count <= 1000,
+            "No Complex Formatting": not complex_formatting,
+            "Contact Information Present": contact_present
+        }
+
+    @staticmethod
+    def overall_score(checks):
+        """Calculate overall score (weighted average)."""
+        return sum(checks[check] * CHECK_WEIGHTS[check] for check in checks if check in CHECK_WEIGHTS)
+
+    @staticmethod
+    @metrics.timed("ats_checks")
+    def perform_ats_checks(pdf_text, job_description, job_keywords=None, strategy="keywords",
+                           corpus=None, with_match=False):
+        """Perform comprehensive ATS compatibility checks.
+
+        ``pdf_text`` may be raw text or a ``ParsedResume``; either way the
+        resume is parsed once and every check reads from the parsed form.
+        Job description keywords come from the cached ``JobProfile`` for
+        ``job_description`` unless ``job_keywords`` is passed explicitly.
+        ``strategy`` selects how "Keywords Match" is computed: ``keywords``
+        (share of JD keywords present), ``tfidf``/``bm25`` relevance, using
+        IDF statistics from ``corpus`` (a ``ResumeCorpus``) if given, or
+        ``semantic`` (embedding similarity of JD requirements to resume lines).
+        With ``with_match`` the keyword ``MatchResult`` is returned as a fifth
+        item, so callers that list found/missing keywords need not match again.
+        """
+        # Extract keywords from job description (once per distinct JD)
+        keyword_weights = None
+        if job_keywords is None:
+            from .profile import get_profile
+            profile = get_profile(job_description)
+            job_keywords = list(profile.terms)
+            keyword_weights = profile.weights
+        
+        parsed = ATSAnalyzer.parse_resume(pdf_text)
+        match = None
+        if strategy == "keywords":
+            match = ATSAnalyzer.match_keywords(parsed, job_keywords)
+            keyword_score = match.ratio * 100
+        elif strategy == "semantic":
+            from .semantic import semantic_match
+            with metrics.span("semantic"):
+                keyword_score = semantic_match(parsed, job_description).score
+        else:
+            # NumPy/SciPy are only loaded when a corpus-style strategy is used
+            from .scoring import keyword_relevance
+            keyword_score = keyword_relevance(parsed.tokens, job_keywords, strategy,
+                                              weights=keyword_weights, corpus=corpus)
+
+        # Check for resume sections
+        found_sections = parsed.section_names
+        
+        checks = ATSAnalyzer.build_checks(
+            keyword_score if job_keywords else 0,
+            found_sections,
+            parsed.word_count,
+            parsed.complex_formatting,
+            parsed.contact_present,
+        )
+        score = ATSAnalyzer.overall_score(checks)
+        
+        if with_match:
+            if match is None:
+                match = ATSAnalyzer.match_keywords(parsed, job_keywords)
+            return score, checks, job_keywords, found_sections, match
+        return score, checks, job_keywords, found_sections
@@ -0,0 +1,115 @@
+"""Pluggable PDF text extraction backends.
+
+Each backend wraps one library behind the same interface:
+``open_document(name, pdf_bytes)`` returns a document with ``page_count``
+and ``page_text(index)``. Backends
+are tried in ``PREFERENCE`` order (fastest first) among those installed;
+``ATS_PDF_BACKEND`` pins one. ``extract_text_from_pdf`` falls through to the
+next backend when the extracted text comes back empty or garbled, so
+oddly encoded documents get a second opinion before OCR.
+"""
+
+import importlib.util
+import io
+import os
+
+# Fastest first (see benchmarks/bench_backends.py); only installed backends are used
+PREFERENCE = ["pymupdf", "pypdf2", "pypdf", "pdfminer"]
+
+# Below this share of "normal" characters a page is treated as garbled
+MIN_TEXT_QUALITY = 0.85
+
+
+class PyMuPDFDocument:
+    def __init__(self, pdf_bytes):
+        try:
+            import pymupdf
+        except ImportError:  # releases before 1.24 only ship the ``fitz`` name
+            import fitz as pymupdf
+
+        self._doc = pymupdf.open(stream=pdf_bytes, filetype="pdf")
+        self.page_count = self._doc.page_count
+
+    def page_text(self, index):
+        return self._doc[index].get_text()
+
+
+class PypdfDocument:
+    reader_module = "pypdf"
+
+    def __init__(self, pdf_bytes):
+        module = importlib.import_module(self.reader_module)
+        self._reader = module.PdfReader(io.BytesIO(pdf_bytes))
+        self.page_count = len(self._reader.pages)
+
+    def page_text(self, index):
+        return self._reader.pages[index].extract_text() or ""
+
+
+class PyPDF2Document(PypdfDocument):
+    reader_module = "PyPDF2"
+
+
+class PdfminerDocument:
+    def __init__(self, pdf_bytes):
+        from pdfminer.high_level import extract_pages
+        from pdfminer.pdfpage import PDFPage
+
+        self.page_count = sum(1 for _ in PDFPage.get_pages(io.BytesIO(pdf_bytes)))
+        self._pages = enumerate(extract_pages(io.BytesIO(pdf_bytes)))
+
+    def page_text(self, index):
+        """Return page text; pdfminer lays pages out as a stream, so read them in order."""
+        from pdfminer.layout import LTTextContainer
+
+        for number, layout in self._pages:
+            if number == index:
+                return "".join(e.get_text() for e in layout if isinstance(e, LTTextContainer))
+        return ""
+
+
+BACKENDS = {
+    "pymupdf": ("fitz", PyMuPDFDocument),
+    "pypdf": ("pypdf", PypdfDocument),
+    "pypdf2": ("PyPDF2", PyPDF2Document),
+    "pdfminer": ("pdfminer", PdfminerDocument),
+}
+
+
+def available_backends():
+    """Names of installed backends, in preference order."""
+    return [name for name in PREFERENCE if importlib.util.find_spec(BACKENDS[name][0]) is not None]
+
+
+def candidate_backends(preferred=None):
+    """Backends to try for a document: the pinned one, or all installed in order."""
+    preferred = preferred or os.getenv("ATS_PDF_BACKEND")
+    if preferred:
+        if preferred not in BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {preferred}")
+        return [preferred]
+    return available_backends()
+
+
+def open_document(name, pdf_bytes):
+    return BACKENDS[name][1](pdf_bytes)
+
+
+def text_quality(text):
+    """Share of characters that are letters, digits, whitespace or common punctuation."""
+    if not text:
+        return 0.0
+    normal = sum(1 for c in text if c.isalnum() or c.isspace() or c in ".,;:!?()-/&@+#%'\"")
+    return normal / len(text)
+
+
+def looks_usable(text):
+    """Whether extracted text is real text rather than empty output or encoding junk."""
+    stripped = text.strip()
+    if not stripped:
+        return False
+    words = stripped.split()
+    # Missing spaces ("JohnDoeSoftwareEngineer...") show up as very long "words"
+    if sum(len(w) for w in words) / len(words) > 20:
+        return False
+    return text_quality(stripped) >= MIN_TEXT_QUALITY
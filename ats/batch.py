@@ -0,0 +1,280 @@
+"""Batch scoring: rank a corpus of resumes against a single job description."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from multiprocessing import Pool
+
+from .analyzer import CHECK_WEIGHTS, ATSAnalyzer
+from .cache import ExtractionCache
+from .extract import MAX_PDF_BYTES
+from .profile import get_profile
+from .report import open_writer
+
+logger = logging.getLogger(__name__)
+
+# Strategies usable for batch ranking (TF-IDF needs a full term matrix)
+BATCH_STRATEGIES = ("keywords", "bm25")
+HASH_CHUNK = 1024 * 1024
+
+# Per-process job description state, set once by _init_worker
+_job_description = None
+_job_keywords = None
+_cache = None
+_signature = False
+
+
+def _init_worker(job_description, job_keywords, cache_path=None, signature=False):
+    global _job_description, _job_keywords, _cache, _signature
+    _job_description = job_description
+    _job_keywords = job_keywords
+    _cache = ExtractionCache(cache_path) if cache_path else None
+    _signature = signature
+
+
+def score_pdf(pdf_file, job_description, job_keywords=None, cache=None, keep_text=False,
+              signature=False, **extract_options):
+    """Extract and score one PDF (a binary stream), returning a JSON-ready record.
+
+    This is the single scoring path shared by batch runs, the HTTP service
+    and the Streamlit app. Besides the checks, the record carries
+    ``term_counts`` (occurrences of each JD keyword) and ``doc_length`` so
+    corpus-level BM25 can be applied once the whole batch has been seen.
+    With ``keep_text`` the extracted text is included as ``text``, and with
+    ``signature`` its MinHash signature (see ``ats.dedup``) as ``minhash``.
+    Other keyword arguments (``ocr``, ``ocr_progress``, ...) are passed on
+    to ``extract_text_from_pdf``.
+    """
+    record = {"score": 0.0, "checks": {}, "keywords_found": [],
+              "keywords_missing": [], "sections": [], "error": None}
+    pdf_text = ATSAnalyzer.extract_text_from_pdf(pdf_file, cache=cache, **extract_options)
+    if not pdf_text:
+        record["error"] = "no text extracted"
+        return record
+
+    if job_keywords is None:
+        job_keywords = list(get_profile(job_description).terms)
+    parsed = ATSAnalyzer.parse_resume(pdf_text)
+    score, checks, _, found_sections, keyword_match = ATSAnalyzer.perform_ats_checks(
+        parsed, job_description, job_keywords=job_keywords, with_match=True)
+    record.update(
+        score=round(score, 2),
+        checks=checks,
+        keywords_found=keyword_match.found,
+        keywords_missing=keyword_match.missing,
+        sections=found_sections,
+        term_counts=[keyword_match.counts.get(kw, 0) for kw in job_keywords],
+        doc_length=len(parsed.tokens),
+    )
+    if keep_text:
+        record["text"] = pdf_text
+    if signature:
+        from .dedup import minhash
+        signature = minhash(parsed.tokens)
+        record["minhash"] = signature.tolist() if signature is not None else None
+    return record
+
+
+def score_file(path, job_description, job_keywords, cache=None, signature=False):
+    """Extract and score a single resume file (see ``score_pdf``)."""
+    with open(path, 'rb') as f:
+        record = score_pdf(f, job_description, job_keywords, cache=cache, signature=signature)
+    return {"path": path, **record}
+
+
+def _score_in_worker(path):
+    try:
+        return score_file(path, _job_description, _job_keywords, cache=_cache, signature=_signature)
+    except Exception as e:
+        return {"path": path, "score": 0.0, "checks": {}, "keywords_found": [],
+                "keywords_missing": [], "sections": [], "error": str(e)}
+
+
+def find_files(root, suffix):
+    """Yield paths of ``suffix`` files under ``root`` (a directory or a single file) lazily."""
+    if os.path.isfile(root):
+        yield root
+        return
+    for dirpath, _, filenames in os.walk(root):
+        for name in sorted(filenames):
+            if name.lower().endswith(suffix):
+                yield os.path.join(dirpath, name)
+
+
+def find_resumes(root):
+    """Yield PDF resume paths under ``root`` (a directory or a single file) lazily."""
+    return find_files(root, '.pdf')
+
+
+def iter_scores(job_description, paths, workers=None, chunksize=4, cache_path=None, signature=False):
+    """Score resumes in a process pool and yield records as they complete.
+
+    The job description is tokenized once here and shipped to each worker at
+    start-up. With ``cache_path`` each worker shares an on-disk extraction
+    cache, and with ``signature`` each record carries a MinHash signature.
+    Results are yielded in completion order, not ranked.
+    """
+    job_keywords = list(get_profile(job_description).terms)
+    with Pool(processes=workers, initializer=_init_worker,
+              initargs=(job_description, job_keywords, cache_path, signature)) as pool:
+        for record in pool.imap_unordered(_score_in_worker, paths, chunksize=chunksize):
+            yield record
+
+
+def _unique_files(paths, copies):
+    """Yield paths whose bytes have not been seen yet; append (path, first path) to ``copies`` for the rest.
+
+    Files over ``MAX_PDF_BYTES`` are passed on unhashed, for the worker to reject.
+    """
+    seen = {}
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > MAX_PDF_BYTES:
+                    yield path
+                    continue
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                    digest.update(chunk)
+                digest = digest.digest()
+        except OSError:
+            # Let the worker report it
+            yield path
+            continue
+        if digest in seen:
+            copies.append((path, seen[digest]))
+        else:
+            seen[digest] = path
+            yield path
+
+
+def rank_corpus(job_description, paths, out_path, workers=None, progress_every=100,
+                cache_path=None, strategy="keywords", progress=None, dedup_threshold=None):
+    """Score ``paths`` and write a ranked report (JSONL, CSV, Parquet or Arrow) to ``out_path``.
+
+    Records are spooled to a temporary JSONL file as they arrive, so memory
+    only holds a few numbers per resume; the spool is then re-read in rank
+    order. With ``strategy="bm25"`` the "Keywords Match" check is replaced
+    by BM25 relevance computed over the whole batch in one vectorized pass
+    before ranking. ``progress(count)`` is called as each resume is scored.
+
+    With ``dedup_threshold`` (e.g. 0.8), byte-identical copies are not
+    extracted or scored again but reuse the record of their first copy, and
+    every other resume is checked against the ones already seen through a
+    MinHash/LSH ``DuplicateIndex``. Duplicates get ``duplicate_of`` (the
+    first resume of their cluster) and ``similarity`` in the report; a
+    near-duplicate keeps the score of its own text. Signatures are indexed
+    in path order once scoring is done, so clusters do not depend on which
+    worker finished first.
+
+    Returns a summary dict with counts and throughput.
+    """
+    if strategy not in BATCH_STRATEGIES:
+        raise ValueError(f"Batch ranking supports {', '.join(BATCH_STRATEGIES)}, not {strategy}")
+    out_dir = os.path.dirname(os.path.abspath(out_path))
+    rows = []
+    term_counts = []
+    doc_lengths = []
+    start = time.perf_counter()
+    errors = 0
+    duplicates = None
+    copies = []
+    if dedup_threshold is not None:
+        from .dedup import DuplicateIndex
+        duplicates = DuplicateIndex(dedup_threshold)
+        paths = _unique_files(paths, copies)
+    positions = {}
+    with tempfile.TemporaryFile('w+b', dir=out_dir) as spool:
+        def store(record):
+            nonlocal errors
+            spool.seek(0, os.SEEK_END)
+            offset = spool.tell()
+            spool.write(json.dumps(record).encode('utf-8') + b"\n")
+            positions[record["path"]] = len(rows)
+            rows.append((offset, record["score"], record["checks"].get("Keywords Match", 0.0)))
+            term_counts.append(record.get("term_counts") or [])
+            doc_lengths.append(record.get("doc_length", 0))
+            if record["error"]:
+                errors += 1
+            if progress is not None:
+                progress(len(rows))
+            if progress_every and len(rows) % progress_every == 0:
+                elapsed = time.perf_counter() - start
+                logger.info("scored %d resumes (%.1f resumes/sec)", len(rows), len(rows) / elapsed)
+
+        for record in iter_scores(job_description, paths, workers=workers, cache_path=cache_path,
+                                  signature=duplicates is not None):
+            store(record)
+
+        # Byte-identical copies were never sent to a worker; they reuse the first copy's record
+        copy_rows = {}
+        for path, original in copies:
+            spool.seek(rows[positions[original]][0])
+            record = json.loads(spool.readline())
+            record["path"] = path
+            copy_rows[len(rows)] = original
+            store(record)
+
+        # Row index -> (first resume of its cluster, similarity); exact copies carry their original's signature
+        duplicate_rows = {}
+        if duplicates is not None:
+            for path in sorted(positions):
+                i = positions[path]
+                spool.seek(rows[i][0])
+                signature = json.loads(spool.readline()).get("minhash")
+                if signature is not None:
+                    match = duplicates.add(path, signature)
+                    if match is not None:
+                        duplicate_rows[i] = (match[0], round(match[1], 3))
+                elif i in copy_rows:
+                    duplicates.add_copy(path, copy_rows[i])
+                    duplicate_rows[i] = (copy_rows[i], 1.0)
+        elapsed = time.perf_counter() - start
+
+        keyword_scores = None
+        if strategy == "bm25" and rows:
+            from .scoring import bm25_from_counts
+
+            profile = get_profile(job_description)
+            width = len(profile.terms)
+            tf = [counts or [0] * width for counts in term_counts]
+            keyword_scores = bm25_from_counts(tf, doc_lengths, [profile.weights[t] for t in profile.terms])
+        del term_counts, doc_lengths
+
+        index = []
+        for i, (offset, score, keyword_score) in enumerate(rows):
+            if keyword_scores is not None:
+                score += CHECK_WEIGHTS["Keywords Match"] * (keyword_scores[i] - keyword_score)
+            index.append((-score, offset, i))
+        index.sort()
+
+        with open_writer(out_path) as writer:
+            for rank, (neg_score, offset, i) in enumerate(index, start=1):
+                spool.seek(offset)
+                record = json.loads(spool.readline())
+                record.pop("term_counts", None)
+                record.pop("doc_length", None)
+                record.pop("minhash", None)
+                if i in duplicate_rows:
+                    record["duplicate_of"], record["similarity"] = duplicate_rows[i]
+                record["score"] = round(-neg_score, 2)
+                if keyword_scores is not None and not record["error"]:
+                    record["checks"]["Keywords Match"] = round(float(keyword_scores[i]), 2)
+                writer.write(record, rank)
+
+    summary = {
+        "resumes": len(rows),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "resumes_per_sec": round(len(rows) / elapsed, 2) if elapsed else 0.0,
+        "strategy": strategy,
+        "out": out_path,
+    }
+    if duplicates is not None:
+        clusters = duplicates.clusters()
+        summary["duplicates"] = sum(len(keys) for keys in clusters.values())
+        summary["duplicate_clusters"] = len(clusters)
+    return summary
@@ -0,0 +1,116 @@
+"""Content-addressed cache for extracted resume text.
+
+Entries are keyed by the SHA-256 of the PDF bytes plus the extraction
+settings, held in a small in-memory LRU in front of a SQLite file of
+zlib-compressed text. The on-disk store is trimmed to ``max_bytes`` by
+evicting the least recently used entries.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+# Default on-disk location, overridable with ATS_CACHE_DIR
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ats")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MEMORY_ITEMS = 256
+
+_default_cache = None
+
+
+def content_key(data, **settings):
+    """Return the cache key for ``data`` (bytes) extracted with ``settings``."""
+    digest = hashlib.sha256(data)
+    for name in sorted(settings):
+        digest.update(f"\0{name}={settings[name]!r}".encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES, memory_items=DEFAULT_MEMORY_ITEMS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS extraction ("
+            " key TEXT PRIMARY KEY, body BLOB NOT NULL,"
+            " size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    def _remember(self, key, text):
+        self._memory[key] = text
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key):
+        """Return the cached text for ``key``, or None on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return self._memory[key]
+            row = self._db.execute("SELECT body FROM extraction WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self._db.execute("UPDATE extraction SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            text = zlib.decompress(row[0]).decode('utf-8')
+            self.stats["disk_hits"] += 1
+            self._remember(key, text)
+            return text
+
+    def put(self, key, text):
+        """Store ``text`` under ``key`` and evict old entries past the size budget."""
+        body = zlib.compress(text.encode('utf-8'))
+        with self._lock:
+            self._remember(key, text)
+            self._db.execute(
+                "INSERT OR REPLACE INTO extraction (key, body, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, body, len(body), time.time()),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM extraction").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute("SELECT key, size FROM extraction ORDER BY accessed").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM extraction WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            total -= size
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._db.execute("DELETE FROM extraction")
+            self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+
+def get_default_cache():
+    """Return the process-wide cache under ATS_CACHE_DIR (created on first use)."""
+    global _default_cache
+    if _default_cache is None:
+        cache_dir = os.getenv("ATS_CACHE_DIR", DEFAULT_CACHE_DIR)
+        _default_cache = ExtractionCache(os.path.join(cache_dir, "extraction.sqlite3"))
+    return _default_cache
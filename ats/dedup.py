@@ -0,0 +1,112 @@
+"""Near-duplicate resume detection with MinHash signatures and LSH banding.
+
+A resume is reduced to its set of word shingles (``SHINGLE_WORDS``
+consecutive tokens). Its MinHash signature holds ``NUM_PERM`` values, and
+the share of positions where two signatures agree estimates the Jaccard
+similarity of the two shingle sets. ``DuplicateIndex`` cuts each signature
+into ``BANDS`` bands and buckets documents by band. A new resume is then only
+compared with documents that share a bucket with it, not with every document
+seen so far. With 16 bands of 8 rows, pairs above about 0.7 similarity almost
+always share a bucket, and candidates are confirmed against ``threshold``.
+
+Signatures use fixed hash parameters, so they can be computed in worker
+processes and compared in the parent, or stored and compared across runs.
+"""
+
+import zlib
+
+import numpy as np
+
+from .matcher import tokenize
+
+NUM_PERM = 128
+BANDS = 16
+SHINGLE_WORDS = 5
+DEFAULT_THRESHOLD = 0.8
+
+# Universal hashing (a * x + b) mod p over 32-bit shingle hashes; a * x stays below 2**63
+_PRIME = (1 << 31) - 1
+_params = np.random.default_rng(0x5EED).integers(1, _PRIME, size=(2, NUM_PERM), dtype=np.uint64)
+_A = _params[0][:, None]
+_B = _params[1][:, None]
+
+
+def shingles(text, size=SHINGLE_WORDS):
+    """Set of ``size``-word shingles of a text (or token list)."""
+    tokens = text if isinstance(text, list) else tokenize(text)[0]
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash(text, size=SHINGLE_WORDS):
+    """MinHash signature of a text (or token list): ``NUM_PERM`` uint32 values.
+
+    Returns None for an empty text, which has nothing to compare.
+    """
+    words = shingles(text, size)
+    if not words:
+        return None
+    hashes = np.fromiter((zlib.crc32(word.encode('utf-8')) for word in words), dtype=np.uint64, count=len(words))
+    return ((_A * hashes + _B) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+def similarity(a, b):
+    """Estimated Jaccard similarity of the documents behind two signatures."""
+    return float(np.count_nonzero(np.asarray(a) == np.asarray(b))) / NUM_PERM
+
+
+class DuplicateIndex:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, bands=BANDS):
+        if NUM_PERM % bands:
+            raise ValueError(f"bands must divide {NUM_PERM}")
+        self.threshold = threshold
+        self.rows = NUM_PERM // bands
+        self.buckets = [{} for _ in range(bands)]
+        # Only the first document of each cluster is indexed
+        self.signatures = {}
+        self.duplicate_of = {}
+
+    def __len__(self):
+        return len(self.signatures)
+
+    def _bands(self, signature):
+        rows = self.rows
+        for band, bucket in enumerate(self.buckets):
+            yield bucket, signature[band * rows:(band + 1) * rows].tobytes()
+
+    def query(self, signature):
+        """Return (key, similarity) of the closest indexed document at or above the threshold, or None."""
+        signature = np.asarray(signature, dtype=np.uint32)
+        candidates = set()
+        for bucket, band in self._bands(signature):
+            candidates.update(bucket.get(band, ()))
+        best = None
+        for key in candidates:
+            score = similarity(self.signatures[key], signature)
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+    def add(self, key, signature):
+        """Index a document, or return (original key, similarity) if it near-duplicates one already seen."""
+        signature = np.asarray(signature, dtype=np.uint32)
+        match = self.query(signature)
+        if match is not None:
+            self.duplicate_of[key] = match[0]
+            return match
+        self.signatures[key] = signature
+        for bucket, band in self._bands(signature):
+            bucket.setdefault(band, []).append(key)
+        return None
+
+    def add_copy(self, key, original):
+        """Record ``key`` as an exact copy of ``original`` without comparing signatures."""
+        self.duplicate_of[key] = original
+
+    def clusters(self):
+        """{original key: [duplicate keys]} for every document that has duplicates."""
+        clusters = {}
+        for key, original in self.duplicate_of.items():
+            clusters.setdefault(original, []).append(key)
+        return clusters
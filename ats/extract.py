@@ -0,0 +1,63 @@
+"""Page-by-page PDF text extraction with size, page, time and word limits."""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Matches the 2 MB limit advertised in the UI
+MAX_PDF_BYTES = 2 * 1024 * 1024
+MAX_PAGES = 10
+MAX_SECONDS = 20.0
+# Pages slower than this are logged so problem PDFs can be found
+SLOW_PAGE_MS = 500.0
+
+
+class ExtractionLimitError(ValueError):
+    """Raised when an upload is rejected before any parsing is done."""
+
+
+class PageText:
+    __slots__ = ("number", "text", "ms")
+
+    def __init__(self, number, text, ms):
+        self.number = number
+        self.text = text
+        self.ms = ms
+
+
+def read_limited(stream, max_bytes=MAX_PDF_BYTES):
+    """Read at most ``max_bytes`` from ``stream``, raising if there is more."""
+    data = stream.read(max_bytes + 1)
+    if len(data) > max_bytes:
+        raise ExtractionLimitError(f"PDF is larger than {max_bytes // 1024} KB")
+    return data
+
+
+def iter_pages(document, max_pages=MAX_PAGES, max_seconds=MAX_SECONDS, max_words=None, on_timeout=None):
+    """Yield ``PageText`` for each page of a backend document until a limit is reached.
+
+    Stops after ``max_pages`` pages, once ``max_seconds`` have elapsed
+    (checked between pages), or once ``max_words`` words have been yielded.
+    ``on_timeout()`` is called if the time limit cut the document short.
+    """
+    start = time.perf_counter()
+    words = 0
+    total = document.page_count
+    for number in range(min(total, max_pages) if max_pages else total):
+        if max_seconds and time.perf_counter() - start > max_seconds:
+            logger.warning("Extraction stopped after %.1fs at page %d of %d", max_seconds, number, total)
+            if on_timeout is not None:
+                on_timeout()
+            return
+        page_start = time.perf_counter()
+        text = document.page_text(number) or ""
+        ms = (time.perf_counter() - page_start) * 1000
+        if ms > SLOW_PAGE_MS:
+            logger.warning("Slow PDF page %d: %.0f ms", number + 1, ms)
+        yield PageText(number + 1, text, ms)
+        words += len(text.split())
+        if max_words and words >= max_words:
+            return
+    if max_pages and total > max_pages:
+        logger.warning("Only the first %d of %d pages were extracted", max_pages, total)
@@ -0,0 +1,149 @@
+"""Incremental re-scoring of edited resumes and job descriptions.
+
+A resume is split into blocks at blank lines. Every measurement the ATS
+checks need (token counts, word count, section heading lines, formatting
+and contact markers) is line-local, and skill aliases never run across a
+blank line, so it can be parsed per block and summed.
+``IncrementalAnalyzer`` keeps the block breakdown of the previous version
+of each document; when a new version arrives only blocks whose content
+changed are measured, and their contribution is swapped in and out of the
+running totals. A JD change only re-reads the totals for the new keywords.
+"""
+
+import hashlib
+from collections import Counter, OrderedDict
+
+from .analyzer import ATSAnalyzer
+from .matcher import BLOCK_SEPARATOR
+from .parser import parse_resume
+from .taxonomy import get_taxonomy
+from .text import RESUME_SECTIONS
+
+MAX_DOCUMENTS = 1024
+
+
+class BlockStats:
+    __slots__ = ("tokens", "words", "sections", "formatting", "contact")
+
+    def __init__(self, block):
+        parsed = parse_resume(block)
+        self.tokens = Counter(parsed.tokens)
+        self.words = parsed.word_count
+        self.sections = Counter(parsed.section_names)
+        self.formatting = parsed.complex_formatting
+        self.contact = parsed.contact_present
+
+
+class DocumentState:
+    __slots__ = ("blocks", "block_stats", "tokens", "words", "sections", "formatting", "contact", "result")
+
+    def __init__(self):
+        # Multiset of block digests in the current version, and their measurements
+        self.blocks = Counter()
+        self.block_stats = {}
+        self.tokens = Counter()
+        self.words = 0
+        self.sections = Counter()
+        self.formatting = 0
+        self.contact = 0
+        self.result = None
+
+    def apply(self, stats, sign):
+        if sign > 0:
+            self.tokens.update(stats.tokens)
+            self.sections.update(stats.sections)
+        else:
+            self.tokens.subtract(stats.tokens)
+            self.sections.subtract(stats.sections)
+        self.words += sign * stats.words
+        self.formatting += sign * stats.formatting
+        self.contact += sign * stats.contact
+
+
+class IncrementalAnalyzer:
+    def __init__(self, max_documents=MAX_DOCUMENTS):
+        self.max_documents = max_documents
+        self._documents = OrderedDict()
+        self.stats = {"blocks_measured": 0, "blocks_reused": 0}
+
+    def forget(self, doc_id):
+        self._documents.pop(doc_id, None)
+
+    def analyze(self, doc_id, pdf_text, job_description, job_keywords=None):
+        """Score ``pdf_text`` as the latest version of ``doc_id``.
+
+        Returns ``(score, checks, job_keywords, found_sections, delta)``
+        where the first four match ``perform_ats_checks`` (keywords
+        strategy) and ``delta`` describes what changed since the previous
+        call for the same document.
+        """
+        if job_keywords is None:
+            from .profile import get_profile
+            job_keywords = list(get_profile(job_description).terms)
+
+        state = self._documents.pop(doc_id, None) or DocumentState()
+        self._documents[doc_id] = state
+        while len(self._documents) > self.max_documents:
+            self._documents.popitem(last=False)
+
+        # Blocks are keyed by taxonomy version too, so a taxonomy reload re-measures every block
+        salt = str(get_taxonomy().version).encode('utf-8')[:64]
+        blocks = {}
+        new_counts = Counter()
+        for block in BLOCK_SEPARATOR.split(pdf_text):
+            digest = hashlib.blake2b(block.encode('utf-8'), digest_size=16, key=salt).digest()
+            blocks[digest] = block
+            new_counts[digest] += 1
+        removed = state.blocks - new_counts
+        added = new_counts - state.blocks
+        for digest, times in removed.items():
+            stats = state.block_stats[digest]
+            for _ in range(times):
+                state.apply(stats, -1)
+            if digest not in new_counts:
+                del state.block_stats[digest]
+        for digest, times in added.items():
+            stats = state.block_stats.get(digest)
+            if stats is None:
+                stats = state.block_stats[digest] = BlockStats(blocks[digest])
+                self.stats["blocks_measured"] += 1
+            for _ in range(times):
+                state.apply(stats, +1)
+        self.stats["blocks_reused"] += sum(new_counts.values()) - sum(added.values())
+        state.blocks = new_counts
+
+        tokens = state.tokens
+        found = sum(1 for kw in job_keywords if tokens.get(kw, 0) > 0)
+        found_sections = [s for s in RESUME_SECTIONS if state.sections.get(s, 0) > 0]
+        checks = ATSAnalyzer.build_checks(
+            found / len(job_keywords) * 100 if job_keywords else 0,
+            found_sections,
+            state.words,
+            state.formatting > 0,
+            state.contact > 0,
+        )
+        score = ATSAnalyzer.overall_score(checks)
+        keywords_found = [kw for kw in job_keywords if tokens.get(kw, 0) > 0]
+
+        delta = _delta(state.result, score, checks, keywords_found, found_sections,
+                       sum(removed.values()), sum(added.values()))
+        state.result = (score, checks, keywords_found, found_sections)
+        return score, checks, job_keywords, found_sections, delta
+
+
+def _delta(previous, score, checks, keywords_found, found_sections, removed, added):
+    if previous is None:
+        return {"first_version": True, "blocks_added": added, "blocks_removed": removed}
+    old_score, old_checks, old_keywords, old_sections = previous
+    return {
+        "first_version": False,
+        "score": score - old_score,
+        "checks": {name: (old_checks.get(name), value) for name, value in checks.items()
+                   if old_checks.get(name) != value},
+        "keywords_gained": [kw for kw in keywords_found if kw not in old_keywords],
+        "keywords_lost": [kw for kw in old_keywords if kw not in keywords_found],
+        "sections_gained": [s for s in found_sections if s not in old_sections],
+        "sections_lost": [s for s in old_sections if s not in found_sections],
+        "blocks_added": added,
+        "blocks_removed": removed,
+    }
@@ -0,0 +1,244 @@
+"""Persistent inverted index of parsed resumes for fast job description queries.
+
+Layout of an index directory:
+
+* ``index.sqlite3`` - documents (key, length, sections, deleted flag) and
+  the term dictionary: for every segment and term, the offset and length
+  of its posting list.
+* ``seg-<n>.docs.npy`` / ``seg-<n>.freqs.npy`` - posting lists of a
+  segment, concatenated, opened with ``mmap_mode='r'`` so only the slices
+  for the queried terms are paged in.
+
+Added resumes are buffered in memory and written as a new immutable
+segment on ``flush``. Deletes are tombstones filtered at query time;
+``compact`` rewrites all segments into one and drops deleted postings.
+"""
+
+import json
+import os
+import sqlite3
+import time
+from collections import Counter
+
+import numpy as np
+
+from .analyzer import ATSAnalyzer
+from .matcher import tokenize
+from .scoring import BM25_B, BM25_K1, bm25_idf
+
+DEFAULT_FLUSH_DOCS = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    sections TEXT NOT NULL,
+    added REAL NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS docs_key ON docs (key) WHERE deleted = 0;
+CREATE TABLE IF NOT EXISTS segments (id INTEGER PRIMARY KEY, docs INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS postings (
+    segment INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (term, segment)
+) WITHOUT ROWID;
+"""
+
+
+class ResumeIndex:
+    def __init__(self, path, flush_docs=DEFAULT_FLUSH_DOCS):
+        self.path = path
+        self.flush_docs = flush_docs
+        os.makedirs(path, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(path, "index.sqlite3"))
+        self._db.executescript(SCHEMA)
+        self._buffer = {}
+        self._buffered_docs = 0
+        self._segments = {}
+        self._lengths = None
+
+    # -- writing -----------------------------------------------------------
+
+    def add(self, key, text, sections=None):
+        """Index extracted resume ``text`` under ``key``, replacing any previous version."""
+        self.delete(key)
+        tokens, _ = tokenize(text)
+        if sections is None:
+            sections = ATSAnalyzer.analyze_resume_sections(text)
+        cursor = self._db.execute(
+            "INSERT INTO docs (key, length, sections, added) VALUES (?, ?, ?, ?)",
+            (key, len(tokens), json.dumps(sections), time.time()))
+        doc_id = cursor.lastrowid
+        for term, freq in Counter(tokens).items():
+            self._buffer.setdefault(term, []).append((doc_id, freq))
+        self._buffered_docs += 1
+        self._lengths = None
+        if self._buffered_docs >= self.flush_docs:
+            self.flush()
+        return doc_id
+
+    def add_pdf(self, path, key=None, cache=None):
+        """Extract a PDF with ``extract_text_from_pdf`` and index it; returns the doc id or None."""
+        with open(path, 'rb') as f:
+            text = ATSAnalyzer.extract_text_from_pdf(f, cache=cache)
+        if not text:
+            return None
+        return self.add(key or path, text)
+
+    def delete(self, key):
+        """Tombstone every live document stored under ``key``."""
+        changed = self._db.execute("UPDATE docs SET deleted = 1 WHERE key = ? AND deleted = 0", (key,)).rowcount
+        if changed:
+            self._lengths = None
+        return changed
+
+    def flush(self):
+        """Write buffered postings as a new segment."""
+        if self._buffered_docs:
+            self._write_segment(self._buffer, self._buffered_docs)
+        self._buffer = {}
+        self._buffered_docs = 0
+        self._db.commit()
+
+    def _write_segment(self, postings, n_docs):
+        segment = self._db.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM segments").fetchone()[0]
+        terms = sorted(postings)
+        rows = []
+        docs = []
+        freqs = []
+        offset = 0
+        for term in terms:
+            entries = postings[term]
+            rows.append((segment, term, offset, len(entries)))
+            docs.extend(doc_id for doc_id, _ in entries)
+            freqs.extend(freq for _, freq in entries)
+            offset += len(entries)
+        base = os.path.join(self.path, f"seg-{segment}")
+        np.save(f"{base}.docs.npy", np.asarray(docs, dtype=np.int32))
+        np.save(f"{base}.freqs.npy", np.asarray(freqs, dtype=np.int32))
+        self._db.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)", rows)
+        self._db.execute("INSERT INTO segments VALUES (?, ?)", (segment, n_docs))
+        return segment
+
+    def compact(self):
+        """Merge all segments into one, dropping postings of deleted documents."""
+        self.flush()
+        alive = self._alive_mask()
+        merged = {}
+        old = [row[0] for row in self._db.execute("SELECT id FROM segments")]
+        for segment in old:
+            docs, freqs = self._segment_arrays(segment)
+            for term, offset, length in self._db.execute(
+                    "SELECT term, offset, length FROM postings WHERE segment = ?", (segment,)):
+                ids = docs[offset:offset + length]
+                keep = alive[ids]
+                if keep.any():
+                    merged.setdefault(term, []).extend(
+                        zip(ids[keep].tolist(), freqs[offset:offset + length][keep].tolist()))
+        # Write the merged segment before dropping the old ones so ids never repeat
+        if merged:
+            self._write_segment(merged, int(alive.sum()))
+        self._segments.clear()
+        for segment in old:
+            self._db.execute("DELETE FROM postings WHERE segment = ?", (segment,))
+            self._db.execute("DELETE FROM segments WHERE id = ?", (segment,))
+        self._db.execute("DELETE FROM docs WHERE deleted = 1")
+        self._db.commit()
+        for segment in old:
+            for suffix in ("docs", "freqs"):
+                os.remove(os.path.join(self.path, f"seg-{segment}.{suffix}.npy"))
+        self._lengths = None
+
+    # -- reading -----------------------------------------------------------
+
+    def _segment_arrays(self, segment):
+        if segment not in self._segments:
+            base = os.path.join(self.path, f"seg-{segment}")
+            self._segments[segment] = (np.load(f"{base}.docs.npy", mmap_mode='r'),
+                                       np.load(f"{base}.freqs.npy", mmap_mode='r'))
+        return self._segments[segment]
+
+    def _doc_lengths(self):
+        if self._lengths is None:
+            max_id = self._db.execute("SELECT COALESCE(MAX(id), 0) FROM docs").fetchone()[0]
+            lengths = np.zeros(max_id + 1, dtype=np.float64)
+            alive = np.zeros(max_id + 1, dtype=bool)
+            for doc_id, length in self._db.execute("SELECT id, length FROM docs WHERE deleted = 0"):
+                lengths[doc_id] = length
+                alive[doc_id] = True
+            self._lengths = (lengths, alive)
+        return self._lengths
+
+    def _alive_mask(self):
+        return self._doc_lengths()[1]
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM docs WHERE deleted = 0").fetchone()[0]
+
+    def query(self, terms, weights=None, top_k=20, k1=BM25_K1, b=BM25_B):
+        """Return the ``top_k`` live documents by BM25 relevance (0-100) to ``terms``.
+
+        Only the posting lists of the query terms are read. Each result is a
+        dict with the document key, score, matched terms and the sections
+        found when it was indexed.
+        """
+        self.flush()
+        lengths, alive = self._doc_lengths()
+        n_docs = int(alive.sum())
+        if not n_docs or not terms:
+            return []
+        avgdl = lengths[alive].mean()
+        norm = k1 * (1.0 - b + b * lengths / avgdl)
+        scores = np.zeros(len(lengths))
+        postings = []
+        ceiling = 0.0
+        for term in terms:
+            weight = weights.get(term, 1.0) if weights else 1.0
+            slices = []
+            for segment, offset, length in self._db.execute(
+                    "SELECT segment, offset, length FROM postings WHERE term = ?", (term,)):
+                docs, freqs = self._segment_arrays(segment)
+                ids = np.asarray(docs[offset:offset + length])
+                keep = alive[ids]
+                slices.append((ids[keep], np.asarray(freqs[offset:offset + length])[keep]))
+            if not slices:
+                continue
+            ids = np.concatenate([s[0] for s in slices])
+            tf = np.concatenate([s[1] for s in slices]).astype(np.float64)
+            if not len(ids):
+                continue
+            idf = bm25_idf(len(ids), n_docs) * weight
+            np.add.at(scores, ids, idf * tf * (k1 + 1.0) / (tf + norm[ids]))
+            ceiling += idf * (k1 + 1.0)
+            postings.append((term, ids))
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k)[:top_k]]
+        candidates = candidates[np.argsort(-scores[candidates])]
+        matched = {doc_id: [] for doc_id in candidates.tolist()}
+        for term, ids in postings:
+            for doc_id in candidates[np.isin(candidates, ids)].tolist():
+                matched[doc_id].append(term)
+        results = []
+        for doc_id in candidates.tolist():
+            key, sections = self._db.execute(
+                "SELECT key, sections FROM docs WHERE id = ?", (doc_id,)).fetchone()
+            results.append({"key": key, "score": round(float(scores[doc_id] / ceiling * 100.0), 2),
+                            "matched": matched[doc_id], "sections": json.loads(sections)})
+        return results
+
+    def close(self):
+        self.flush()
+        self._segments.clear()
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
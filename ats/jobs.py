@@ -0,0 +1,299 @@
+"""SQLite-backed background job queue for OCR-heavy and batch analyses.
+
+Jobs live in one SQLite file, so the queue needs no broker and survives
+restarts and page refreshes: a client keeps the job id and polls ``get``.
+Workers ``claim`` a job under a time-limited lease, report ``progress``
+(which also renews the lease), and ``complete`` or ``fail`` it. A failed
+job is re-queued with exponential backoff until it has been tried
+``max_attempts`` times, except that a file rejected by the extraction limits
+fails at once; a job whose worker died is picked up again once its lease
+runs out.
+
+Job kinds (see ``HANDLERS``): ``score`` scores one PDF against a job
+description, ``extract`` returns the text of one PDF, and ``batch`` ranks a
+directory of resumes into an output file. Run workers with
+``python -m ats jobs work``, or in-process with ``start_worker_threads``.
+"""
+
+import io
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from .cache import DEFAULT_CACHE_DIR
+from .extract import ExtractionLimitError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF = 2.0
+# A running job is handed to another worker if its lease is not renewed in time
+LEASE_SECONDS = 300.0
+POLL_SECONDS = 0.5
+# Finished jobs are purged this long after they last changed
+RETENTION_SECONDS = 7 * 24 * 3600
+DEFAULT_LOCAL_WORKERS = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    data BLOB,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    run_after REAL NOT NULL,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, run_after);
+"""
+
+_default_queue = None
+_local_workers = []
+_local_workers_lock = threading.Lock()
+
+
+class Job:
+    __slots__ = ("id", "kind", "payload", "data", "attempts")
+
+    def __init__(self, id, kind, payload, data, attempts):
+        self.id = id
+        self.kind = kind
+        self.payload = payload
+        self.data = data
+        self.attempts = attempts
+
+
+class JobQueue:
+    def __init__(self, path, backoff=DEFAULT_BACKOFF, lease=LEASE_SECONDS):
+        self.path = path
+        self.backoff = backoff
+        self.lease = lease
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def enqueue(self, kind, payload, data=None, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """Add a job and return its id. ``payload`` must be JSON-serializable."""
+        if kind not in HANDLERS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, kind, payload, data, status, max_attempts, created, updated, run_after)"
+                " VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), data, max_attempts, now, now, now),
+            )
+            self._db.execute("DELETE FROM jobs WHERE status IN ('done', 'failed') AND updated < ?",
+                             (now - RETENTION_SECONDS,))
+        return job_id
+
+    def claim(self):
+        """Lease the oldest runnable job to the caller, or return None."""
+        with self._lock:
+            while True:
+                now = time.time()
+                self._db.execute("BEGIN IMMEDIATE")
+                try:
+                    row = self._db.execute(
+                        "SELECT id, kind, payload, data, attempts, max_attempts FROM jobs"
+                        " WHERE (status = 'queued' AND run_after <= ?) OR (status = 'running' AND lease_until < ?)"
+                        " ORDER BY created LIMIT 1", (now, now)).fetchone()
+                    if row is None:
+                        self._db.execute("COMMIT")
+                        return None
+                    job_id, kind, payload, data, attempts, max_attempts = row
+                    if attempts >= max_attempts:
+                        # Its last worker died mid-run
+                        self._db.execute(
+                            "UPDATE jobs SET status = 'failed', error = 'worker lost', data = NULL,"
+                            " updated = ? WHERE id = ?", (now, job_id))
+                        self._db.execute("COMMIT")
+                        continue
+                    self._db.execute(
+                        "UPDATE jobs SET status = 'running', attempts = attempts + 1, lease_until = ?,"
+                        " updated = ? WHERE id = ?", (now + self.lease, now, job_id))
+                    self._db.execute("COMMIT")
+                except BaseException:
+                    self._db.execute("ROLLBACK")
+                    raise
+                return Job(job_id, kind, json.loads(payload), data, attempts + 1)
+
+    def progress(self, job_id, fraction):
+        """Record progress (0..1) and renew the lease of a running job."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET progress = ?, lease_until = ?, updated = ? WHERE id = ? AND status = 'running'",
+                (max(0.0, min(1.0, fraction)), now + self.lease, now, job_id))
+
+    def complete(self, job_id, result):
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = 'done', progress = 1, result = ?, error = NULL, data = NULL,"
+                " lease_until = NULL, updated = ? WHERE id = ?", (json.dumps(result), time.time(), job_id))
+
+    def fail(self, job_id, error, retry=True):
+        """Re-queue the job with backoff, or mark it failed once out of attempts (or if not ``retry``)."""
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT attempts, max_attempts FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None:
+                return
+            attempts, max_attempts = row
+            if retry and attempts < max_attempts:
+                self._db.execute(
+                    "UPDATE jobs SET status = 'queued', error = ?, progress = 0, lease_until = NULL,"
+                    " run_after = ?, updated = ? WHERE id = ?",
+                    (error, now + self.backoff * 2 ** (attempts - 1), now, job_id))
+            else:
+                self._db.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, data = NULL, lease_until = NULL,"
+                    " updated = ? WHERE id = ?", (error, now, job_id))
+
+    def get(self, job_id):
+        """Return a job's status as a dict, or None if it does not exist."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT kind, payload, status, attempts, max_attempts, progress, result, error, created, updated"
+                " FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        kind, payload, status, attempts, max_attempts, progress, result, error, created, updated = row
+        return {"id": job_id, "kind": kind, "payload": json.loads(payload), "status": status,
+                "attempts": attempts, "max_attempts": max_attempts, "progress": progress,
+                "result": json.loads(result) if result is not None else None, "error": error,
+                "created": created, "updated": updated}
+
+    def counts(self):
+        """Number of jobs in each status."""
+        with self._lock:
+            return dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def close(self):
+        self._db.close()
+
+
+def run_score(job, progress):
+    from .batch import score_pdf
+    from .cache import get_default_cache
+
+    record = score_pdf(io.BytesIO(job.data), job.payload["job_description"], cache=get_default_cache(),
+                       keep_text=True, ocr_progress=progress, raise_errors=True)
+    if record["error"]:
+        # Raised so the job is retried with backoff instead of completing without a score
+        raise RuntimeError(record["error"])
+    for field in ("term_counts", "doc_length"):
+        record.pop(field, None)
+    return record
+
+
+def run_extract(job, progress):
+    from .analyzer import ATSAnalyzer
+    from .cache import get_default_cache
+
+    text = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(job.data), cache=get_default_cache(),
+                                             ocr_progress=progress, raise_errors=True)
+    if not text:
+        raise RuntimeError("no text extracted")
+    return {"text": text}
+
+
+def run_batch(job, progress):
+    from .batch import find_resumes, rank_corpus
+
+    p = job.payload
+    paths = list(find_resumes(p["resumes"]))
+    return rank_corpus(p["job_description"], paths, p["out"], workers=p.get("workers"),
+                       cache_path=p.get("cache"), strategy=p.get("strategy", "keywords"),
+                       progress=lambda done: progress(done, len(paths)), dedup_threshold=p.get("dedup_threshold"))
+
+
+HANDLERS = {"score": run_score, "extract": run_extract, "batch": run_batch}
+
+
+def run_one(queue):
+    """Claim and run one job; returns False if there was nothing to do."""
+    job = queue.claim()
+    if job is None:
+        return False
+    logger.info("Running %s job %s (attempt %d)", job.kind, job.id, job.attempts)
+    try:
+        result = HANDLERS[job.kind](job, lambda done, total: queue.progress(job.id, done / total if total else 1.0))
+    except ExtractionLimitError as e:
+        # The same file is rejected on every attempt, so it is not retried
+        logger.warning("%s job %s rejected: %s", job.kind, job.id, e)
+        queue.fail(job.id, str(e), retry=False)
+    except Exception as e:
+        logger.warning("%s job %s failed: %s", job.kind, job.id, e)
+        queue.fail(job.id, str(e))
+    else:
+        queue.complete(job.id, result)
+    return True
+
+
+def work(queue, stop=None, poll=POLL_SECONDS):
+    """Process jobs until ``stop`` (a ``threading.Event``) is set."""
+    while stop is None or not stop.is_set():
+        if not run_one(queue):
+            time.sleep(poll)
+
+
+def _work_in_process(path):
+    work(JobQueue(path))
+
+
+def run_worker_processes(path, workers=None):
+    """Run ``workers`` worker processes on the queue at ``path`` until interrupted."""
+    processes = [multiprocessing.Process(target=_work_in_process, args=(path,), daemon=True)
+                 for _ in range(workers or os.cpu_count() or 1)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
+def start_worker_threads(queue, count=DEFAULT_LOCAL_WORKERS):
+    """Start ``count`` daemon worker threads in this process; returns their stop event."""
+    stop = threading.Event()
+    for i in range(count):
+        threading.Thread(target=work, args=(queue, stop), name=f"ats-job-worker-{i}", daemon=True).start()
+    return stop
+
+
+def get_default_queue():
+    """Return the process-wide queue under ATS_CACHE_DIR (created on first use)."""
+    global _default_queue
+    if _default_queue is None:
+        cache_dir = os.getenv("ATS_CACHE_DIR", DEFAULT_CACHE_DIR)
+        _default_queue = JobQueue(os.path.join(cache_dir, "jobs.sqlite3"))
+    return _default_queue
+
+
+def ensure_local_workers():
+    """Start ATS_JOB_WORKERS worker threads on the default queue, once per process.
+
+    Set ATS_JOB_WORKERS=0 when jobs are handled by ``python -m ats jobs work``.
+    """
+    with _local_workers_lock:
+        if not _local_workers:
+            count = int(os.getenv("ATS_JOB_WORKERS", DEFAULT_LOCAL_WORKERS))
+            _local_workers.append(start_worker_threads(get_default_queue(), count) if count else None)
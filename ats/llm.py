@@ -0,0 +1,191 @@
+"""Asynchronous Gemini client with concurrency and rate limits, retries and caching.
+
+``LLMClient`` exposes ``generate``/``stream`` coroutines for async callers
+and ``generate_sync``/``stream_sync`` wrappers that run on a private event
+loop thread, so synchronous code such as the Streamlit script can share one
+client (and therefore one set of limits) across sessions.
+
+The transport is pluggable: by default it is the google-generativeai SDK,
+whose endpoint can be pointed at a local fake server with
+GEMINI_API_ENDPOINT; tests can also pass any async ``transport`` callable.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import random
+import threading
+import time
+
+from .cache import ExtractionCache, DEFAULT_CACHE_DIR, content_key
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "gemini-1.5-flash"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE_PER_SEC = 1.0
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+
+_default_client = None
+_END = object()
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        """Allow ``rate`` acquisitions per second with bursts up to ``capacity``."""
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def build_contents(prompt, resume_text, job_description):
+    """Assemble the text sent to the model."""
+    return f"{prompt.strip()}\n\nResume:\n{resume_text}\n\nJob Description:\n{job_description}"
+
+
+class GeminiTransport:
+    def __init__(self, api_key, endpoint=None):
+        import google.generativeai as genai
+
+        options = {"api_endpoint": endpoint} if endpoint else None
+        genai.configure(api_key=api_key, transport="rest" if endpoint else None,
+                        client_options=options)
+        self._genai = genai
+        self._models = {}
+
+    async def __call__(self, model, contents):
+        """Yield response text chunks as they arrive."""
+        if model not in self._models:
+            self._models[model] = self._genai.GenerativeModel(model)
+        response = await self._models[model].generate_content_async(contents, stream=True)
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+
+class LLMClient:
+    def __init__(self, transport, model=DEFAULT_MODEL, max_concurrency=DEFAULT_CONCURRENCY,
+                 rate_per_sec=DEFAULT_RATE_PER_SEC, burst=None, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF, cache=None):
+        self.transport = transport
+        self.model = model
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self.stats = {"requests": 0, "retries": 0, "cache_hits": 0, "failures": 0}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket = TokenBucket(rate_per_sec, burst)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+
+    def cache_key(self, prompt, resume_text, job_description):
+        data = "\0".join((prompt, resume_text, job_description)).encode('utf-8')
+        return content_key(data, model=self.model)
+
+    async def stream(self, prompt, resume_text, job_description):
+        """Yield the model's answer in chunks, serving repeats from the cache.
+
+        A failed request is retried with exponential backoff as long as no
+        chunk has been yielded yet.
+        """
+        key = self.cache_key(prompt, resume_text, job_description)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                yield cached
+                return
+
+        contents = build_contents(prompt, resume_text, job_description)
+        chunks = []
+        async with self._semaphore:
+            for attempt in range(self.retries + 1):
+                await self._bucket.acquire()
+                self.stats["requests"] += 1
+                try:
+                    async for chunk in self.transport(self.model, contents):
+                        chunks.append(chunk)
+                        yield chunk
+                    break
+                except Exception as e:
+                    if chunks or attempt == self.retries:
+                        self.stats["failures"] += 1
+                        raise
+                    delay = self.backoff * (2 ** attempt) * (0.5 + random.random())
+                    self.stats["retries"] += 1
+                    logger.warning("LLM request failed (%s); retrying in %.1fs", e, delay)
+                    await asyncio.sleep(delay)
+
+        if self.cache is not None and chunks:
+            self.cache.put(key, "".join(chunks))
+
+    async def generate(self, prompt, resume_text, job_description):
+        """Return the full answer as one string."""
+        return "".join([chunk async for chunk in self.stream(prompt, resume_text, job_description)])
+
+    def _background_loop(self):
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="llm-client", daemon=True).start()
+        return self._loop
+
+    def generate_sync(self, prompt, resume_text, job_description):
+        future = asyncio.run_coroutine_threadsafe(
+            self.generate(prompt, resume_text, job_description), self._background_loop())
+        return future.result()
+
+    def stream_sync(self, prompt, resume_text, job_description):
+        """Blocking generator over ``stream`` (usable with ``st.write_stream``)."""
+        chunks = queue.Queue()
+
+        async def pump():
+            try:
+                async for chunk in self.stream(prompt, resume_text, job_description):
+                    chunks.put(chunk)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(_END)
+
+        asyncio.run_coroutine_threadsafe(pump(), self._background_loop())
+        while True:
+            item = chunks.get()
+            if item is _END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+def get_default_client():
+    """Return the process-wide Gemini client, or None if GOOGLE_API_KEY is unset."""
+    global _default_client
+    if _default_client is None:
+        api_key = os.getenv("GOOGLE_API_KEY")
+        if not api_key:
+            return None
+        cache_dir = os.getenv("ATS_CACHE_DIR", DEFAULT_CACHE_DIR)
+        _default_client = LLMClient(
+            GeminiTransport(api_key, endpoint=os.getenv("GEMINI_API_ENDPOINT")),
+            model=os.getenv("GEMINI_MODEL", DEFAULT_MODEL),
+            max_concurrency=int(os.getenv("GEMINI_MAX_CONCURRENCY", DEFAULT_CONCURRENCY)),
+            rate_per_sec=float(os.getenv("GEMINI_RATE_PER_SEC", DEFAULT_RATE_PER_SEC)),
+            cache=ExtractionCache(os.path.join(cache_dir, "llm.sqlite3")),
+        )
+    return _default_client
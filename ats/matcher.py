@@ -0,0 +1,103 @@
+"""Single-pass, word-boundary keyword and phrase matching.
+
+The resume is lowercased and tokenized once; every token is then looked up
+in a hash index of job description terms, and multi-word phrases are
+checked only at tokens that can start one. Cost is linear in resume length
+and independent of how many terms the job description has.
+"""
+
+import re
+from bisect import bisect_left
+
+from .taxonomy import get_taxonomy
+
+# Alphanumeric runs, matching the isalnum() filter used for JD keywords
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+# Blank lines split a resume into blocks; skill aliases do not run across them
+BLOCK_SEPARATOR = re.compile(r"\n\s*\n")
+
+
+def block_breaks(text, offsets):
+    """Indices of the tokens (at sorted ``offsets`` in ``text``) that open a block after a blank line."""
+    breaks = set()
+    lo = 0
+    for match in BLOCK_SEPARATOR.finditer(text):
+        lo = bisect_left(offsets, match.end(), lo)
+        breaks.add(lo)
+    return breaks
+
+
+def tokenize(text):
+    """Return (tokens, offsets) for the lowercased text, with skill aliases canonicalized."""
+    tokens = []
+    offsets = []
+    lower = text.lower()
+    for match in TOKEN_PATTERN.finditer(lower):
+        tokens.append(match.group())
+        offsets.append(match.start())
+    return get_taxonomy().canonicalize(tokens, offsets, block_breaks(lower, offsets))
+
+
+class MatchResult:
+    __slots__ = ("terms", "counts", "positions")
+
+    def __init__(self, terms, counts, positions):
+        self.terms = terms
+        self.counts = counts
+        self.positions = positions
+
+    @property
+    def found(self):
+        return [term for term in self.terms if self.counts.get(term)]
+
+    @property
+    def missing(self):
+        return [term for term in self.terms if not self.counts.get(term)]
+
+    @property
+    def ratio(self):
+        """Fraction of terms found at least once."""
+        return len(self.found) / len(self.terms) if self.terms else 0.0
+
+
+class KeywordMatcher:
+    def __init__(self, terms, phrases=()):
+        """``terms`` are single words; ``phrases`` are tuples of words."""
+        self.words = frozenset(terms)
+        self.phrase_heads = {}
+        for phrase in phrases:
+            phrase = tuple(phrase)
+            self.phrase_heads.setdefault(phrase[0], []).append(phrase)
+        self.terms = list(terms) + [" ".join(phrase) for phrase in phrases]
+
+    def match(self, text=None, tokens=None, offsets=None, breaks=None):
+        """Match every term and phrase in one pass over the resume tokens.
+
+        Pass pre-tokenized ``tokens``/``offsets`` to reuse a tokenization,
+        and ``breaks`` (see ``block_breaks``) so phrases do not run across a
+        blank line; with ``text`` the breaks are found here.
+        Returns a ``MatchResult`` with per-term counts and character offsets.
+        """
+        if tokens is None:
+            tokens, offsets = tokenize(text)
+            if self.phrase_heads:
+                breaks = block_breaks(text.lower(), offsets)
+        words = self.words
+        heads = self.phrase_heads
+        counts = {}
+        positions = {}
+        n = len(tokens)
+        for i, token in enumerate(tokens):
+            if token in words:
+                counts[token] = counts.get(token, 0) + 1
+                positions.setdefault(token, []).append(offsets[i])
+            if token in heads:
+                for phrase in heads[token]:
+                    size = len(phrase)
+                    if i + size <= n and tuple(tokens[i:i + size]) == phrase and \
+                            not (breaks and any(j in breaks for j in range(i + 1, i + size))):
+                        key = " ".join(phrase)
+                        counts[key] = counts.get(key, 0) + 1
+                        positions.setdefault(key, []).append(offsets[i])
+        return MatchResult(self.terms, counts, positions)
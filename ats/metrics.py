@@ -0,0 +1,237 @@
+"""Per-stage timing and counters for the analyzer pipeline.
+
+Stages are timed with ``span("extract")`` or the ``timed`` decorator and
+land in the ``ats_stage_seconds`` histogram; other measurements use ``inc``
+(counters) and ``observe`` (histograms). Everything is recorded in a process-wide
+``Metrics`` registry that can be rendered as Prometheus text
+(``to_prometheus``, or ``serve_prometheus(port)`` for a scrape endpoint) or
+read as a dict (``snapshot``). Set ATS_METRICS_LOG=1 to also log one JSON
+line per finished span on the ``ats.metrics`` logger.
+
+Worker processes (``python -m ats batch``) each keep their own registry.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets, by metric unit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100)
+
+HELP = {
+    "ats_stage_seconds": "Time spent in each pipeline stage",
+    "ats_pdf_pages": "Pages read per PDF",
+    "ats_ocr_pages": "Pages sent to OCR per scanned PDF",
+    "ats_documents_total": "Documents passed through extraction, by outcome",
+    "ats_cache_total": "Extraction cache lookups, by result",
+    "ats_stage_errors_total": "Stages that raised an exception",
+}
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ""
+    body = ",".join('{}="{}"'.format(k, str(v).replace('\\', '\\\\').replace('"', '\\"')) for k, v in pairs)
+    return "{" + body + "}"
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self.log_spans = os.getenv("ATS_METRICS_LOG", "") not in ("", "0")
+
+    def inc(self, name, value=1, **labels):
+        """Add ``value`` to the counter ``name`` with ``labels``."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        """Record ``value`` in the histogram ``name`` with ``labels``."""
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def span(self, stage, **labels):
+        """Time the enclosed block as ``stage`` in ``ats_stage_seconds``.
+
+        Exceptions are counted in ``ats_stage_errors_total`` and re-raised.
+        """
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            self.inc("ats_stage_errors_total", stage=stage, **labels)
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            self.observe("ats_stage_seconds", seconds, stage=stage, **labels)
+            if self.log_spans:
+                logger.info(json.dumps({"stage": stage, "ms": round(seconds * 1000, 3),
+                                        "error": failed, **labels}))
+
+    def snapshot(self):
+        """Return all metrics as a JSON-ready dict."""
+        with self._lock:
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self._counters.items())]
+            histograms = [{"name": name, "labels": dict(labels), "count": h.count,
+                           "sum": round(h.sum, 6), "buckets": dict(zip(h.buckets, h.counts))}
+                          for (name, labels), h in sorted(self._histograms.items())]
+        return {"counters": counters, "histograms": histograms}
+
+    def stage_summary(self):
+        """Return ``{stage: {"count", "total_ms", "mean_ms"}}`` from the stage histogram."""
+        summary = {}
+        with self._lock:
+            for (name, labels), h in self._histograms.items():
+                if name != "ats_stage_seconds" or not h.count:
+                    continue
+                stage = dict(labels)["stage"]
+                entry = summary.setdefault(stage, {"count": 0, "total_ms": 0.0})
+                entry["count"] += h.count
+                entry["total_ms"] += h.sum * 1000
+        for entry in summary.values():
+            entry["total_ms"] = round(entry["total_ms"], 1)
+            entry["mean_ms"] = round(entry["total_ms"] / entry["count"], 1)
+        return summary
+
+    def to_prometheus(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        seen = set()
+
+        def header(name, kind):
+            if name not in seen:
+                seen.add(name)
+                if name in HELP:
+                    lines.append(f"# HELP {name} {HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                header(name, "counter")
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+            for (name, labels), h in sorted(self._histograms.items()):
+                header(name, "histogram")
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {h.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {h.sum:.6f}")
+                lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+REGISTRY = Metrics()
+
+
+def span(stage, **labels):
+    return REGISTRY.span(stage, **labels)
+
+
+def timed(stage):
+    """Decorator form of ``span`` for timing a whole function."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with REGISTRY.span(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class StageTimer:
+    """Times consecutive stages of straight-line code such as a UI script.
+
+    Each ``lap(stage)`` records the time since the previous lap (or since
+    the timer was created) as ``stage``.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or REGISTRY
+        self._last = time.perf_counter()
+
+    def lap(self, stage, **labels):
+        now = time.perf_counter()
+        self.registry.observe("ats_stage_seconds", now - self._last, stage=stage, **labels)
+        self._last = now
+
+
+def inc(name, value=1, **labels):
+    REGISTRY.inc(name, value, **labels)
+
+
+def observe(name, value, buckets=LATENCY_BUCKETS, **labels):
+    REGISTRY.observe(name, value, buckets, **labels)
+
+
+def serve_prometheus(port, host="127.0.0.1", registry=REGISTRY):
+    """Serve ``/metrics`` in Prometheus text format from a daemon thread.
+
+    Returns the ``HTTPServer``; call ``shutdown()`` on it to stop.
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format, *args)
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="ats-metrics", daemon=True).start()
+    logger.info("Serving metrics on http://%s:%d/metrics", host, server.server_address[1])
+    return server
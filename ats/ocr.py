@@ -0,0 +1,106 @@
+"""Page-streaming OCR for scanned (image-only) PDFs."""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the OCR fallback
+DEFAULT_DPI = 200
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+
+def ocr_page(pdf_bytes, page_number, dpi=DEFAULT_DPI, timeout=0):
+    """Render a single page (1-based) and OCR it, returning (text, timing).
+
+    A non-zero ``timeout`` (seconds) kills Tesseract if it runs longer.
+    """
+    # Imported here so the OCR stack only loads when a scanned PDF shows up
+    import pytesseract
+    from pdf2image import convert_from_bytes
+
+    start = time.perf_counter()
+    images = convert_from_bytes(pdf_bytes, dpi=dpi, first_page=page_number, last_page=page_number)
+    rendered = time.perf_counter()
+    text = "\n".join(pytesseract.image_to_string(image, timeout=timeout) for image in images)
+    done = time.perf_counter()
+    timing = {
+        "page": page_number,
+        "render_ms": round((rendered - start) * 1000, 1),
+        "ocr_ms": round((done - rendered) * 1000, 1),
+        "chars": len(text),
+    }
+    metrics.observe("ats_stage_seconds", rendered - start, stage="ocr_render")
+    metrics.observe("ats_stage_seconds", done - rendered, stage="ocr_tesseract")
+    return text, timing
+
+
+def _timed_out(max_seconds, done, page_count, on_timeout):
+    logger.warning("OCR stopped after %.1fs with %d of %d pages done", max_seconds, done, page_count)
+    if on_timeout is not None:
+        on_timeout()
+
+
+def ocr_pdf(pdf_bytes, page_count, dpi=DEFAULT_DPI, workers=DEFAULT_WORKERS, min_chars=None,
+            progress=None, max_seconds=None, on_timeout=None):
+    """OCR a PDF page by page on a thread pool.
+
+    Each task renders and OCRs one page, and at most ``workers`` pages are in
+    flight, so only a handful of page bitmaps are held in memory at a time.
+    Pages are collected in order; once ``min_chars`` characters have been
+    recovered no further pages are started. After ``max_seconds`` no page
+    is started and Tesseract runs still going are killed; the pages done so
+    far are returned and ``on_timeout()`` is called. ``progress(done, total)``
+    is called after each page. Returns (text, page_timings).
+    """
+    workers = max(1, workers or 1)
+    deadline = time.perf_counter() + max_seconds if max_seconds is not None else None
+    texts = []
+    timings = []
+    chars = 0
+    next_page = 1
+    pending = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while next_page <= page_count or pending:
+            while next_page <= page_count and len(pending) < workers:
+                timeout = 0
+                if deadline is not None:
+                    timeout = deadline - time.perf_counter()
+                    if timeout <= 0:
+                        break
+                pending.append(executor.submit(ocr_page, pdf_bytes, next_page, dpi, timeout))
+                next_page += 1
+            if not pending:
+                _timed_out(max_seconds, len(texts), page_count, on_timeout)
+                break
+            try:
+                text, timing = pending.pop(0).result()
+            except RuntimeError:
+                # pytesseract raises RuntimeError when it kills a run at the timeout
+                if deadline is None or time.perf_counter() < deadline:
+                    raise
+                for future in pending:
+                    future.cancel()
+                _timed_out(max_seconds, len(texts), page_count, on_timeout)
+                break
+            texts.append(text)
+            timings.append(timing)
+            chars += len(text.strip())
+            logger.info("OCR page %(page)d: render %(render_ms)sms, ocr %(ocr_ms)sms, %(chars)d chars", timing)
+            if progress is not None:
+                progress(len(texts), page_count)
+            if min_chars is not None and chars >= min_chars:
+                # Enough text recovered; drop pages that have not started yet
+                for future in pending:
+                    future.cancel()
+                pending = [future for future in pending if not future.cancelled()]
+                for future in pending:
+                    text, timing = future.result()
+                    texts.append(text)
+                    timings.append(timing)
+                break
+    return "\n".join(texts), timings
@@ -0,0 +1,92 @@
+"""Parse extracted resume text once into a compact ``ParsedResume``.
+
+Every ATS check reads from this structure instead of lowercasing and
+scanning the raw text again: tokens and their offsets for keyword matching,
+section spans from real heading lines, contact fields found by regex, the
+word count, and the formatting/contact marker flags.
+"""
+
+import re
+import sys
+from array import array
+
+from .matcher import TOKEN_PATTERN, block_breaks
+from .taxonomy import get_taxonomy
+from .text import RESUME_SECTIONS, find_headings
+
+# Substrings that suggest tables or images the ATS cannot read
+FORMATTING_MARKERS = ['table', 'image']
+
+# Substrings that count as contact information
+CONTACT_MARKERS = ['@', 'phone', 'email', 'linkedin', 'github']
+
+# All contact fields in one alternation so the text is scanned once
+CONTACT_PATTERN = re.compile(
+    r"(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)+)"
+    r"|(?P<linkedin>linkedin\.com/(?:in|pub)/[\w%-]+)"
+    r"|(?P<github>github\.com/[\w-]+)"
+    r"|(?P<phone>(?<!\w)\+?\(?\d[\d \t().-]{7,}\d(?!\w))",
+    re.IGNORECASE)
+
+
+class ParsedResume:
+    __slots__ = ("text", "tokens", "offsets", "word_count", "sections",
+                 "emails", "phones", "linkedin", "github",
+                 "complex_formatting", "contact_present")
+
+    def __init__(self, text):
+        self.text = text
+        lower = text.lower()
+
+        tokens = []
+        offsets = array('I')
+        for match in TOKEN_PATTERN.finditer(lower):
+            tokens.append(sys.intern(match.group()))
+            offsets.append(match.start())
+        tokens, offsets = get_taxonomy().canonicalize(tokens, offsets, block_breaks(lower, offsets))
+        self.tokens = tokens
+        self.offsets = offsets
+        self.word_count = len(text.split())
+
+        # Section name -> (start, end) of its body, from its heading to the next
+        # heading of a different section; the first occurrence of a section wins
+        spans = {}
+        current = None
+        for section, line_start, body_start in find_headings(text):
+            if current is not None and section == current[0]:
+                continue
+            if current is not None and current[0] not in spans:
+                spans[current[0]] = (current[1], line_start)
+            current = (section, body_start)
+        if current is not None and current[0] not in spans:
+            spans[current[0]] = (current[1], len(text))
+        self.sections = spans
+
+        fields = {"email": [], "phone": [], "linkedin": [], "github": []}
+        for match in CONTACT_PATTERN.finditer(text):
+            value = match.group()
+            # Phone numbers need 10-15 digits; shorter runs are dates or ranges
+            if match.lastgroup == "phone" and not 10 <= sum(c.isdigit() for c in value) <= 15:
+                continue
+            fields[match.lastgroup].append(value)
+        self.emails = fields["email"]
+        self.phones = fields["phone"]
+        self.linkedin = fields["linkedin"]
+        self.github = fields["github"]
+
+        self.complex_formatting = any(marker in lower for marker in FORMATTING_MARKERS)
+        self.contact_present = bool(self.emails or self.phones or self.linkedin or self.github) or \
+            any(marker in lower for marker in CONTACT_MARKERS)
+
+    @property
+    def section_names(self):
+        """Sections with a heading, in RESUME_SECTIONS order."""
+        return [section for section in RESUME_SECTIONS if section in self.sections]
+
+    def section_text(self, section):
+        start, end = self.sections[section]
+        return self.text[start:end]
+
+
+def parse_resume(text):
+    return ParsedResume(text)
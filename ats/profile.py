@@ -0,0 +1,117 @@
+"""Precompiled job description profiles.
+
+A ``JobProfile`` holds everything the scorer needs from a job description
+(keywords, weights, phrase n-grams and lookup tables), so it only has to be
+built once per requisition and can be reused for every resume.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+from .matcher import KeywordMatcher
+from .taxonomy import get_taxonomy
+from .text import is_content_word, rank_words, skill_tokens
+
+PROFILE_VERSION = 2
+DEFAULT_TOP_N = 20
+DEFAULT_TOP_PHRASES = 20
+MEMORY_PROFILES = 128
+
+_profiles = OrderedDict()
+
+
+def jd_hash(job_description, top_n=DEFAULT_TOP_N):
+    """Return the cache key for a job description under the active skills taxonomy."""
+    raw = f"{PROFILE_VERSION}\0{top_n}\0{get_taxonomy().version}\0{job_description}".encode('utf-8')
+    return hashlib.sha256(raw).hexdigest()
+
+
+class JobProfile:
+    def __init__(self, key, keywords, phrases):
+        self.key = key
+        # [(keyword, count), ...] most frequent first, as returned by extract_keywords
+        self.keywords = keywords
+        # [(("machine", "learning"), count), ...]
+        self.phrases = phrases
+        self.build_lookups()
+
+    def build_lookups(self):
+        top = self.keywords[0][1] if self.keywords else 1
+        self.terms = [word for word, _ in self.keywords]
+        self.weights = {word: count / top for word, count in self.keywords}
+        self.term_set = frozenset(self.terms)
+        # Matches keywords only; phrases are opt-in via phrase_matcher
+        self.matcher = KeywordMatcher(self.terms)
+        self.phrase_matcher = KeywordMatcher(self.terms, [phrase for phrase, _ in self.phrases])
+
+    @classmethod
+    def from_text(cls, job_description, top_n=DEFAULT_TOP_N, top_phrases=DEFAULT_TOP_PHRASES):
+        """Tokenize a job description once and build its profile."""
+        skills = get_taxonomy().canonical
+        tokens = skill_tokens(job_description)
+        content = [t in skills or is_content_word(t) for t in tokens]
+
+        words = [t for t, keep in zip(tokens, content) if keep]
+        keywords = rank_words(words, top_n)
+
+        # Bigrams and trigrams made only of adjacent content words
+        phrase_freq = {}
+        for n in (2, 3):
+            for i in range(len(tokens) - n + 1):
+                if all(content[i:i + n]):
+                    phrase = tuple(tokens[i:i + n])
+                    phrase_freq[phrase] = phrase_freq.get(phrase, 0) + 1
+        phrases = sorted(phrase_freq.items(), key=lambda x: x[1], reverse=True)[:top_phrases]
+
+        return cls(jd_hash(job_description, top_n), keywords, phrases)
+
+    def __getstate__(self):
+        return {"version": PROFILE_VERSION, "key": self.key,
+                "keywords": self.keywords, "phrases": self.phrases}
+
+    def __setstate__(self, state):
+        self.key = state["key"]
+        self.keywords = state["keywords"]
+        self.phrases = state["phrases"]
+        self.build_lookups()
+
+    def dumps(self):
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def loads(data):
+        return pickle.loads(data)
+
+
+def get_profile(job_description, top_n=DEFAULT_TOP_N, cache_dir=None):
+    """Return the profile for a job description, building it on first use.
+
+    Profiles are kept in an in-process LRU keyed by JD hash and, if
+    ``cache_dir`` (or ATS_PROFILE_DIR) is set, pickled to disk as well.
+    """
+    key = jd_hash(job_description, top_n)
+    if key in _profiles:
+        _profiles.move_to_end(key)
+        return _profiles[key]
+
+    cache_dir = cache_dir or os.getenv("ATS_PROFILE_DIR")
+    path = os.path.join(cache_dir, f"{key}.pkl") if cache_dir else None
+    profile = None
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            profile = JobProfile.loads(f.read())
+    if profile is None:
+        profile = JobProfile.from_text(job_description, top_n=top_n)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                f.write(profile.dumps())
+            os.replace(tmp, path)
+
+    _profiles[key] = profile
+    while len(_profiles) > MEMORY_PROFILES:
+        _profiles.popitem(last=False)
+    return profile
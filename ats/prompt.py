@@ -0,0 +1,122 @@
+"""Fit the resume and job description into a token budget before an LLM call.
+
+Both documents are split into lines, exact-duplicate and empty lines are
+dropped, and each line is scored by how many JD keywords it contains (plus
+a priority for the resume section it belongs to). The highest scoring lines
+are kept until the budget is spent and then re-emitted in document order
+under their section headings.
+"""
+
+import logging
+import re
+
+from .matcher import tokenize
+from .text import RESUME_SECTIONS, find_headings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET = 2000
+# Share of the budget given to the resume; the rest goes to the JD
+RESUME_SHARE = 0.65
+# Rough characters-per-token ratio for English text
+CHARS_PER_TOKEN = 4
+
+# Extra relevance for lines in sections reviewers care most about
+SECTION_PRIORITY = {
+    'header': 2.0, 'summary': 1.5, 'experience': 1.5, 'work experience': 1.5,
+    'skills': 1.5, 'projects': 1.0, 'education': 1.0, 'certifications': 0.5,
+}
+
+_SPACES = re.compile(r"\s+")
+
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _heading(line, found_sections):
+    for section, _, body_start in find_headings(line):
+        if section in found_sections:
+            return section, line[body_start:]
+    return None, line
+
+
+def split_sections(text, found_sections=RESUME_SECTIONS):
+    """Return [(section, [lines])], starting with a 'header' for the preamble."""
+    sections = [('header', [])]
+    for line in text.splitlines():
+        section, rest = _heading(line, found_sections)
+        if section:
+            sections.append((section, []))
+        if rest.strip():
+            sections[-1][1].append(rest)
+    return [(name, lines) for name, lines in sections if lines]
+
+
+def _select(units, budget):
+    """Keep the most relevant units that fit in ``budget`` tokens, in original order."""
+    chosen = []
+    spent = 0
+    for unit in sorted(units, key=lambda u: u[0], reverse=True):
+        cost = estimate_tokens(unit[2])
+        if spent + cost <= budget:
+            chosen.append(unit)
+            spent += cost
+    return sorted(chosen, key=lambda u: u[1])
+
+
+def _units(lines, weights, bonus, seen, start):
+    units = []
+    for i, line in enumerate(lines):
+        line = _SPACES.sub(" ", line).strip()
+        key = line.lower()
+        if not line or key in seen:
+            continue
+        seen.add(key)
+        tokens, _ = tokenize(line)
+        relevance = sum(weights.get(token, 0.0) for token in tokens) + bonus
+        units.append((relevance, start + i, line))
+    return units
+
+
+def compact_prompt(resume_text, job_description, found_sections, job_keywords,
+                   keyword_weights=None, budget=DEFAULT_BUDGET):
+    """Return (resume_text, job_description, stats) trimmed to ``budget`` tokens.
+
+    ``found_sections`` and ``job_keywords`` are the results already computed
+    by ``analyze_resume_sections`` and ``extract_keywords``.
+    """
+    weights = keyword_weights or {keyword: 1.0 for keyword in job_keywords}
+    seen = set()
+
+    resume_units = []
+    section_of = {}
+    position = 0
+    for section, lines in split_sections(resume_text, found_sections):
+        for unit in _units(lines, weights, SECTION_PRIORITY.get(section, 0.25), seen, position):
+            section_of[unit[1]] = section
+            resume_units.append(unit)
+        position += len(lines) + 1
+
+    resume_budget = int(budget * RESUME_SHARE)
+    parts = []
+    current = None
+    for _, index, line in _select(resume_units, resume_budget):
+        if section_of[index] != current:
+            current = section_of[index]
+            if current != 'header':
+                parts.append(f"\n{current.upper()}")
+        parts.append(line)
+    compact_resume = "\n".join(parts).strip()
+
+    jd_units = _units(job_description.splitlines(), weights, 0.0, set(), 0)
+    jd_budget = budget - estimate_tokens(compact_resume)
+    compact_jd = "\n".join(line for _, _, line in _select(jd_units, jd_budget))
+
+    stats = {
+        "tokens_before": estimate_tokens(resume_text) + estimate_tokens(job_description),
+        "tokens_after": estimate_tokens(compact_resume) + estimate_tokens(compact_jd),
+        "budget": budget,
+    }
+    logger.info("Prompt compacted from %(tokens_before)d to %(tokens_after)d tokens (budget %(budget)d)", stats)
+    return compact_resume, compact_jd, stats
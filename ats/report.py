@@ -0,0 +1,244 @@
+"""Report output: streaming writers for batch results and renderers for one analysis.
+
+Batch writers take one scored record at a time (as built by
+``batch.score_pdf``) and write it straight through, so a report never has to
+be held in memory. ``open_writer`` picks the format from the file name:
+
+* ``.jsonl`` -- the records as they are, one JSON object per line;
+* ``.csv`` -- one flat row per record (``CSV_FIELDS``), lists joined by ``LIST_SEPARATOR``;
+* ``.parquet`` / ``.arrow`` -- the same flat columns with typed values and
+  list columns, written in row groups of ``ROW_GROUP_ROWS``. These need
+  ``pyarrow``.
+
+``render_text``, ``render_html`` and ``render_pdf`` turn a single record into
+the downloadable report. All three are laid out from the same
+``report_outline``, so the content is decided in one place.
+"""
+
+import csv
+import html
+import json
+
+from .analyzer import CHECK_WEIGHTS
+
+# Checks in report order; "Keywords Match" is a percentage, the rest are pass/fail
+CHECKS = list(CHECK_WEIGHTS)
+KEY_SECTIONS = ['experience', 'education', 'skills']
+
+# Columns written when the output file is a CSV
+CSV_FIELDS = ['rank', 'path', 'score', *CHECKS,
+              'keywords_found', 'keywords_missing', 'sections', 'duplicate_of', 'error']
+
+# Joins list fields in CSV cells; keywords and section names can contain spaces
+LIST_SEPARATOR = ";"
+
+ROW_GROUP_ROWS = 4096
+MAX_REPORT_KEYWORDS = 15
+
+# PDF page layout, in points
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+MARGIN = 54
+FONT_SIZE = 10
+LEADING = 14
+
+
+def flat_row(record, rank=None, join=False):
+    """One flat row of ``CSV_FIELDS`` for a record; lists are joined with ``LIST_SEPARATOR`` if ``join``."""
+    row = {"rank": rank if rank is not None else record.get("rank"), "path": record.get("path"),
+           "score": record["score"], "duplicate_of": record.get("duplicate_of"), "error": record.get("error")}
+    checks = record.get("checks") or {}
+    for check in CHECKS:
+        row[check] = checks.get(check)
+    for field in ("keywords_found", "keywords_missing", "sections"):
+        row[field] = LIST_SEPARATOR.join(record[field]) if join else list(record[field])
+    if join:
+        row = {key: "" if value is None else value for key, value in row.items()}
+    return row
+
+
+class _Writer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class JsonLinesWriter(_Writer):
+    def __init__(self, path):
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, record, rank=None):
+        if rank is not None:
+            record = {**record, "rank": rank}
+        self._file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+class CsvWriter(_Writer):
+    def __init__(self, path):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS)
+        self._writer.writeheader()
+
+    def write(self, record, rank=None):
+        self._writer.writerow(flat_row(record, rank, join=True))
+
+    def close(self):
+        self._file.close()
+
+
+class ArrowWriter(_Writer):
+    """Parquet (``parquet=True``) or Arrow IPC file writer, one row group per ``ROW_GROUP_ROWS`` records."""
+
+    def __init__(self, path, parquet=True):
+        import pyarrow as pa
+
+        self._pa = pa
+        strings = pa.list_(pa.string())
+        self.schema = pa.schema(
+            [("rank", pa.int64()), ("path", pa.string()), ("score", pa.float64())]
+            + [(check, pa.float64() if check == "Keywords Match" else pa.bool_()) for check in CHECKS]
+            + [("keywords_found", strings), ("keywords_missing", strings), ("sections", strings),
+               ("duplicate_of", pa.string()), ("error", pa.string())])
+        if parquet:
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema)
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema)
+        self._columns = {name: [] for name in self.schema.names}
+        self._rows = 0
+
+    def write(self, record, rank=None):
+        for name, value in flat_row(record, rank).items():
+            self._columns[name].append(value)
+        self._rows += 1
+        if self._rows >= ROW_GROUP_ROWS:
+            self.flush()
+
+    def flush(self):
+        if self._rows:
+            self._writer.write_table(self._pa.Table.from_pydict(self._columns, schema=self.schema))
+            for values in self._columns.values():
+                values.clear()
+            self._rows = 0
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+
+def open_writer(path):
+    """Open a streaming writer for ``path``, choosing the format from its extension."""
+    lower = path.lower()
+    if lower.endswith('.csv'):
+        return CsvWriter(path)
+    if lower.endswith('.parquet'):
+        return ArrowWriter(path, parquet=True)
+    if lower.endswith(('.arrow', '.feather')):
+        return ArrowWriter(path, parquet=False)
+    return JsonLinesWriter(path)
+
+
+def report_outline(record):
+    """Content of a single-resume report: (score, [(heading, [(passed, line), ...]), ...]).
+
+    ``passed`` is True, False or None (a plain list item).
+    """
+    checks = []
+    for check, value in record["checks"].items():
+        if isinstance(value, bool):
+            checks.append((value, f"{check}: {'Yes' if value else 'No'}"))
+        else:
+            checks.append((None, f"{check}: {value:.1f}%"))
+    blocks = [("Key Metrics", checks),
+              ("Found Keywords", [(None, kw) for kw in record["keywords_found"][:MAX_REPORT_KEYWORDS]])]
+    if record["keywords_missing"]:
+        blocks.append(("Missing Keywords",
+                       [(None, kw) for kw in record["keywords_missing"][:MAX_REPORT_KEYWORDS]]))
+    missing_sections = [s for s in KEY_SECTIONS if s not in [sec.lower() for sec in record["sections"]]]
+    if missing_sections:
+        blocks.append(("Recommended Sections to Add", [(None, s.capitalize()) for s in missing_sections]))
+    return record["score"], blocks
+
+
+_TEXT_ICONS = {"Key Metrics": "🔍", "Found Keywords": "✅", "Missing Keywords": "❌",
+               "Recommended Sections to Add": "⚠️"}
+
+
+def render_text(record):
+    """Plain-text report for one scored record."""
+    score, blocks = report_outline(record)
+    lines = ["⭐ Resume Analysis Report ⭐", "", f"📊 Overall ATS Score: {score:.1f}%"]
+    for heading, items in blocks:
+        lines += ["", f"{_TEXT_ICONS[heading]} {heading}:"]
+        lines += [f"- {line}" if passed is None else f"{'✅' if passed else '❌'} {line}" for passed, line in items]
+    lines += ["", "Generated by Resume Analyzer Pro"]
+    return "\n".join(lines) + "\n"
+
+
+def render_html(record):
+    """Standalone HTML report for one scored record."""
+    score, blocks = report_outline(record)
+    parts = ["<!DOCTYPE html>", "<html><head><meta charset=\"utf-8\"><title>Resume Analysis Report</title>",
+             "<style>body{font-family:sans-serif;max-width:40em;margin:2em auto}"
+             ".pass{color:#2e7d32}.fail{color:#c62828}</style></head><body>",
+             "<h1>Resume Analysis Report</h1>", f"<p><strong>Overall ATS Score: {score:.1f}%</strong></p>"]
+    for heading, items in blocks:
+        parts.append(f"<h2>{html.escape(heading)}</h2><ul>")
+        for passed, line in items:
+            css = "" if passed is None else f" class=\"{'pass' if passed else 'fail'}\""
+            parts.append(f"<li{css}>{html.escape(line)}</li>")
+        parts.append("</ul>")
+    parts.append("<p><small>Generated by Resume Analyzer Pro</small></p></body></html>")
+    return "\n".join(parts)
+
+
+def _pdf_string(line):
+    # Standard Type 1 fonts only cover Latin-1
+    line = line.encode('latin-1', 'ignore').decode('latin-1')
+    return "(" + line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def render_pdf(record):
+    """Minimal text-only PDF report for one scored record, written without a PDF library."""
+    score, blocks = report_outline(record)
+    lines = ["Resume Analysis Report", "", f"Overall ATS Score: {score:.1f}%"]
+    for heading, items in blocks:
+        lines += ["", heading]
+        lines += [f"  - {line}" if passed is None else f"  [{'x' if passed else ' '}] {line}"
+                  for passed, line in items]
+    per_page = (PAGE_HEIGHT - 2 * MARGIN) // LEADING
+    pages = [lines[i:i + per_page] for i in range(0, len(lines), per_page)]
+
+    # 1: catalog, 2: page tree, 3: font, then a page and its content stream per page
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for page in pages:
+        text = " ".join(f"{_pdf_string(line)} Tj T*" for line in page)
+        stream = (f"BT /F1 {FONT_SIZE} Tf {LEADING} TL {MARGIN} {PAGE_HEIGHT - MARGIN} Td {text} ET"
+                  .encode('latin-1'))
+        kids.append(f"{len(objects) + 1} 0 R")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}]"
+                       f" /Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects) + 2} 0 R >>"
+                       .encode('latin-1'))
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode('latin-1')
+    return serialize_pdf(objects)
+
+
+def serialize_pdf(objects):
+    """PDF 1.4 file from object bodies (bytes), numbered from 1 with object 1 the catalog."""
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
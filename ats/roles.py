@@ -0,0 +1,124 @@
+"""Score one resume against many job descriptions in one pass.
+
+A ``RoleSet`` stacks the ``JobProfile`` of every open requisition into one
+sparse roles x terms matrix over their combined keyword vocabulary. A resume
+is parsed once, counted over that vocabulary, and multiplied by the matrix,
+so matching it against 300 roles is one sparse product instead of 300
+``perform_ats_checks`` calls. The other checks (sections, length,
+formatting, contact) do not depend on the role and are computed once.
+Scores equal ``perform_ats_checks`` for each role under the same strategy.
+"""
+
+import os
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+from . import metrics
+from .analyzer import CHECK_WEIGHTS, ATSAnalyzer
+from .batch import find_files
+from .profile import DEFAULT_TOP_N, get_profile
+from .scoring import BM25_B, BM25_K1
+
+STRATEGIES = ("keywords", "tfidf", "bm25")
+DEFAULT_TOP_ROLES = 10
+
+
+class RoleSet:
+    def __init__(self, roles, top_n=DEFAULT_TOP_N):
+        """``roles`` maps role ids to job description text, or is a list of (id, text) pairs."""
+        items = list(roles.items()) if isinstance(roles, dict) else list(roles)
+        self.ids = [role_id for role_id, _ in items]
+        self.profiles = [get_profile(job_description, top_n) for _, job_description in items]
+
+        vocabulary = {}
+        indptr = [0]
+        indices = []
+        data = []
+        for profile in self.profiles:
+            for term in profile.terms:
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                data.append(profile.weights[term])
+            indptr.append(len(indices))
+        self.vocabulary = vocabulary
+        # Roles x terms, holding each role's keyword weights
+        self.weights = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int32), indptr),
+            shape=(len(items), len(vocabulary)))
+        self.presence = self.weights.copy()
+        self.presence.data[:] = 1.0
+        self.term_counts = np.diff(self.weights.indptr).astype(np.float64)
+        self.weight_totals = np.asarray(self.weights.sum(axis=1)).ravel()
+        self.weight_norms = np.sqrt(np.asarray(self.weights.multiply(self.weights).sum(axis=1)).ravel())
+
+    @classmethod
+    def from_directory(cls, path, top_n=DEFAULT_TOP_N):
+        """One role per ``.txt`` job description under ``path``, named by file name."""
+        roles = []
+        for file_path in find_files(path, '.txt'):
+            with open(file_path, encoding='utf-8') as f:
+                roles.append((os.path.splitext(os.path.relpath(file_path, path))[0], f.read()))
+        return cls(roles, top_n=top_n)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def term_counts_of(self, tokens):
+        """Counts of the resume's tokens over the combined vocabulary."""
+        counts = np.zeros(len(self.vocabulary))
+        vocabulary = self.vocabulary
+        for term, count in Counter(tokens).items():
+            column = vocabulary.get(term)
+            if column is not None:
+                counts[column] = count
+        return counts
+
+    def keyword_scores(self, parsed, strategy="keywords"):
+        """"Keywords Match" (0-100) of a ``ParsedResume`` for every role."""
+        counts = self.term_counts_of(parsed.tokens)
+        if strategy == "keywords":
+            matched = self.presence @ (counts > 0)
+            denominator = self.term_counts
+        elif strategy == "bm25":
+            # Single-document BM25 with unit IDF, as in scoring.keyword_relevance
+            length = len(parsed.tokens)
+            norm = BM25_K1 * (1.0 - BM25_B + BM25_B * length / max(length, 1e-9))
+            matched = self.weights @ (counts * (BM25_K1 + 1.0) / (counts + norm))
+            denominator = self.weight_totals * (BM25_K1 + 1.0)
+        elif strategy == "tfidf":
+            matched = self.weights @ counts
+            doc_norm = np.sqrt(sum(count * count for count in Counter(parsed.tokens).values()))
+            denominator = self.weight_norms * doc_norm
+        else:
+            raise ValueError(f"Unknown scoring strategy: {strategy}")
+        return np.divide(matched, denominator, out=np.zeros(len(self.ids)), where=denominator > 0) * 100.0
+
+    def match(self, pdf_text, strategy="keywords", top_n=DEFAULT_TOP_ROLES):
+        """Rank roles for one resume (text or ``ParsedResume``).
+
+        Returns the ``top_n`` best roles, best first, as dicts with the
+        overall score, the "Keywords Match" score and the role's found and
+        missing keywords.
+        """
+        with metrics.span("roles", strategy=strategy):
+            parsed = ATSAnalyzer.parse_resume(pdf_text)
+            keyword_scores = self.keyword_scores(parsed, strategy)
+            # Everything but "Keywords Match" is the same for every role
+            base = ATSAnalyzer.overall_score(ATSAnalyzer.build_checks(
+                0, parsed.section_names, parsed.word_count, parsed.complex_formatting, parsed.contact_present))
+            scores = base + CHECK_WEIGHTS["Keywords Match"] * keyword_scores
+
+            present = set(parsed.tokens)
+            results = []
+            for rank, i in enumerate(np.argsort(-scores, kind='stable')[:top_n], start=1):
+                terms = self.profiles[i].terms
+                results.append({
+                    "rank": rank,
+                    "role": self.ids[i],
+                    "score": round(float(scores[i]), 2),
+                    "keyword_score": round(float(keyword_scores[i]), 2),
+                    "keywords_found": [term for term in terms if term in present],
+                    "keywords_missing": [term for term in terms if term not in present],
+                })
+        return results
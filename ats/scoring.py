@@ -0,0 +1,182 @@
+"""Corpus-aware keyword relevance: TF-IDF and BM25 over a sparse term matrix.
+
+``ResumeCorpus`` holds a documents x terms count matrix (scipy CSR) for a
+set of resumes. Relevance of every resume to a job description is computed
+in one matrix operation over the columns for the JD's terms, and scores are
+normalized to 0-100 so they can stand in for the "Keywords Match" check.
+
+Without a corpus, a single resume is scored with unit IDF (term-frequency
+saturation only), which keeps the scale comparable but cannot down-weight
+terms that every candidate has.
+"""
+
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+from .matcher import tokenize
+
+STRATEGIES = ("keywords", "tfidf", "bm25")
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+
+def bm25_idf(doc_freq, n_docs):
+    return np.log((n_docs - doc_freq + 0.5) / (doc_freq + 0.5) + 1.0)
+
+
+def tfidf_idf(doc_freq, n_docs):
+    # Smoothed, as if one extra document contained every term
+    return np.log((1.0 + n_docs) / (1.0 + doc_freq)) + 1.0
+
+
+def bm25_percent(tf, doc_lengths, avgdl, idf, weights, doc_freq=None, k1=BM25_K1, b=BM25_B):
+    """Score an (n_docs x n_terms) array of query-term counts, scaled to 0-100.
+
+    100 means every query term is saturated in the document. When
+    ``doc_freq`` is given, terms that no document in the corpus contains
+    are left out of the ceiling: their (large) IDF cannot separate
+    candidates and would otherwise squash every score towards zero.
+    """
+    tf = np.asarray(tf, dtype=np.float64)
+    norm = k1 * (1.0 - b + b * np.asarray(doc_lengths, dtype=np.float64) / max(avgdl, 1e-9))
+    saturation = tf * (k1 + 1.0) / (tf + norm[:, None])
+    term_weights = idf * weights
+    if doc_freq is None:
+        best = np.full(tf.shape[0], term_weights.sum())
+    else:
+        counted = (np.asarray(doc_freq) > 0)[None, :] | (tf > 0)
+        best = counted @ term_weights
+    best = best * (k1 + 1.0)
+    scores = saturation @ term_weights
+    return np.divide(scores, best, out=np.zeros_like(scores), where=best > 0) * 100.0
+
+
+def bm25_from_counts(tf, doc_lengths, weights=None):
+    """BM25 (0-100) for a batch given only per-document JD-term counts and lengths.
+
+    Document frequencies and average length are taken from the batch
+    itself, so this is enough to rank a streamed corpus without keeping a
+    full term matrix around.
+    """
+    tf = np.asarray(tf, dtype=np.float64)
+    doc_lengths = np.asarray(doc_lengths, dtype=np.float64)
+    if weights is None:
+        weights = np.ones(tf.shape[1])
+    doc_freq = (tf > 0).sum(axis=0)
+    avgdl = float(doc_lengths.mean()) if len(doc_lengths) else 0.0
+    return bm25_percent(tf, doc_lengths, avgdl, bm25_idf(doc_freq, tf.shape[0]), np.asarray(weights),
+                        doc_freq=doc_freq)
+
+
+class ResumeCorpus:
+    def __init__(self, matrix, vocabulary, ids=None):
+        self.matrix = matrix.tocsr()
+        self.vocabulary = vocabulary
+        self.ids = list(ids) if ids is not None else list(range(self.matrix.shape[0]))
+        self.n_docs = self.matrix.shape[0]
+        self.doc_freq = np.bincount(self.matrix.indices, minlength=self.matrix.shape[1])
+        self.doc_lengths = np.asarray(self.matrix.sum(axis=1)).ravel()
+        self.avgdl = float(self.doc_lengths.mean()) if self.n_docs else 0.0
+        self._tfidf_norms = None
+
+    @classmethod
+    def from_texts(cls, texts, ids=None):
+        """Tokenize each text once and build the sparse count matrix."""
+        vocabulary = {}
+        indptr = [0]
+        indices = []
+        data = []
+        for text in texts:
+            for term, count in Counter(tokenize(text)[0]).items():
+                indices.append(vocabulary.setdefault(term, len(vocabulary)))
+                data.append(count)
+            indptr.append(len(indices))
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float32), np.asarray(indices, dtype=np.int32), indptr),
+            shape=(len(indptr) - 1, len(vocabulary)))
+        return cls(matrix, vocabulary, ids)
+
+    def term_doc_freq(self, terms):
+        return np.asarray([self.doc_freq[self.vocabulary[term]] if term in self.vocabulary else 0
+                           for term in terms], dtype=np.float64)
+
+    def query_columns(self, terms):
+        """Return (counts, doc_freq) for ``terms``; unknown terms get zero columns."""
+        columns = np.asarray([self.vocabulary.get(term, -1) for term in terms], dtype=np.int64)
+        known = columns >= 0
+        counts = np.zeros((self.n_docs, len(terms)), dtype=np.float32)
+        if known.any():
+            counts[:, known] = self.matrix[:, columns[known]].toarray()
+        return counts, self.term_doc_freq(terms)
+
+    def _norms(self):
+        if self._tfidf_norms is None:
+            weighted = self.matrix.multiply(tfidf_idf(self.doc_freq, self.n_docs)).tocsr()
+            self._tfidf_norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        return self._tfidf_norms
+
+    def scores(self, terms, strategy="bm25", weights=None):
+        """Relevance (0-100) of every document in the corpus to ``terms``."""
+        weights = _weight_vector(terms, weights)
+        counts, doc_freq = self.query_columns(terms)
+        if strategy == "bm25":
+            return bm25_percent(counts, self.doc_lengths, self.avgdl,
+                                bm25_idf(doc_freq, self.n_docs), weights, doc_freq=doc_freq)
+        if strategy == "tfidf":
+            query = tfidf_idf(doc_freq, self.n_docs) * weights
+            dots = (counts * tfidf_idf(doc_freq, self.n_docs)) @ query
+            denominator = self._norms() * np.linalg.norm(query)
+            return np.divide(dots, denominator, out=np.zeros_like(dots), where=denominator > 0) * 100.0
+        raise ValueError(f"Unknown scoring strategy: {strategy}")
+
+    def score_text(self, text, terms, strategy="bm25", weights=None):
+        """Relevance (0-100) of a text (or token list) that is not in the corpus, using corpus statistics."""
+        doc_freq = self.term_doc_freq(terms)
+        counts = Counter(_tokens(text))
+        if strategy == "tfidf":
+            # Norm over all of the document's terms, including ones the corpus has never seen
+            idf_of = {term: tfidf_idf(self.doc_freq[self.vocabulary[term]] if term in self.vocabulary else 0,
+                                      self.n_docs) for term in counts}
+            norm = np.sqrt(sum((count * idf_of[term]) ** 2 for term, count in counts.items()))
+            return _tfidf_single(counts, terms, weights, tfidf_idf(doc_freq, self.n_docs), norm)
+        return _bm25_single(counts, terms, weights, bm25_idf(doc_freq, self.n_docs), self.avgdl, doc_freq)
+
+
+def _tokens(text):
+    return text if isinstance(text, list) else tokenize(text)[0]
+
+
+def _weight_vector(terms, weights):
+    if weights is None:
+        return np.ones(len(terms))
+    return np.asarray([weights.get(term, 1.0) for term in terms], dtype=np.float64)
+
+
+def _bm25_single(counts, terms, weights, idf, avgdl, doc_freq=None):
+    tf = np.asarray([[counts.get(term, 0) for term in terms]], dtype=np.float64)
+    length = sum(counts.values())
+    return float(bm25_percent(tf, [length], avgdl or length, idf, _weight_vector(terms, weights),
+                              doc_freq=doc_freq)[0])
+
+
+def _tfidf_single(counts, terms, weights, idf, norm):
+    query = idf * _weight_vector(terms, weights)
+    tf = np.asarray([counts.get(term, 0) for term in terms], dtype=np.float64)
+    denominator = norm * np.linalg.norm(query)
+    return float((tf * idf) @ query / denominator * 100.0) if denominator else 0.0
+
+
+def keyword_relevance(pdf_text, job_keywords, strategy, weights=None, corpus=None):
+    """"Keywords Match" percentage for one resume (text or token list) under TF-IDF or BM25."""
+    if strategy not in ("tfidf", "bm25"):
+        raise ValueError(f"Unknown scoring strategy: {strategy}")
+    if corpus is not None:
+        return corpus.score_text(pdf_text, job_keywords, strategy, weights)
+    counts = Counter(_tokens(pdf_text))
+    ones = np.ones(len(job_keywords))
+    if strategy == "bm25":
+        return _bm25_single(counts, job_keywords, weights, ones, None)
+    norm = np.sqrt(sum(count * count for count in counts.values()))
+    return _tfidf_single(counts, job_keywords, weights, ones, norm)
@@ -0,0 +1,367 @@
+"""Embedding-based semantic matching of job requirements to resume content.
+
+The job description is split into requirement sentences and the resume into
+lines; both are embedded, and ``semantic_match`` computes the full
+requirement x line cosine similarity matrix with one matrix multiply. Each
+requirement is credited with its best-matching resume line.
+
+Embeddings come from ``get_embedder()``: a local sentence-transformers
+model when ATS_EMBEDDING_MODEL names one (CPU only, loaded on first use),
+otherwise ``HashingEmbedder``, which hashes words and character n-grams
+into a fixed-size vector and needs no download. The hashed embedding
+maps skill aliases to their canonical names first ("k8s" and "Kubernetes",
+"led a team" and "leadership") and credits shared word stems ("kubernetes",
+"kubernetes-based"); other synonyms need a model. Embeddings are cached by
+the hash of their text and embedder.
+
+``VectorIndex`` stores one vector per resume in a flat NumPy file that is
+memory-mapped for search, for bulk matching of a JD against many resumes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .matcher import TOKEN_PATTERN
+from .taxonomy import get_taxonomy
+from .text import STOPWORDS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIM = 512
+NGRAM_SIZES = (3, 4, 5)
+# Requirements and resume lines with fewer content words carry no signal
+MIN_REQUIREMENT_WORDS = 3
+MIN_LINE_WORDS = 2
+MAX_REQUIREMENTS = 50
+MAX_LINES = 500
+MEMORY_EMBEDDINGS = 4096
+
+# Requirement / line boundaries: line breaks, bullets and sentence ends
+_SPLIT = re.compile(r"\n+|(?<=[.;!?])\s+|\s[•·▪]\s")
+
+_default_embedder = None
+_default_cache = None
+
+
+def content_tokens(text):
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+def skill_content_tokens(text):
+    """``content_tokens`` with skill aliases mapped to their canonical names first."""
+    tokens = get_taxonomy().canonicalize(TOKEN_PATTERN.findall(text.lower()))[0]
+    return [t for t in tokens if t not in STOPWORDS and len(t) > 1]
+
+
+class HashingEmbedder:
+    """Signed feature hashing of words and character n-grams; no model download."""
+
+    # Cosine similarities between related texts fall roughly in this band
+    floor = 0.15
+    ceiling = 0.6
+
+    def __init__(self, dim=DEFAULT_DIM, ngrams=NGRAM_SIZES):
+        self.dim = dim
+        self.ngrams = ngrams
+
+    @property
+    def id(self):
+        # Features depend on the skill taxonomy, so its version is part of the id
+        return f"hashing-{self.dim}-{'.'.join(map(str, self.ngrams))}-{get_taxonomy().version}"
+
+    def _features(self, text):
+        for token in skill_content_tokens(text):
+            yield token, 1.0
+            marked = f"<{token}>"
+            for n in self.ngrams:
+                for i in range(len(marked) - n + 1):
+                    yield marked[i:i + n], 0.5
+
+    def embed(self, texts):
+        """Return a (len(texts) x dim) float32 matrix of unit vectors."""
+        rows, cols, values = [], [], []
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                h = zlib.crc32(feature.encode('utf-8'))
+                rows.append(row)
+                cols.append(h % self.dim)
+                # The top bit picks the sign, so collisions cancel out on average
+                values.append(weight if h & 0x80000000 else -weight)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(matrix, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)),
+                  np.asarray(values, dtype=np.float32))
+        return _normalize(matrix)
+
+
+class SentenceTransformerEmbedder:
+    """A local sentence-transformers model, run on the CPU."""
+
+    floor = 0.25
+    ceiling = 0.75
+
+    def __init__(self, model_name, batch_size=64):
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name, device="cpu")
+        self.batch_size = batch_size
+        self.dim = self._model.get_sentence_embedding_dimension()
+        self.id = f"st-{model_name}"
+
+    def embed(self, texts):
+        vectors = self._model.encode(list(texts), batch_size=self.batch_size,
+                                     normalize_embeddings=True, convert_to_numpy=True)
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dim)
+
+
+def _normalize(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def get_embedder():
+    """Return the process-wide embedder (ATS_EMBEDDING_MODEL, else hashing)."""
+    global _default_embedder
+    if _default_embedder is None:
+        model = os.getenv("ATS_EMBEDDING_MODEL")
+        if model:
+            try:
+                _default_embedder = SentenceTransformerEmbedder(model)
+            except Exception as e:
+                logger.warning("Embedding model %s unavailable (%s); using hashed n-grams", model, e)
+        if _default_embedder is None:
+            _default_embedder = HashingEmbedder()
+    return _default_embedder
+
+
+class EmbeddingCache:
+    """Embeddings keyed by SHA-256 of (embedder id, text): an in-memory LRU, plus SQLite if ``path`` is set."""
+
+    def __init__(self, path=None, memory_items=MEMORY_EMBEDDINGS):
+        self.memory_items = memory_items
+        self.stats = {"hits": 0, "misses": 0}
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS embedding (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+            self._db.commit()
+
+    @staticmethod
+    def key(embedder, text):
+        return hashlib.sha256(f"{embedder.id}\0{text}".encode('utf-8')).hexdigest()
+
+    def _remember(self, key, vector):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def embed(self, texts, embedder=None):
+        """Embed ``texts``, computing only the ones not cached, in one batch."""
+        embedder = embedder or get_embedder()
+        keys = [self.key(embedder, text) for text in texts]
+        out = np.empty((len(texts), embedder.dim), dtype=np.float32)
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is None and self._db is not None:
+                    row = self._db.execute("SELECT vector FROM embedding WHERE key = ?", (key,)).fetchone()
+                    if row is not None:
+                        vector = np.frombuffer(row[0], dtype=np.float32)
+                        self._remember(key, vector)
+                if vector is None:
+                    missing.append(i)
+                else:
+                    self._memory.move_to_end(key)
+                    out[i] = vector
+            self.stats["hits"] += len(texts) - len(missing)
+            self.stats["misses"] += len(missing)
+        if missing:
+            vectors = embedder.embed([texts[i] for i in missing])
+            with self._lock:
+                for i, vector in zip(missing, vectors):
+                    out[i] = vector
+                    self._remember(keys[i], vector.copy())
+                if self._db is not None:
+                    self._db.executemany("INSERT OR REPLACE INTO embedding VALUES (?, ?)",
+                                         [(keys[i], vector.tobytes()) for i, vector in zip(missing, vectors)])
+                    self._db.commit()
+        return out
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+
+
+def get_default_cache():
+    """Return the process-wide in-memory embedding cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EmbeddingCache()
+    return _default_cache
+
+
+def split_requirements(job_description):
+    """Requirement sentences of a job description, in order, de-duplicated."""
+    seen = set()
+    requirements = []
+    for piece in _SPLIT.split(job_description):
+        piece = piece.strip(" \t-*•·▪:")
+        if len(content_tokens(piece)) >= MIN_REQUIREMENT_WORDS and piece.lower() not in seen:
+            seen.add(piece.lower())
+            requirements.append(piece)
+    return requirements[:MAX_REQUIREMENTS]
+
+
+def split_resume(text):
+    """Resume lines worth matching against (bullets, sentences, skill lists)."""
+    lines = []
+    for piece in _SPLIT.split(text):
+        piece = piece.strip(" \t-*•·▪")
+        if len(content_tokens(piece)) >= MIN_LINE_WORDS:
+            lines.append(piece)
+    return lines[:MAX_LINES]
+
+
+class SemanticMatch:
+    __slots__ = ("requirements", "lines", "matrix", "best", "best_line", "coverage", "score")
+
+    def __init__(self, requirements, lines, matrix, floor, ceiling):
+        self.requirements = requirements
+        self.lines = lines
+        # requirements x lines cosine similarity
+        self.matrix = matrix
+        if matrix.size:
+            self.best_line = matrix.argmax(axis=1)
+            self.best = matrix[np.arange(len(requirements)), self.best_line]
+        else:
+            self.best_line = np.zeros(len(requirements), dtype=np.intp)
+            self.best = np.zeros(len(requirements), dtype=np.float32)
+        # Per-requirement credit, 0 at ``floor`` similarity and 1 at ``ceiling``
+        self.coverage = np.clip((self.best - floor) / (ceiling - floor), 0.0, 1.0)
+        self.score = float(self.coverage.mean() * 100.0) if len(requirements) else 0.0
+
+    def pairs(self):
+        """Yield (requirement, best resume line or None, similarity) per requirement."""
+        for i, requirement in enumerate(self.requirements):
+            line = self.lines[self.best_line[i]] if self.lines else None
+            yield requirement, line, float(self.best[i])
+
+
+def semantic_match(resume, job_description, embedder=None, cache=None):
+    """Match each JD requirement to its most similar resume line.
+
+    ``resume`` is text or a ``ParsedResume``. Returns a ``SemanticMatch``
+    whose ``score`` (0-100) can stand in for "Keywords Match".
+    """
+    embedder = embedder or get_embedder()
+    cache = cache or get_default_cache()
+    requirements = split_requirements(job_description)
+    lines = split_resume(getattr(resume, "text", resume))
+    if not requirements or not lines:
+        matrix = np.zeros((len(requirements), len(lines)), dtype=np.float32)
+    else:
+        matrix = cache.embed(requirements, embedder) @ cache.embed(lines, embedder).T
+    return SemanticMatch(requirements, lines, matrix, embedder.floor, embedder.ceiling)
+
+
+class VectorIndex:
+    """Flat on-disk index of one unit vector per document, searched with a matrix multiply.
+
+    ``vectors.npy`` holds the (n x dim) float32 matrix and ``keys.json`` the
+    document keys, in row order. Adds are buffered until ``save``; adding
+    an existing key replaces its vector. ``delete`` writes through at once.
+    """
+
+    def __init__(self, path, embedder=None):
+        self.path = path
+        self.embedder = embedder or get_embedder()
+        os.makedirs(path, exist_ok=True)
+        self.keys = []
+        self.vectors = np.zeros((0, self.embedder.dim), dtype=np.float32)
+        self._pending = OrderedDict()
+        meta_path = os.path.join(path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta["embedder"] != self.embedder.id:
+                raise ValueError(f"Index was built with {meta['embedder']}, not {self.embedder.id}")
+            with open(os.path.join(path, "keys.json"), encoding='utf-8') as f:
+                self.keys = json.load(f)
+            self.vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode='r')
+            if len(self.keys) != len(self.vectors):
+                raise ValueError(f"Index at {path} has {len(self.keys)} keys for {len(self.vectors)} vectors")
+
+    def add_texts(self, items, cache=None):
+        """Embed and buffer (key, text) pairs."""
+        items = list(items)
+        if not items:
+            return
+        texts = [text for _, text in items]
+        vectors = cache.embed(texts, self.embedder) if cache is not None else self.embedder.embed(texts)
+        for (key, _), vector in zip(items, vectors):
+            self._pending[key] = vector
+
+    def delete(self, key):
+        """Drop ``key``'s vector, buffered or saved; return whether it was present."""
+        pending = self._pending.pop(key, None) is not None
+        if key not in self.keys:
+            return pending
+        keep = [i for i, k in enumerate(self.keys) if k != key]
+        self.vectors = np.asarray(self.vectors)[keep]
+        self.keys = [self.keys[i] for i in keep]
+        self._write()
+        return True
+
+    def save(self):
+        if not self._pending:
+            return
+        keep = [i for i, key in enumerate(self.keys) if key not in self._pending]
+        self.vectors = np.concatenate([np.asarray(self.vectors)[keep],
+                                       np.stack(list(self._pending.values()))]).astype(np.float32)
+        self.keys = [self.keys[i] for i in keep] + list(self._pending)
+        self._pending.clear()
+        self._write()
+
+    def _write(self):
+        # Each file is replaced whole, so a crash never leaves a truncated one
+        tmp = os.path.join(self.path, f"vectors.{os.getpid()}.tmp.npy")
+        np.save(tmp, np.asarray(self.vectors, dtype=np.float32).reshape(-1, self.embedder.dim))
+        os.replace(tmp, os.path.join(self.path, "vectors.npy"))
+        for name, value in (("keys.json", self.keys),
+                            ("meta.json", {"embedder": self.embedder.id, "dim": self.embedder.dim})):
+            tmp = os.path.join(self.path, f"{name}.{os.getpid()}.tmp")
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp, os.path.join(self.path, name))
+
+    def __len__(self):
+        return len(set(self.keys).union(self._pending))
+
+    def search(self, queries, top_k=20, cache=None):
+        """Return, for each query text, the ``top_k`` (key, cosine) pairs, best first."""
+        self.save()
+        if not len(self.keys) or not queries:
+            return [[] for _ in queries]
+        query_vectors = cache.embed(queries, self.embedder) if cache is not None else self.embedder.embed(queries)
+        scores = np.asarray(self.vectors) @ query_vectors.T
+        k = min(top_k, len(self.keys))
+        results = []
+        for column in scores.T:
+            top = np.argpartition(-column, k - 1)[:k]
+            top = top[np.argsort(-column[top])]
+            results.append([(self.keys[i], float(column[i])) for i in top])
+        return results
@@ -0,0 +1,319 @@
+"""Stateless HTTP scoring service: ``python -m ats serve``.
+
+Endpoints (all JSON responses):
+
+* ``POST /score`` -- multipart form with a ``resume`` PDF and a
+  ``job_description`` field; returns the scored record.
+* ``POST /batch`` -- the same form with any number of ``resume`` files;
+  returns ``202`` and a job id straight away.
+* ``GET /jobs/{id}`` -- progress of a batch job, and the ranked records
+  once it has finished.
+* ``GET /healthz`` and ``GET /metrics`` (Prometheus text).
+
+Extraction, OCR and scoring run in a process pool, so request threads only
+parse uploads and wait. Request bodies are streamed into the multipart
+parser in chunks, and a body whose Content-Length is over the limit is
+rejected with 413 before any of it is read. Batch jobs live in memory, so
+clients should poll the instance that accepted the job. The service is
+built on ``http.server`` and needs nothing beyond the core dependencies.
+"""
+
+import email.policy
+import io
+import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from email.parser import BytesFeedParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import metrics
+from .batch import score_pdf
+from .cache import ExtractionCache
+from .extract import MAX_PDF_BYTES
+from .profile import get_profile
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+# One PDF plus the job description and multipart framing
+MAX_SCORE_BYTES = MAX_PDF_BYTES + 256 * 1024
+MAX_BATCH_BYTES = 64 * 1024 * 1024
+READ_CHUNK = 64 * 1024
+# Finished batch jobs kept for polling
+MAX_FINISHED_JOBS = 256
+
+# Internal fields that are only needed for corpus-level scoring
+_PRIVATE_FIELDS = ("term_counts", "doc_length")
+
+# Per-process extraction cache, set once by _init_worker
+_cache = None
+
+
+class ServiceError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _init_worker(cache_path=None):
+    global _cache
+    _cache = ExtractionCache(cache_path) if cache_path else None
+
+
+def _score_upload(pdf_bytes, job_description):
+    try:
+        record = score_pdf(io.BytesIO(pdf_bytes), job_description, cache=_cache)
+    except Exception as e:
+        record = {"score": 0.0, "checks": {}, "keywords_found": [],
+                  "keywords_missing": [], "sections": [], "error": str(e)}
+    for field in _PRIVATE_FIELDS:
+        record.pop(field, None)
+    return record
+
+
+def read_multipart(stream, content_type, length):
+    """Parse a multipart/form-data body of ``length`` bytes from ``stream``.
+
+    Returns (fields, files): ``fields`` maps names to text values and
+    ``files`` is a list of (field name, filename, bytes).
+    """
+    if not content_type or not content_type.startswith("multipart/form-data"):
+        raise ServiceError(415, "expected multipart/form-data")
+    parser = BytesFeedParser(policy=email.policy.HTTP)
+    parser.feed(b"Content-Type: " + content_type.encode('latin-1') + b"\r\n\r\n")
+    if length < 0:
+        raise ServiceError(400, "invalid Content-Length")
+    remaining = length
+    while remaining:
+        chunk = stream.read(min(READ_CHUNK, remaining))
+        if not chunk:
+            raise ServiceError(400, "request body ended early")
+        parser.feed(chunk)
+        remaining -= len(chunk)
+    message = parser.close()
+    if not message.is_multipart():
+        raise ServiceError(400, "malformed multipart body")
+
+    fields = {}
+    files = []
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        payload = part.get_payload(decode=True) or b""
+        if part.get_filename() is not None:
+            files.append((name, part.get_filename(), payload))
+        elif name:
+            fields[name] = payload.decode(part.get_content_charset() or 'utf-8', errors='replace')
+    return fields, files
+
+
+class BatchJob:
+    def __init__(self, filenames):
+        self.id = uuid.uuid4().hex
+        self.filenames = filenames
+        self.records = [None] * len(filenames)
+        self.done = 0
+        self.lock = threading.Lock()
+
+    def finish(self, index, future):
+        try:
+            record = future.result()
+        except Exception as e:
+            record = {"score": 0.0, "error": str(e)}
+        with self.lock:
+            self.records[index] = {"filename": self.filenames[index], **record}
+            self.done += 1
+
+    def status(self):
+        with self.lock:
+            finished = self.done == len(self.records)
+            body = {"id": self.id, "status": "done" if finished else "running",
+                    "total": len(self.records), "done": self.done}
+            if finished:
+                ranked = sorted(self.records, key=lambda r: r["score"], reverse=True)
+                body["results"] = [{"rank": rank, **r} for rank, r in enumerate(ranked, start=1)]
+        return body
+
+
+class ScoringService:
+    def __init__(self, workers=None, cache_path=None):
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                            initargs=(cache_path,))
+        self.jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def score(self, pdf_bytes, job_description):
+        return self.executor.submit(_score_upload, pdf_bytes, job_description).result()
+
+    def submit_batch(self, uploads, job_description):
+        """Queue ``uploads`` (filename, bytes) for scoring and return the job id."""
+        # Build the JD profile here once, so its cost is not paid inside a request thread later
+        get_profile(job_description)
+        job = BatchJob([filename for filename, _ in uploads])
+        with self._lock:
+            self.jobs[job.id] = job
+            self._trim()
+        for index, (_, pdf_bytes) in enumerate(uploads):
+            future = self.executor.submit(_score_upload, pdf_bytes, job_description)
+            future.add_done_callback(lambda f, i=index: job.finish(i, f))
+        return job.id
+
+    def _trim(self):
+        finished = [key for key, job in self.jobs.items() if job.done == len(job.records)]
+        for key in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[key]
+
+    def job_status(self, job_id):
+        with self._lock:
+            job = self.jobs.get(job_id)
+        if job is None:
+            raise ServiceError(404, "unknown job")
+        return job.status()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Body limit per POST route
+BODY_LIMITS = {"/score": MAX_SCORE_BYTES, "/batch": MAX_BATCH_BYTES}
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    server_version = "ats-service"
+    # HTTP/1.1 so clients sending "Expect: 100-continue" are refused before uploading
+    protocol_version = "HTTP/1.1"
+    # Set on the server by make_server
+    service = None
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _content_length(self):
+        """The request's Content-Length, or None if it has none; 400 if it is not a non-negative integer."""
+        value = self.headers.get("Content-Length")
+        if value is None:
+            return None
+        try:
+            length = int(value)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # Keep-alive can not continue past a body of unknown length
+            self.close_connection = True
+            raise ServiceError(400, "invalid Content-Length")
+        return length
+
+    def handle_expect_100(self):
+        limit = BODY_LIMITS.get(self.path.split('?')[0])
+        try:
+            length = self._content_length()
+        except ServiceError as e:
+            self._send_json(e.status, {"error": str(e)})
+            return False
+        if limit is not None and length is not None and length > limit:
+            self.close_connection = True
+            self._send_json(413, {"error": f"request body is larger than {limit // 1024} KB"})
+            return False
+        return super().handle_expect_100()
+
+    def _read_form(self, max_bytes):
+        length = self._content_length()
+        if length is None:
+            raise ServiceError(411, "Content-Length required")
+        if length > max_bytes:
+            # Do not try to drain an oversized body; drop the connection after replying
+            self.close_connection = True
+            raise ServiceError(413, f"request body is larger than {max_bytes // 1024} KB")
+        fields, files = read_multipart(self.rfile, self.headers.get("Content-Type"), length)
+        job_description = fields.get("job_description", "").strip()
+        if not job_description:
+            raise ServiceError(400, "job_description is required")
+        resumes = [(filename, data) for name, filename, data in files if name == "resume"]
+        if not resumes:
+            raise ServiceError(400, "at least one resume file is required")
+        for filename, data in resumes:
+            if len(data) > MAX_PDF_BYTES:
+                raise ServiceError(413, f"{filename} is larger than {MAX_PDF_BYTES // 1024} KB")
+        return job_description, resumes
+
+    def _handle(self, route):
+        try:
+            with metrics.span("http", route=route):
+                status, body = getattr(self, "route_" + route)()
+        except ServiceError as e:
+            status, body = e.status, {"error": str(e)}
+        except Exception as e:
+            logger.exception("Request failed")
+            status, body = 500, {"error": str(e)}
+        metrics.inc("ats_http_requests_total", route=route, status=status)
+        self._send_json(status, body)
+
+    def do_POST(self):
+        path = self.path.split('?')[0]
+        if path == "/score":
+            self._handle("score")
+        elif path == "/batch":
+            self._handle("batch")
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if path == "/healthz":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/metrics":
+            data = metrics.REGISTRY.to_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        elif path.startswith("/jobs/"):
+            self._handle("job")
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def route_score(self):
+        job_description, resumes = self._read_form(BODY_LIMITS["/score"])
+        if len(resumes) > 1:
+            raise ServiceError(400, "POST /score takes one resume; use /batch for several")
+        filename, pdf_bytes = resumes[0]
+        return 200, {"filename": filename, **self.service.score(pdf_bytes, job_description)}
+
+    def route_batch(self):
+        job_description, resumes = self._read_form(BODY_LIMITS["/batch"])
+        job_id = self.service.submit_batch(resumes, job_description)
+        return 202, {"id": job_id, "status": "running", "total": len(resumes)}
+
+    def route_job(self):
+        return 200, self.service.job_status(self.path.split('?')[0][len("/jobs/"):])
+
+    def log_message(self, format, *args):
+        logger.info("%s %s", self.address_string(), format % args)
+
+
+def make_server(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, cache_path=None):
+    """Return a ready-to-run ``ThreadingHTTPServer`` and its ``ScoringService``."""
+    service = ScoringService(workers=workers, cache_path=cache_path)
+    handler = type("BoundScoringHandler", (ScoringHandler,), {"service": service})
+    return ThreadingHTTPServer((host, port), handler), service
+
+
+def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, cache_path=None):
+    server, service = make_server(host, port, workers, cache_path)
+    logger.warning("Scoring service listening on http://%s:%d", host, server.server_address[1])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
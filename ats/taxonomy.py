@@ -0,0 +1,287 @@
+"""Skills taxonomy: aliases mapped to canonical skill names through a token trie.
+
+A taxonomy is a list of skills, each with a canonical ``name``, a
+``category`` and ``aliases`` ("k8s" and "kube" for "kubernetes", "ml" for
+"machine learning"). Aliases are split into tokens with the same rule as
+``matcher.TOKEN_PATTERN``, so punctuation does not matter ("node.js",
+"node js" and "nodejs" can all be listed). They are compiled into a trie
+keyed by token, and ``canonicalize`` rewrites a token list in one
+left-to-right pass, taking the longest alias that starts at each token. A
+token that only differs from a known alias by trailing version digits
+("python3", "html5") is matched too.
+
+Both sides go through it: ``text.content_words`` and ``JobProfile`` for job
+descriptions, and ``matcher.tokenize`` and ``ParsedResume`` for resumes.
+
+The built-in ``DEFAULT_SKILLS`` are used unless ATS_TAXONOMY points at a
+JSON file (a list of ``{"name", "category", "aliases"}`` objects), or is
+``none`` to turn canonicalization off. The file is checked for changes at
+most every ``RELOAD_SECONDS`` and recompiled when it changes, so edits take
+effect without a restart.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+RELOAD_SECONDS = 2.0
+# Distinct tokens remembered as needing no closer look, before the memo is reset
+MAX_SCREENED = 100_000
+
+# Same token rule as matcher.TOKEN_PATTERN
+_ALIAS_TOKEN = re.compile(r"[^\W_]+")
+_END = ""
+_DIGITS = "0123456789"
+
+# (canonical name, category, aliases)
+DEFAULT_SKILLS = [
+    ("python", "language", ["py", "python3", "cpython"]),
+    ("javascript", "language", ["js", "ecmascript", "es6"]),
+    ("typescript", "language", ["ts"]),
+    ("java", "language", ["jdk", "java se"]),
+    ("golang", "language", ["go lang", "go language"]),
+    ("sql", "language", ["structured query language"]),
+    ("node.js", "framework", ["nodejs", "node js"]),
+    ("react", "framework", ["reactjs", "react js", "react.js"]),
+    ("angular", "framework", ["angularjs", "angular js"]),
+    ("vue", "framework", ["vuejs", "vue js", "vue.js"]),
+    ("django", "framework", ["django rest framework", "drf"]),
+    ("spring", "framework", ["spring boot", "springboot"]),
+    ("scikit-learn", "library", ["sklearn", "scikit learn", "scikit"]),
+    ("tensorflow", "library", ["tensor flow"]),
+    ("pytorch", "library", ["torch"]),
+    ("pandas", "library", []),
+    ("numpy", "library", ["num py"]),
+    ("postgresql", "database", ["postgres", "psql", "postgre sql"]),
+    ("mysql", "database", ["my sql"]),
+    ("mongodb", "database", ["mongo", "mongo db"]),
+    ("redis", "database", []),
+    ("elasticsearch", "database", ["elastic search"]),
+    ("kubernetes", "devops", ["k8s", "kube", "k8"]),
+    ("docker", "devops", ["dockerized", "docker compose"]),
+    ("terraform", "devops", ["tf cloud"]),
+    ("ci/cd", "devops", ["cicd", "ci cd", "continuous integration", "continuous delivery",
+                         "continuous deployment"]),
+    ("aws", "cloud", ["amazon web services", "amazon aws"]),
+    ("gcp", "cloud", ["google cloud", "google cloud platform"]),
+    ("azure", "cloud", ["microsoft azure", "ms azure"]),
+    ("machine learning", "field", ["ml"]),
+    ("deep learning", "field", ["dl"]),
+    ("artificial intelligence", "field", ["ai"]),
+    ("natural language processing", "field", ["nlp"]),
+    ("computer vision", "field", []),
+    ("data science", "field", ["data scientist"]),
+    ("rest api", "practice", ["restful", "restful api", "rest apis", "restful apis"]),
+    ("graphql", "practice", ["graph ql"]),
+    ("microservices", "practice", ["micro services", "microservice"]),
+    ("agile", "practice", ["agile methodologies", "agile development"]),
+    ("leadership", "soft skill", ["team lead", "led a team", "led teams", "lead a team", "leading teams",
+                                  "team leadership"]),
+    ("communication", "soft skill", ["communication skills", "communicator"]),
+]
+
+
+class Taxonomy:
+    def __init__(self, skills, version=None):
+        """``skills`` is an iterable of (name, category, aliases)."""
+        self.root = {}
+        self.categories = {}
+        self.size = 0
+        self.max_depth = 0
+        for name, category, aliases in skills:
+            name = sys.intern(name.lower())
+            self.categories[name] = category
+            for alias in [name, *aliases]:
+                parts = _ALIAS_TOKEN.findall(alias.lower())
+                if not parts:
+                    continue
+                node = self.root
+                for part in parts:
+                    node = node.setdefault(part, {})
+                node[_END] = name
+                self.size += 1
+                self.max_depth = max(self.max_depth, len(parts))
+        self.canonical = frozenset(self.categories)
+        # First tokens that can change something; a canonical name that starts no longer alias can not
+        self.triggers = frozenset(token for token, node in self.root.items() if node != {_END: token})
+        self.version = version
+        # Tokens already screened that can never start an alias
+        self._plain = set()
+
+    def _walk(self, tokens, start, first, breaks=None):
+        """Length and name of the longest alias at ``tokens[start]`` (whose node is ``first``)."""
+        node = first
+        best = (0, None)
+        i = start
+        n = len(tokens)
+        while True:
+            i += 1
+            name = node.get(_END)
+            if name is not None:
+                best = (i - start, name)
+            # Punctuation between alias words ("ci", "/", "cd" from word_tokenize) is skipped, as
+            # matcher.tokenize drops it
+            while i < n and not (tokens[i][0].isalnum() or tokens[i][-1].isalnum()):
+                i += 1
+            if i >= n or breaks and i in breaks:
+                return best
+            node = node.get(tokens[i])
+            if node is None:
+                return best
+
+    def _lookup_compound(self, token):
+        """Canonical name for a token like "node.js" whose parts form a whole alias."""
+        node = self.root
+        for part in _ALIAS_TOKEN.findall(token):
+            node = node.get(part)
+            if node is None:
+                return None
+        return node.get(_END)
+
+    def canonicalize(self, tokens, offsets=None, breaks=None):
+        """Replace aliases in a lowercase token list with canonical names in one pass.
+
+        Returns (tokens, offsets); a multi-token alias becomes one token at
+        the offset of its first token. ``offsets`` may be a list or an array.
+        ``breaks`` holds indices of tokens that start a new block (see
+        ``matcher.block_breaks``); an alias never runs onto one of them.
+        If nothing matches, the inputs are returned unchanged.
+        """
+        root = self.root
+        if not root:
+            return tokens, offsets
+        # Only alias starts, versioned aliases ("python3") and compound tokens ("node.js") need a
+        # closer look. Distinct tokens are screened once and remembered, so a document usually
+        # costs a few set operations here
+        vocab = set(tokens)
+        special = vocab & self.triggers
+        plain = self._plain
+        fresh = vocab - plain
+        if fresh:
+            if len(plain) + len(fresh) > MAX_SCREENED:
+                plain.clear()
+            for t in fresh - special:
+                if t.isalpha():
+                    plain.add(t)
+                elif t.rstrip(_DIGITS) in root or not t.isalnum() and self._lookup_compound(t) not in (None, t):
+                    special.add(t)
+                else:
+                    plain.add(t)
+        if not special:
+            return tokens, offsets
+        out = None
+        done = 0
+        for i in [i for i, t in enumerate(tokens) if t in special]:
+            if i < done:
+                continue
+            token = tokens[i]
+            node = root.get(token)
+            if node is None:
+                node = root.get(token.rstrip(_DIGITS))
+            if node is not None:
+                length, name = self._walk(tokens, i, node, breaks)
+            elif not token.isalnum():
+                length, name = 1, self._lookup_compound(token)
+            else:
+                continue
+            if name is None or (length == 1 and name == token):
+                continue
+            if out is None:
+                out = []
+                out_offsets = offsets[:0] if offsets is not None else None
+            out.extend(tokens[done:i])
+            out.append(name)
+            if out_offsets is not None:
+                out_offsets.extend(offsets[done:i + 1])
+            done = i + length
+        if out is None:
+            return tokens, offsets
+        out.extend(tokens[done:])
+        if out_offsets is not None:
+            out_offsets.extend(offsets[done:])
+        return out, out_offsets
+
+    def category(self, name):
+        return self.categories.get(name)
+
+
+def load_taxonomy(path):
+    """Compile a JSON taxonomy file (a list of {"name", "category", "aliases"})."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    entries = json.loads(raw)
+    if isinstance(entries, dict):
+        entries = entries.get("skills", [])
+    skills = [(e["name"], e.get("category"), e.get("aliases", [])) for e in entries]
+    return Taxonomy(skills, version=hashlib.sha256(raw).hexdigest()[:16])
+
+
+def builtin_taxonomy():
+    return Taxonomy(DEFAULT_SKILLS, version=hashlib.sha256(repr(DEFAULT_SKILLS).encode('utf-8')).hexdigest()[:16])
+
+
+_current = None
+_source = None
+_checked = 0.0
+_lock = threading.Lock()
+
+
+def _source_of(path):
+    """What the taxonomy for ATS_TAXONOMY=``path`` is built from; changes when the file does."""
+    if not path or path.lower() == "none":
+        return (path,)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (path, None)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def get_taxonomy():
+    """Return the active taxonomy, reloading ATS_TAXONOMY if the file changed.
+
+    If the file cannot be loaded, the taxonomy already in use is kept (the
+    built-in one if nothing was loaded yet).
+    """
+    global _current, _source, _checked
+    path = os.getenv("ATS_TAXONOMY", "")
+    now = time.monotonic()
+    if _current is not None and _source[0] == path and now - _checked < RELOAD_SECONDS:
+        return _current
+    with _lock:
+        _checked = now
+        source = _source_of(path)
+        if source == _source:
+            return _current
+        started = time.perf_counter()
+        try:
+            if not path:
+                taxonomy = builtin_taxonomy()
+            elif path.lower() == "none":
+                taxonomy = Taxonomy([], version="none")
+            else:
+                taxonomy = load_taxonomy(path)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error("Could not load skills taxonomy %s: %s", path, e)
+            taxonomy = _current or builtin_taxonomy()
+        else:
+            logger.info("Loaded skills taxonomy %s: %d aliases in %.0f ms", path or "(built-in)", taxonomy.size,
+                        (time.perf_counter() - started) * 1000)
+        _current, _source = taxonomy, source
+        return _current
+
+
+def set_taxonomy(taxonomy):
+    """Use ``taxonomy`` until ATS_TAXONOMY changes (mainly for embedding and tests)."""
+    global _current, _source, _checked
+    with _lock:
+        _current = taxonomy
+        _source = (os.getenv("ATS_TAXONOMY", ""), "set")
+        _checked = float("inf")
@@ -0,0 +1,144 @@
+"""Text normalization shared by the analyzer: stopwords, tokenizers, section patterns.
+
+Everything here is built once at import time and reused for every document.
+
+The English stopword list is vendored from NLTK's ``stopwords`` corpus so
+nothing has to be downloaded at start-up. Tokenization uses NLTK's
+``word_tokenize`` when it and its punkt data are installed locally (point
+NLTK_DATA at a bundled directory in containers), and otherwise falls back to
+an offline regex tokenizer. Set ATS_TOKENIZER to ``nltk`` or ``regex`` to
+force one; the choice is made lazily on first use, so importing this module
+never imports NLTK.
+"""
+
+import logging
+import os
+import re
+from collections import Counter
+from multiprocessing import Pool
+
+from .taxonomy import get_taxonomy
+
+logger = logging.getLogger(__name__)
+
+# NLTK english stopwords
+STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your yours
+yourself yourselves he him his himself she she's her hers herself it it's its
+itself they them their theirs themselves what which who whom this that that'll
+these those am is are was were be been being have has had having do does did
+doing a an the and but if or because as until while of at by for with about
+against between into through during before after above below to from up down in
+out on off over under again further then once here there when where why how all
+any both each few more most other some such no nor not only own same so than too
+very s t can will just don don't should should've now d ll m o re ve y ain aren
+aren't couldn couldn't didn didn't doesn doesn't hadn hadn't hasn hasn't haven
+haven't isn isn't ma mightn mightn't mustn mustn't needn needn't shan shan't
+shouldn shouldn't wasn wasn't weren weren't won won't wouldn wouldn't
+""".split())
+
+# Common resume sections
+RESUME_SECTIONS = [
+    'experience', 'education', 'skills', 'summary', 
+    'work experience', 'projects', 'certifications',
+    'languages', 'interests', 'awards', 'publications'
+]
+
+_SECTION_NAMES = "|".join(re.escape(s) for s in sorted(RESUME_SECTIONS, key=len, reverse=True))
+
+# A heading is a line made of a section name with at most two extra words on
+# either side ("Professional Experience", "Technical Skills:"), optionally
+# followed by inline content after a colon ("Skills: Python, SQL")
+SECTION_HEADING = re.compile(
+    r"^[^\w\n]*(?:[a-z&]+[ \t]+){0,2}?(" + _SECTION_NAMES + r")(?:[ \t]+[a-z&]+){0,2}[^\w\n]*(?::.*)?$",
+    re.IGNORECASE | re.MULTILINE)
+
+# Words, contractions split off as separate tokens, and single punctuation marks
+_REGEX_TOKEN = re.compile(r"[^\W_]+(?:[-.][^\W_]+)*|n't|'\w+|[^\w\s]")
+
+_tokenizer = None
+
+
+def regex_tokenize(text):
+    """Offline approximation of NLTK's ``word_tokenize``."""
+    return _REGEX_TOKEN.findall(text)
+
+
+def _load_tokenizer():
+    choice = os.getenv("ATS_TOKENIZER", "auto")
+    if choice != "regex":
+        try:
+            from nltk.tokenize import word_tokenize as nltk_tokenize
+            nltk_tokenize("probe")  # raises LookupError if punkt data is missing
+            return nltk_tokenize
+        except (ImportError, LookupError):
+            if choice == "nltk":
+                raise
+            logger.info("NLTK punkt data not available; using the offline regex tokenizer")
+    return regex_tokenize
+
+
+def word_tokenize(text):
+    """Tokenize with the configured tokenizer, choosing it on first call."""
+    global _tokenizer
+    if _tokenizer is None:
+        _tokenizer = _load_tokenizer()
+    return _tokenizer(text)
+
+
+def is_content_word(token):
+    return token.isalnum() and token not in STOPWORDS and len(token) > 2
+
+
+def skill_tokens(text):
+    """Lowercase and tokenize ``text`` and canonicalize skill aliases.
+
+    Punctuation tokens are kept; the taxonomy skips them inside an alias,
+    so "CI/CD" canonicalizes as it does through ``matcher.tokenize``.
+    """
+    return get_taxonomy().canonicalize(word_tokenize(text.lower()))[0]
+
+
+def content_words(text):
+    """Lowercase, tokenize, canonicalize skill aliases and drop stopwords, punctuation and short tokens.
+
+    Canonical skill names ("machine learning", "aws") are always kept.
+    """
+    stop = STOPWORDS
+    skills = get_taxonomy().canonical
+    return [t for t in skill_tokens(text) if len(t) > 2 and t.isalnum() and t not in stop or t in skills]
+
+
+def rank_words(words, top_n=20):
+    """Return the ``top_n`` most frequent words as (word, count) pairs.
+
+    Ties keep first-occurrence order, matching a stable sort by count.
+    """
+    return Counter(words).most_common(top_n)
+
+
+def extract_keywords(text, top_n=20):
+    """Extract the top keywords from text."""
+    return rank_words(content_words(text), top_n)
+
+
+def extract_keywords_many(texts, top_n=20, workers=None, chunksize=64):
+    """Extract keywords for many texts; with ``workers`` > 1 uses a process pool."""
+    if workers and workers > 1:
+        with Pool(processes=workers) as pool:
+            return pool.starmap(extract_keywords, ((text, top_n) for text in texts), chunksize=chunksize)
+    return [extract_keywords(text, top_n) for text in texts]
+
+
+def find_headings(text):
+    """Yield (section, line_start, body_start) for each section heading line in ``text``.
+
+    ``body_start`` is the end of the heading line, or just after the colon
+    for inline headings like "Skills: Python, SQL". The section word must be
+    capitalized ("Skills", "SKILLS"), which keeps sentences like "i have
+    experience" from being taken as headings.
+    """
+    for match in SECTION_HEADING.finditer(text):
+        if match.group(1)[0].isupper():
+            colon = text.find(':', match.end(1), match.end())
+            yield match.group(1).lower(), match.start(), match.end() if colon < 0 else colon + 1
@@ -0,0 +1,113 @@
+"""Throughput, memory and text fidelity of each installed PDF backend.
+
+Runs every backend from ``ats.backends`` over the generated sample corpus
+(or a directory of ``name.pdf`` + ``name.txt`` pairs) in its own process so
+memory figures do not bleed into each other. Fidelity is token-level F1
+against the ground-truth text, plus the share of documents that
+``looks_usable`` accepts.
+
+    python benchmarks/bench_backends.py [--docs 40] [--corpus DIR] [--repeat 3]
+"""
+
+import argparse
+import logging
+import os
+import re
+import resource
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats import backends  # noqa: E402
+from ats.extract import iter_pages  # noqa: E402
+from sample_pdfs import corpus  # noqa: E402
+
+TOKEN = re.compile(r"[^\W_]+")
+
+# Slow-page warnings are expected under tracemalloc
+logging.getLogger("ats").setLevel(logging.ERROR)
+
+
+def load_corpus(directory):
+    samples = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".pdf"):
+            continue
+        stem = os.path.join(directory, name[:-4])
+        with open(stem + ".pdf", 'rb') as f:
+            pdf = f.read()
+        with open(stem + ".txt", encoding='utf-8') as f:
+            samples.append((name[:-4], pdf, f.read()))
+    return samples
+
+
+def token_f1(expected, actual):
+    want = Counter(TOKEN.findall(expected.lower()))
+    got = Counter(TOKEN.findall(actual.lower()))
+    overlap = sum((want & got).values())
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / sum(got.values()), overlap / sum(want.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def extract(name, pdf):
+    document = backends.open_document(name, pdf)
+    return "\n".join(page.text for page in iter_pages(document, max_pages=None, max_seconds=None))
+
+
+def run_backend(name, samples, repeat):
+    """Measure one backend; meant to run in a fresh worker process."""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    pages = sum(backends.open_document(name, pdf).page_count for _, pdf, _ in samples)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        texts = [extract(name, pdf) for _, pdf, _ in samples]
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    for _, pdf, _ in samples:
+        extract(name, pdf)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    scores = [token_f1(truth, text) for (_, _, truth), text in zip(samples, texts)]
+    return {
+        "backend": name,
+        "docs_per_sec": len(samples) / best,
+        "pages_per_sec": pages / best,
+        "py_peak_kb": peak / 1024,
+        "rss_growth_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before,
+        "token_f1": sum(scores) / len(scores),
+        "min_f1": min(scores),
+        "usable": sum(backends.looks_usable(t) for t in texts) / len(texts),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--docs', type=int, default=40)
+    parser.add_argument('--corpus', help="directory of name.pdf + name.txt pairs (default: generated)")
+    parser.add_argument('--backend', action='append', help="limit to these backends")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    samples = load_corpus(args.corpus) if args.corpus else corpus(args.docs)
+    names = args.backend or backends.available_backends()
+    print(f"{len(samples)} documents; backends: {', '.join(names)}")
+    print(f"{'backend':>9} {'docs/s':>8} {'pages/s':>8} {'py peak':>9} {'rss +':>9} {'F1':>6} {'min F1':>6} {'usable':>6}")
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            r = pool.submit(run_backend, name, samples, args.repeat).result()
+        print(f"{r['backend']:>9} {r['docs_per_sec']:8.1f} {r['pages_per_sec']:8.1f} "
+              f"{r['py_peak_kb']:7.0f}KB {r['rss_growth_kb']:7.0f}KB "
+              f"{r['token_f1']:6.3f} {r['min_f1']:6.3f} {r['usable']:6.0%}")
+
+
+if __name__ == "__main__":
+    main()
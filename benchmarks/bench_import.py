@@ -0,0 +1,66 @@
+"""Import-time budget check for the analyzer core.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter,
+reports the cumulative import time and the slowest imports, and exits
+non-zero if the budget is exceeded or a lazily loaded dependency (OCR, LLM,
+NLTK) was imported eagerly.
+
+    python benchmarks/bench_import.py [--module ats] [--budget-ms 250]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must not be imported just by importing the core
+LAZY_MODULES = ("nltk", "pytesseract", "pdf2image", "PIL", "google.generativeai")
+
+
+def measure(module, runs):
+    """Return ([(cumulative_us, name)], cumulative_us of ``module``) for the fastest run."""
+    env = dict(os.environ, ATS_TOKENIZER=os.getenv("ATS_TOKENIZER", "regex"))
+    best = None
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                              cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+        rows = []
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            rows.append((int(cumulative), name.strip()))
+        total = next(us for us, name in rows if name == module)
+        if best is None or total < best[1]:
+            best = (rows, total)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--module', default='ats')
+    parser.add_argument('--budget-ms', type=float, default=250.0)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    rows, total = measure(args.module, args.runs)
+    print(f"import {args.module}: {total / 1000:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failed = False
+    eager = sorted({name for _, name in rows if name in LAZY_MODULES})
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(eager)}")
+        failed = True
+    if total / 1000 > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
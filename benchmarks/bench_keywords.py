@@ -0,0 +1,68 @@
+"""Per-document cost of keyword extraction, before and after ats.text.
+
+"before" reproduces the original ``extract_keywords``: the stopword set is
+rebuilt and words are counted with a dict loop on every call. "after" uses
+the module-level resources in ``ats.text``, one call at a time and through
+``extract_keywords_many``.
+
+    python benchmarks/bench_keywords.py [--docs 500] [--words 800] [--workers N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats import text  # noqa: E402
+
+
+def original_extract_keywords(doc, top_n=20):
+    stop_words = set(list(text.STOPWORDS))
+    words = text.word_tokenize(doc.lower())
+    words = [word for word in words if word.isalnum() and word not in stop_words and len(word) > 2]
+    word_freq = {}
+    for word in words:
+        word_freq[word] = word_freq.get(word, 0) + 1
+    return sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
+
+
+def corpus(docs, words, seed=11):
+    rng = random.Random(seed)
+    vocab = [f"term{i}" for i in range(3000)] + sorted(text.STOPWORDS)
+    return [" ".join(rng.choice(vocab) for _ in range(words)) + "." for _ in range(docs)]
+
+
+def per_doc_us(func, docs, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(docs)
+        best = min(best, time.perf_counter() - start)
+    return best / len(docs) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--docs', type=int, default=500)
+    parser.add_argument('--words', type=int, default=800)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    docs = corpus(args.docs, args.words)
+    assert [original_extract_keywords(d) for d in docs[:20]] == text.extract_keywords_many(docs[:20])
+
+    runs = [
+        ("before", lambda ds: [original_extract_keywords(d) for d in ds]),
+        ("after", lambda ds: [text.extract_keywords(d) for d in ds]),
+        ("after (many)", lambda ds: text.extract_keywords_many(ds, workers=args.workers)),
+    ]
+    for name, func in runs:
+        print(f"{name:>13}: {per_doc_us(func, docs, args.repeat):9.1f} us/doc  ({args.docs} docs x {args.words} words)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compare the single-pass KeywordMatcher with per-keyword substring scans.
+
+    python benchmarks/bench_matcher.py [--terms 300] [--words 2000] [--repeat 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.matcher import KeywordMatcher  # noqa: E402
+
+
+def synthetic(terms, words, seed=7):
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyz"
+    vocab = ["".join(rng.choice(alphabet) for _ in range(rng.randint(3, 10))) for _ in range(5000)]
+    keywords = rng.sample(vocab, terms)
+    resume = " ".join(rng.choice(vocab) for _ in range(words))
+    return keywords, resume
+
+
+def substring_scan(keywords, resume):
+    # The original approach: lowercase and scan the whole resume per keyword
+    found = [kw for kw in keywords if kw in resume.lower()]
+    missing = [kw for kw in keywords if kw not in resume.lower()]
+    return found, missing
+
+
+def single_pass(keywords, resume):
+    result = KeywordMatcher(keywords).match(resume)
+    return result.found, result.missing
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--terms', type=int, default=300)
+    parser.add_argument('--words', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    keywords, resume = synthetic(args.terms, args.words)
+    for name, func in (("substring scan", substring_scan), ("single pass", single_pass)):
+        seconds = min(timeit.repeat(lambda: func(keywords, resume), number=1, repeat=args.repeat))
+        print(f"{name:>15}: {seconds * 1000:8.2f} ms  ({args.terms} terms, {args.words} words)")
+
+
+if __name__ == "__main__":
+    main()
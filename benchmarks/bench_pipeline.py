@@ -0,0 +1,201 @@
+"""Reproducible latency and memory benchmark for the scoring pipeline, with a regression gate.
+
+``run`` times ``extract_text_from_pdf``, ``extract_keywords``,
+``analyze_resume_sections``, ``perform_ats_checks`` and the end-to-end path
+(extract + score) on generated 1-page, 5-page and scanned resumes against a
+short and a long job description, and writes the results to a JSON file.
+Each case reports the median and p95 latency over ``--repeat`` runs and the
+peak Python allocation (tracemalloc, measured in a separate pass). The
+extraction cache is never used, so every run parses the PDF.
+
+``compare`` reads two result files and exits non-zero if any case got
+slower (median) or larger (peak memory) by more than ``--threshold``.
+
+    python benchmarks/bench_pipeline.py run --out bench.json [--repeat 20]
+    python benchmarks/bench_pipeline.py compare baseline.json bench.json [--threshold 0.15]
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats import ATSAnalyzer, metrics  # noqa: E402
+from ats.backends import available_backends  # noqa: E402
+from sample_pdfs import SKILLS, resume_lines, write_pdf, write_scanned_pdf  # noqa: E402
+
+RESULTS_VERSION = 1
+SEED = 7
+
+# Timings below this are too noisy to gate on
+MIN_GATED_MS = 0.05
+
+# Empty extractions and missing OCR tools are expected on minimal installs
+logging.getLogger("ats").setLevel(logging.CRITICAL)
+
+
+def job_description(rng, words):
+    filler = ["team", "role", "experience", "build", "maintain", "production", "systems",
+              "customers", "years", "strong", "design", "ownership", "remote", "growth"]
+    text = [rng.choice(SKILLS if rng.random() < 0.4 else filler) for _ in range(words)]
+    return "Senior Engineer. Requirements: " + " ".join(text) + "."
+
+
+def fixtures(seed=SEED):
+    """Deterministic resumes (name -> (pdf_bytes, text)) and job descriptions (name -> text)."""
+    rng = random.Random(seed)
+    resumes = {}
+    for pages in (1, 5):
+        lines = resume_lines(rng, pages)
+        resumes[f"{pages}-page"] = (write_pdf(lines), "\n".join(lines))
+    # Scanned resumes have no text layer; ground truth is the 1-page text
+    resumes["scanned"] = (write_scanned_pdf(1, seed=seed), resumes["1-page"][1])
+    jds = {"short-jd": job_description(rng, 80), "long-jd": job_description(rng, 600)}
+    return resumes, jds
+
+
+def cases(resumes, jds):
+    """Yield (case_name, zero-argument callable)."""
+    for name, (pdf, _) in resumes.items():
+        yield f"extract_text_from_pdf[{name}]", lambda pdf=pdf: ATSAnalyzer.extract_text_from_pdf(io.BytesIO(pdf))
+    for name, (_, text) in resumes.items():
+        if name == "scanned":
+            continue
+        yield f"extract_keywords[{name}]", lambda text=text: ATSAnalyzer.extract_keywords(text)
+        yield f"analyze_resume_sections[{name}]", lambda text=text: ATSAnalyzer.analyze_resume_sections(text)
+        for jd_name, jd in jds.items():
+            yield (f"perform_ats_checks[{name},{jd_name}]",
+                   lambda text=text, jd=jd: ATSAnalyzer.perform_ats_checks(text, jd))
+    for jd_name, jd in jds.items():
+        yield f"extract_keywords[{jd_name}]", lambda jd=jd: ATSAnalyzer.extract_keywords(jd)
+    for name, (pdf, text) in resumes.items():
+        for jd_name, jd in jds.items():
+            def end_to_end(pdf=pdf, text=text, jd=jd):
+                # Score the ground truth when no backend or OCR tool could read the PDF
+                extracted = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(pdf))
+                return ATSAnalyzer.perform_ats_checks(extracted or text, jd)
+            yield f"end_to_end[{name},{jd_name}]", end_to_end
+
+
+def measure(func, repeat, warmup=2):
+    for _ in range(warmup):
+        func()
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "median_ms": round(statistics.median(times), 4),
+        "p95_ms": round(times[min(len(times) - 1, int(len(times) * 0.95))], 4),
+        "min_ms": round(times[0], 4),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def cmd_run(args):
+    resumes, jds = fixtures(args.seed)
+    metrics.REGISTRY.reset()
+    results = {}
+    for name, func in cases(resumes, jds):
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(func, args.repeat)
+        r = results[name]
+        print(f"{name:<55} {r['median_ms']:9.3f} ms  p95 {r['p95_ms']:9.3f} ms  {r['peak_kb']:8.1f} KB")
+
+    report = {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backends": available_backends(),
+            "tokenizer": os.getenv("ATS_TOKENIZER", "auto"),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+        "stages": metrics.REGISTRY.stage_summary(),
+    }
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Wrote {len(results)} cases to {args.out}")
+    return 0
+
+
+def compare(baseline, current, threshold):
+    """Return [(case, field, old, new, change)] for cases that regressed past ``threshold``."""
+    regressions = []
+    for name, new in sorted(current["results"].items()):
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        for field in ("median_ms", "peak_kb"):
+            if field == "median_ms" and old[field] < MIN_GATED_MS:
+                continue
+            if old[field] and (new[field] - old[field]) / old[field] > threshold:
+                regressions.append((name, field, old[field], new[field], new[field] / old[field] - 1))
+    return regressions
+
+
+def cmd_compare(args):
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+    for key in ("python", "backends", "tokenizer"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"warning: {key} differs: {baseline['meta'].get(key)} vs {current['meta'].get(key)}")
+    missing = sorted(set(baseline["results"]) - set(current["results"]))
+    if missing:
+        print(f"warning: {len(missing)} baseline cases not in the current run")
+
+    regressions = compare(baseline, current, args.threshold)
+    for name, field, old, new, change in regressions:
+        print(f"REGRESSION {name} {field}: {old} -> {new} ({change:+.0%})")
+    if regressions:
+        print(f"FAIL: {len(regressions)} regressions over {args.threshold:.0%}")
+        return 1
+    print(f"OK: no regressions over {args.threshold:.0%} in {len(current['results'])} cases")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run = sub.add_parser('run', help="run the suite and write a JSON result file")
+    run.add_argument('--out', default='bench_pipeline.json')
+    run.add_argument('--repeat', type=int, default=20)
+    run.add_argument('--seed', type=int, default=SEED)
+    run.add_argument('--filter', help="only run cases whose name contains this string")
+    run.set_defaults(func=cmd_run)
+
+    cmp = sub.add_parser('compare', help="flag regressions between two result files")
+    cmp.add_argument('baseline')
+    cmp.add_argument('current')
+    cmp.add_argument('--threshold', type=float, default=0.15, help="allowed relative slowdown (0.15 = 15%%)")
+    cmp.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
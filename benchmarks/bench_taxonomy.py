@@ -0,0 +1,91 @@
+"""Compile time, memory and lookup cost of a large skills taxonomy.
+
+Builds a synthetic taxonomy of ``--skills`` canonical names with a few
+single- and multi-word aliases each, then times canonicalizing a resume-sized
+token stream with it, next to the built-in taxonomy and no taxonomy at all.
+
+    python benchmarks/bench_taxonomy.py [--skills 50000] [--tokens 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.matcher import TOKEN_PATTERN  # noqa: E402
+from ats.taxonomy import Taxonomy, builtin_taxonomy  # noqa: E402
+from sample_pdfs import resume_lines  # noqa: E402
+
+
+def synthetic_skills(count, seed=5):
+    rng = random.Random(seed)
+    skills = []
+    for i in range(count):
+        name = f"skill{i}"
+        aliases = [f"sk{i}", f"skill {i}", f"the {name} framework"]
+        if rng.random() < 0.3:
+            aliases.append(f"{name} version {rng.randint(1, 9)}")
+        skills.append((name, f"category{i % 40}", aliases))
+    return skills
+
+
+def token_stream(count, skills, seed=5):
+    rng = random.Random(seed)
+    words = TOKEN_PATTERN.findall(" ".join(resume_lines(rng, 3)).lower())
+    # About one token in ten starts an alias
+    tokens = []
+    while len(tokens) < count:
+        if rng.random() < 0.1:
+            tokens.extend(TOKEN_PATTERN.findall(rng.choice(rng.choice(skills)[2])))
+        else:
+            tokens.append(rng.choice(words))
+    return tokens[:count]
+
+
+def per_call_us(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--skills', type=int, default=50000)
+    parser.add_argument('--tokens', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    skills = synthetic_skills(args.skills)
+    start = time.perf_counter()
+    large = Taxonomy(skills, version="synthetic")
+    compile_ms = (time.perf_counter() - start) * 1000
+    tracemalloc.start()
+    kept = Taxonomy(skills, version="synthetic")  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"compiled {large.size} aliases for {len(skills)} skills in {compile_ms:.0f} ms, "
+          f"{size / 1024 / 1024:.1f} MB")
+
+    tokens = token_stream(args.tokens, skills)
+    offsets = list(range(len(tokens)))
+    builtin = builtin_taxonomy()
+    empty = Taxonomy([], version="none")
+    runs = [
+        ("none", lambda: empty.canonicalize(tokens, offsets)),
+        ("built-in", lambda: builtin.canonicalize(tokens, offsets)),
+        (f"{args.skills} skills", lambda: large.canonicalize(tokens, offsets)),
+    ]
+    for name, func in runs:
+        us = per_call_us(func, args.repeat)
+        print(f"{name:>14}: {us:9.1f} us per {len(tokens)} tokens  ({us * 1000 / len(tokens):6.1f} ns/token)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Deterministic sample resume PDFs with known ground-truth text.
+
+The PDFs are written by hand (Helvetica, one text object per page), so the
+corpus needs no PDF library and is byte-identical on every run. Each sample
+is returned as ``(name, pdf_bytes, text)`` where ``text`` is exactly what was
+drawn, one line per text line. ``write_scanned_pdf`` produces image-only
+pages with no text layer, which sends extraction down the OCR path.
+
+    python benchmarks/sample_pdfs.py OUT_DIR [--docs 40] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ats.report import serialize_pdf  # noqa: E402
+
+SKILLS = [
+    "python", "java", "sql", "docker", "kubernetes", "aws", "terraform", "react",
+    "typescript", "spark", "airflow", "pandas", "tensorflow", "linux", "git",
+    "postgresql", "redis", "kafka", "graphql", "django", "flask", "leadership",
+    "communication", "agile", "scrum", "testing", "security", "analytics",
+]
+VERBS = ["Built", "Led", "Designed", "Migrated", "Automated", "Reduced", "Improved", "Launched"]
+NOUNS = ["pipeline", "service", "dashboard", "platform", "API", "deployment", "test suite", "data model"]
+SECTIONS = ["Summary", "Experience", "Education", "Skills", "Projects", "Certifications"]
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+LINES_PER_PAGE = 46
+FONT_SIZE, LEADING = 10, 15
+
+
+def resume_lines(rng, pages):
+    """Lines of a plausible resume long enough to fill ``pages`` pages."""
+    name = f"Candidate {rng.randrange(10000):04d}"
+    lines = [name, f"Email: {name.split()[1]}@example.com  Phone: +1 555 {rng.randrange(1000, 9999)} 0100"]
+    while len(lines) < pages * LINES_PER_PAGE:
+        lines.append(rng.choice(SECTIONS))
+        for _ in range(rng.randint(4, 9)):
+            skills = ", ".join(rng.sample(SKILLS, 3))
+            lines.append(f"- {rng.choice(VERBS)} a {rng.choice(NOUNS)} using {skills} "
+                         f"for {rng.randint(2, 40)} teams in {rng.randint(2015, 2024)}.")
+    return lines[:pages * LINES_PER_PAGE]
+
+
+def _escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(lines):
+    """Minimal PDF 1.4 with ``lines`` drawn top to bottom, paginated."""
+    pages = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    # 1 catalog, 2 page tree, 3 font, then a (page, content) pair per page
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    kids = []
+    for page_lines in pages:
+        body = [f"BT /F1 {FONT_SIZE} Tf {LEADING} TL 60 {PAGE_HEIGHT - 60} Td"]
+        body += [f"({_escape(line)}) Tj T*" for line in page_lines]
+        body.append("ET")
+        stream = "\n".join(body).encode("latin-1")
+        page_id, content_id = len(objects) + 1, len(objects) + 2
+        kids.append(f"{page_id} 0 R")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>".encode())
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+    return serialize_pdf(objects)
+
+
+def write_scanned_pdf(pages=1, dpi=100, seed=0):
+    """Image-only PDF: each page is a grayscale bitmap of text-like bars, no text layer."""
+    rng = random.Random(seed)
+    width, height = PAGE_WIDTH * dpi // 72, PAGE_HEIGHT * dpi // 72
+    # 1 catalog, 2 page tree, then (page, content, image) per page
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None]
+    kids = []
+    for _ in range(pages):
+        margin, pitch, ink = dpi // 2, dpi * LEADING // 72, dpi * FONT_SIZE // 144
+        lengths = [rng.randrange(width // 3, width - dpi) for _ in range(LINES_PER_PAGE)]
+        rows = []
+        for y in range(height):
+            line, offset = divmod(y - margin, pitch)
+            end = lengths[line] if 0 <= line < LINES_PER_PAGE and offset < ink else 0
+            # Each row starts with PNG filter type 0 (None), as /Predictor 15 expects
+            rows.append(b"\x00" + b"\xff" * margin + b"\x28" * max(0, end - margin)
+                        + b"\xff" * (width - max(margin, end)))
+        image = zlib.compress(b"".join(rows))
+        page_id, content_id, image_id = len(objects) + 1, len(objects) + 2, len(objects) + 3
+        kids.append(f"{page_id} 0 R")
+        content = f"q {PAGE_WIDTH} 0 0 {PAGE_HEIGHT} 0 0 cm /Im0 Do Q".encode()
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+                       f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {content_id} 0 R >>".encode())
+        objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        objects.append(f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+                       f"/ColorSpace /DeviceGray /BitsPerComponent 8 /Filter /FlateDecode "
+                       f"/DecodeParms << /Predictor 15 /Columns {width} >> "
+                       f"/Length {len(image)} >>\nstream\n".encode() + image + b"\nendstream")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode()
+    return serialize_pdf(objects)
+
+
+def corpus(docs=40, seed=7, pages=(1, 1, 2, 3, 5)):
+    """``docs`` samples cycling through the given page counts."""
+    rng = random.Random(seed)
+    samples = []
+    for i in range(docs):
+        lines = resume_lines(rng, pages[i % len(pages)])
+        samples.append((f"resume-{i:03d}", write_pdf(lines), "\n".join(lines)))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('out_dir')
+    parser.add_argument('--docs', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for name, pdf, text in corpus(args.docs, args.seed):
+        with open(os.path.join(args.out_dir, name + ".pdf"), 'wb') as f:
+            f.write(pdf)
+        with open(os.path.join(args.out_dir, name + ".txt"), 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(f"Wrote {args.docs} samples to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import pytest
+
+from ats import taxonomy
+
+
+@pytest.fixture
+def isolated_taxonomy(monkeypatch):
+    """Let a test call ``set_taxonomy`` or change ATS_TAXONOMY; the active taxonomy is restored afterwards."""
+    for name in ("_current", "_source", "_checked"):
+        monkeypatch.setattr(taxonomy, name, getattr(taxonomy, name))
+    return taxonomy
@@ -0,0 +1,86 @@
+import io
+
+import pytest
+
+from ats import analyzer
+from ats.analyzer import ATSAnalyzer
+from ats.cache import ExtractionCache, content_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite3"))
+    yield cache
+    cache.close()
+
+
+class TextDocument:
+    """A one-page "PDF" whose text is the file's bytes."""
+    def __init__(self, data):
+        self.data = data
+        self.page_count = 1
+
+    def page_text(self, number):
+        return f"Resume text: {self.data.decode()}"
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    opened = []
+
+    def open_document(name, data):
+        opened.append(data)
+        return TextDocument(data)
+
+    monkeypatch.setattr(analyzer, "candidate_backends", lambda backend=None: ["fake"])
+    monkeypatch.setattr(analyzer, "open_document", open_document)
+    return opened
+
+
+def test_miss_then_hit(cache):
+    assert cache.get("missing") is None
+    cache.put("key", "Python developer")
+    assert cache.get("key") == "Python developer"
+    assert cache.stats["misses"] == 1 and cache.stats["memory_hits"] == 1
+
+
+def test_hit_from_disk_after_reopen(tmp_path, cache):
+    cache.put("key", "Python developer " * 100)
+    reopened = ExtractionCache(str(tmp_path / "cache.sqlite3"))
+    assert reopened.get("key") == "Python developer " * 100
+    assert reopened.stats["disk_hits"] == 1
+    assert reopened.get("key") and reopened.stats["memory_hits"] == 1
+    reopened.close()
+
+
+def test_key_depends_on_bytes_and_settings():
+    key = content_key(b"%PDF-1", dpi=200, pages=10)
+    assert key == content_key(b"%PDF-1", pages=10, dpi=200)
+    assert key != content_key(b"%PDF-2", dpi=200, pages=10)
+    assert key != content_key(b"%PDF-1", dpi=300, pages=10)
+
+
+def test_extraction_is_cached_and_changed_bytes_invalidate_it(cache, opened):
+    first = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"version one"), cache=cache)
+    assert ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"version one"), cache=cache) == first
+    assert opened == [b"version one"]
+
+    second = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"version two"), cache=cache)
+    assert second == "Resume text: version two"
+    assert opened == [b"version one", b"version two"]
+    # A different extraction setting is a different entry too
+    ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"version two"), cache=cache, max_pages=1)
+    assert len(opened) == 3
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ExtractionCache(str(tmp_path / "small.sqlite3"), max_bytes=100, memory_items=1)
+    for key in ("a", "b", "c"):
+        # Incompressible enough that two entries do not fit
+        cache.put(key, "".join(chr(0x4e00 + (i * 7919 + ord(key)) % 20000) for i in range(20)))
+    assert cache.stats["evictions"] >= 1
+    assert cache.get("c") is not None
+    assert cache.get("a") is None
+    cache.clear()
+    assert cache.get("c") is None
+    cache.close()
@@ -0,0 +1,95 @@
+import json
+import random
+
+import pytest
+
+from ats import batch
+from ats.analyzer import ATSAnalyzer
+from ats.dedup import DuplicateIndex, minhash, shingles, similarity
+from ats.extract import read_limited
+
+WORDS = ("python django aws docker kubernetes sql team lead built designed shipped services platform data "
+         "pipelines customers reliable scalable backend engineer mentored reduced latency improved").split()
+
+
+def resume(seed, words=300):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def edit(text, changes, seed=0):
+    rng = random.Random(seed)
+    words = text.split()
+    for _ in range(changes):
+        words[rng.randrange(len(words))] = "edited"
+    return " ".join(words)
+
+
+def test_similarity_estimates_jaccard():
+    a = resume(1)
+    b = edit(a, 5)
+    exact = len(shingles(a) & shingles(b)) / len(shingles(a) | shingles(b))
+    assert similarity(minhash(a), minhash(b)) == pytest.approx(exact, abs=0.1)
+    assert similarity(minhash(a), minhash(resume(2))) < 0.2
+
+
+def test_empty_text_has_no_signature():
+    assert minhash("") is None
+
+
+def test_index_finds_near_duplicates():
+    index = DuplicateIndex(threshold=0.8)
+    assert index.add("a", minhash(resume(1))) is None
+    assert index.add("b", minhash(resume(2))) is None
+    key, score = index.add("c", minhash(edit(resume(1), 3)))
+    assert key == "a" and score >= 0.8
+    assert index.clusters() == {"a": ["c"]}
+    assert len(index) == 2
+
+
+@pytest.fixture
+def text_extractor(monkeypatch):
+    """Treat files as plain text, with the real size limit, so no PDF backend is needed."""
+    def extract(pdf_file, **options):
+        try:
+            return read_limited(pdf_file).decode()
+        except ValueError:
+            return None
+
+    monkeypatch.setattr(ATSAnalyzer, "extract_text_from_pdf", staticmethod(extract))
+
+
+def test_rank_corpus_clusters_do_not_depend_on_order(tmp_path, text_extractor):
+    texts = {"a.pdf": resume(1), "b.pdf": edit(resume(1), 2), "c.pdf": resume(1), "d.pdf": resume(2)}
+    for name, text in texts.items():
+        (tmp_path / name).write_text(text)
+    (tmp_path / "huge.pdf").write_bytes(b"x" * (batch.MAX_PDF_BYTES + 1))
+    names = sorted(texts) + ["huge.pdf"]
+
+    outcomes = []
+    for seed in range(3):
+        paths = [str(tmp_path / name) for name in names]
+        random.Random(seed).shuffle(paths)
+        out = tmp_path / f"report{seed}.jsonl"
+        summary = batch.rank_corpus("python kubernetes", paths, str(out), workers=1, dedup_threshold=0.8)
+        records = {r["path"].rsplit("/", 1)[1]: r for r in map(json.loads, out.read_text().splitlines())}
+        assert not any("minhash" in r for r in records.values())
+        outcomes.append({name: (r.get("duplicate_of", "").rsplit("/", 1)[-1], r.get("similarity"))
+                         for name, r in records.items()})
+        assert summary["duplicates"] == 2 and summary["duplicate_clusters"] == 1
+        assert records["huge.pdf"]["error"] == "no text extracted"
+
+    assert outcomes[0] == outcomes[1] == outcomes[2]
+    assert outcomes[0]["a.pdf"] == ("", None)
+    assert outcomes[0]["c.pdf"] == ("a.pdf", 1.0)
+    assert outcomes[0]["b.pdf"][0] == "a.pdf"
+
+
+def test_unique_files_skips_oversized_files(tmp_path):
+    big = tmp_path / "big.pdf"
+    big.write_bytes(b"x" * (batch.MAX_PDF_BYTES + 1))
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(big.read_bytes())
+    copies = []
+    assert list(batch._unique_files([str(big), str(copy)], copies)) == [str(big), str(copy)]
+    assert copies == []
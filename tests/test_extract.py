@@ -0,0 +1,133 @@
+import io
+import time
+
+import pytest
+
+from ats import analyzer, metrics, ocr
+from ats.analyzer import ATSAnalyzer
+from ats.cache import ExtractionCache
+from ats.extract import ExtractionLimitError, iter_pages, read_limited
+
+
+class FakeDocument:
+    def __init__(self, pages=5, seconds_per_page=0.0, scanned=False):
+        self.page_count = pages
+        self.seconds_per_page = seconds_per_page
+        self.scanned = scanned
+
+    def page_text(self, number):
+        time.sleep(self.seconds_per_page)
+        if self.scanned:
+            return ""
+        return f"Page {number + 1} lists Python, SQL and Kubernetes experience in plain words"
+
+
+def fake_ocr_page(pdf_bytes, page_number, dpi=200, timeout=0):
+    time.sleep(0.03)
+    return f"Scanned page {page_number} about Python", {"page": page_number, "render_ms": 0, "ocr_ms": 30, "chars": 30}
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    document = FakeDocument()
+    monkeypatch.setattr(analyzer, "candidate_backends", lambda backend=None: ["fake"])
+    monkeypatch.setattr(analyzer, "open_document", lambda name, data: document)
+    return document
+
+
+def test_read_limited():
+    assert read_limited(io.BytesIO(b"12345"), max_bytes=5) == b"12345"
+    with pytest.raises(ExtractionLimitError):
+        read_limited(io.BytesIO(b"123456"), max_bytes=5)
+
+
+def test_iter_pages_limits():
+    assert len(list(iter_pages(FakeDocument(pages=20), max_pages=3))) == 3
+    assert len(list(iter_pages(FakeDocument(pages=20), max_pages=None, max_words=25))) == 3
+    timeouts = []
+    pages = list(iter_pages(FakeDocument(seconds_per_page=0.03), max_seconds=0.05,
+                            on_timeout=lambda: timeouts.append(True)))
+    assert 0 < len(pages) < 5 and timeouts == [True]
+
+
+def test_text_cut_short_by_time_limit_is_not_cached(tmp_path, fake_backend):
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite3"))
+    fake_backend.seconds_per_page = 0.03
+    partial = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), cache=cache, max_seconds=0.05)
+    assert partial.count("Page") < 5
+
+    full = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), cache=cache, max_seconds=10)
+    assert full.count("Page") == 5
+
+    fake_backend.seconds_per_page = 1.0
+    # Served from the cache without touching the slow document
+    start = time.perf_counter()
+    assert ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), cache=cache, max_seconds=0.05) == full
+    assert time.perf_counter() - start < 0.5
+
+
+def test_oversized_upload_is_rejected(fake_backend):
+    assert ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"x" * 100), max_bytes=10) is None
+    with pytest.raises(ExtractionLimitError):
+        ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"x" * 100), max_bytes=10, raise_errors=True)
+
+
+def test_every_page_latency_is_recorded(fake_backend, monkeypatch):
+    registry = metrics.Metrics()
+    monkeypatch.setattr(metrics, "REGISTRY", registry)
+    fake_backend.seconds_per_page = 0.01
+    assert ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"))
+    pages = registry.stage_summary()["pdf_page"]
+    assert pages["count"] == 5
+    assert pages["mean_ms"] >= 10
+
+
+def test_ocr_is_bounded_by_the_time_limit(tmp_path, fake_backend, monkeypatch):
+    fake_backend.scanned = True
+    monkeypatch.setattr(ocr, "ocr_page", fake_ocr_page)
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite3"))
+    text = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), cache=cache, max_seconds=0.05, ocr_workers=1)
+    assert 0 < text.count("Scanned page") < 5
+    # Cut short, so not cached: a run with time to spare OCRs every page
+    text = ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), cache=cache, max_seconds=10, ocr_workers=1)
+    assert text.count("Scanned page") == 5
+
+
+def test_ocr_stops_when_tesseract_is_killed_at_the_deadline(monkeypatch):
+    def slow_second_page(pdf_bytes, page_number, dpi=200, timeout=0):
+        if page_number == 2:
+            assert 0 < timeout <= 0.2
+            time.sleep(timeout)
+            raise RuntimeError("Tesseract process timeout")
+        return fake_ocr_page(pdf_bytes, page_number, dpi, timeout)
+
+    monkeypatch.setattr(ocr, "ocr_page", slow_second_page)
+    timeouts = []
+    start = time.perf_counter()
+    text, timings = ocr.ocr_pdf(b"%PDF", 5, workers=1, max_seconds=0.2, on_timeout=lambda: timeouts.append(True))
+    assert time.perf_counter() - start < 0.5
+    assert text == "Scanned page 1 about Python"
+    assert [t["page"] for t in timings] == [1] and timeouts == [True]
+
+
+def test_ocr_errors_before_the_deadline_are_raised(monkeypatch):
+    def broken(pdf_bytes, page_number, dpi=200, timeout=0):
+        raise RuntimeError("tesseract is not installed")
+
+    monkeypatch.setattr(ocr, "ocr_page", broken)
+    with pytest.raises(RuntimeError):
+        ocr.ocr_pdf(b"%PDF", 3, workers=1, max_seconds=10)
+
+
+def test_without_ocr_a_broken_file_is_an_error_not_a_scan(monkeypatch):
+    def broken(name, data):
+        raise RuntimeError("EOF marker not found")
+
+    monkeypatch.setattr(analyzer, "candidate_backends", lambda backend=None: ["a", "b"])
+    monkeypatch.setattr(analyzer, "open_document", broken)
+    assert ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), ocr=False) is None
+    with pytest.raises(RuntimeError):
+        ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), ocr=False, raise_errors=True)
+
+    monkeypatch.setattr(analyzer, "open_document", lambda name, data: FakeDocument(scanned=True))
+    assert ATSAnalyzer.extract_text_from_pdf(io.BytesIO(b"%PDF"), ocr=False, raise_errors=True) is None
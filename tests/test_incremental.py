@@ -0,0 +1,66 @@
+import random
+
+from ats.analyzer import ATSAnalyzer
+from ats.incremental import IncrementalAnalyzer
+from ats.taxonomy import Taxonomy
+
+JOB_DESCRIPTION = ("Team lead for a Python backend. Kubernetes, CI/CD, AWS and machine learning experience. "
+                   "Strong communication and leadership skills, SQL and REST APIs.")
+
+LINES = [
+    "EXPERIENCE", "Education", "Skills: Python, SQL, K8s", "Work Experience", "PROJECTS",
+    "Built CI/CD pipelines on AWS for a team of 8", "Led a team of engineers shipping ML models",
+    "team", "lead", "machine", "learning", "python3 and django", "Contact: jane@example.com",
+    "Designed RESTful APIs in a table-driven service", "", "", "Communication skills", "phone 555 010 2030 44",
+]
+
+
+def random_edit(rng, lines):
+    op = rng.random()
+    if op < 0.4 or not lines:
+        lines.insert(rng.randrange(len(lines) + 1), rng.choice(LINES))
+    elif op < 0.7:
+        lines.pop(rng.randrange(len(lines)))
+    else:
+        lines[rng.randrange(len(lines))] = rng.choice(LINES)
+
+
+def test_matches_full_analysis_over_random_edits():
+    rng = random.Random(12)
+    lines = [rng.choice(LINES) for _ in range(30)]
+    analyzer = IncrementalAnalyzer()
+    for _ in range(300):
+        random_edit(rng, lines)
+        text = "\n".join(lines)
+        score, checks, _, sections, _ = analyzer.analyze("resume", text, JOB_DESCRIPTION)
+        full_score, full_checks, _, full_sections = ATSAnalyzer.perform_ats_checks(text, JOB_DESCRIPTION)
+        assert checks == full_checks
+        assert sections == full_sections
+        assert score == full_score
+    assert analyzer.stats["blocks_reused"] > analyzer.stats["blocks_measured"]
+
+
+def test_alias_does_not_join_across_blank_line():
+    text = "Skills\nteam\n\nlead and python"
+    analyzer = IncrementalAnalyzer()
+    checks = analyzer.analyze("resume", text, "leadership python")[1]
+    assert checks == ATSAnalyzer.perform_ats_checks(text, "leadership python")[1]
+    assert checks["Keywords Match"] == 50.0
+
+
+def test_delta_reports_changes():
+    analyzer = IncrementalAnalyzer()
+    first = analyzer.analyze("resume", "Skills\nPython", "python kubernetes")[4]
+    assert first["first_version"]
+    delta = analyzer.analyze("resume", "Skills\nPython\n\nk8s on AWS", "python kubernetes")[4]
+    assert delta["keywords_gained"] == ["kubernetes"]
+    assert delta["blocks_added"] == 1 and delta["blocks_removed"] == 0
+    assert delta["score"] > 0
+
+
+def test_taxonomy_change_remeasures_blocks(isolated_taxonomy):
+    analyzer = IncrementalAnalyzer()
+    text = "Skills\nk8s\n\nPython"
+    assert analyzer.analyze("resume", text, "kubernetes python")[1]["Keywords Match"] == 100.0
+    isolated_taxonomy.set_taxonomy(Taxonomy([], version="none"))
+    assert analyzer.analyze("resume", text, "kubernetes python")[1]["Keywords Match"] == 50.0
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from ats.index import ResumeIndex
+from ats.scoring import ResumeCorpus
+
+RESUMES = {
+    "alice": "Skills\nPython, Kubernetes and AWS\nExperience\nBuilt Python services",
+    "bob": "Skills\nJava and Spring\nEducation\nBSc Computer Science",
+    "carol": "Experience\nPython data pipelines on AWS with SQL",
+    "dave": "Skills\nFigma, user research",
+}
+TERMS = ["python", "aws", "kubernetes"]
+
+
+def keys(results):
+    return [result["key"] for result in results]
+
+
+@pytest.fixture
+def index_dir(tmp_path):
+    # Two segments: one flushed by size, one by close
+    with ResumeIndex(str(tmp_path), flush_docs=2) as index:
+        for key, text in RESUMES.items():
+            index.add(key, text)
+    return str(tmp_path)
+
+
+def test_round_trip_through_mmap_segments(index_dir, tmp_path):
+    with ResumeIndex(index_dir) as index:
+        assert len(index) == 4
+        results = index.query(TERMS)
+        docs, _ = index._segment_arrays(1)
+        assert isinstance(docs, np.memmap)
+    assert keys(results) == ["alice", "carol"]
+    assert results[0]["matched"] == TERMS
+    assert results[0]["sections"] == ["experience", "skills"]
+    assert 0 < results[1]["score"] < results[0]["score"] <= 100
+    assert sorted(p.name for p in tmp_path.glob("seg-*")) == [
+        "seg-1.docs.npy", "seg-1.freqs.npy", "seg-2.docs.npy", "seg-2.freqs.npy"]
+
+
+def test_scores_match_an_in_memory_corpus(index_dir):
+    with ResumeIndex(index_dir) as index:
+        results = {result["key"]: result["score"] for result in index.query(TERMS)}
+    corpus = ResumeCorpus.from_texts(list(RESUMES.values()), ids=list(RESUMES))
+    expected = dict(zip(corpus.ids, corpus.scores(TERMS, "bm25")))
+    for key, score in results.items():
+        assert score == pytest.approx(expected[key], abs=0.01)
+
+
+def test_buffered_documents_are_queryable(tmp_path):
+    with ResumeIndex(str(tmp_path)) as index:
+        index.add("alice", RESUMES["alice"])
+        assert keys(index.query(["kubernetes"])) == ["alice"]
+
+
+def test_add_replaces_the_previous_version(index_dir):
+    with ResumeIndex(index_dir) as index:
+        index.add("dave", "Skills\nKubernetes operator in Go")
+        assert len(index) == 4
+        assert set(keys(index.query(["kubernetes"]))) == {"alice", "dave"}
+        assert index.query(["figma"]) == []
+
+
+def test_delete_then_compact(index_dir, tmp_path):
+    with ResumeIndex(index_dir) as index:
+        assert index.delete("alice") == 1
+        assert index.delete("alice") == 0
+        assert keys(index.query(TERMS)) == ["carol"]
+        before = index.query(["java"])
+    # Tombstones survive a reopen
+    with ResumeIndex(index_dir) as index:
+        assert len(index) == 3
+        assert keys(index.query(TERMS)) == ["carol"]
+        index.compact()
+        assert keys(index.query(TERMS)) == ["carol"]
+        assert index.query(["java"]) == before
+        assert index._db.execute("SELECT COUNT(*) FROM docs WHERE deleted = 1").fetchone()[0] == 0
+    assert sorted(p.name for p in tmp_path.glob("seg-*")) == ["seg-3.docs.npy", "seg-3.freqs.npy"]
+
+    with ResumeIndex(index_dir) as index:
+        assert len(index) == 3
+        docs, _ = index._segment_arrays(3)
+        # The deleted document's postings are gone from the merged segment
+        assert len(docs) == sum(length for (length,) in index._db.execute("SELECT length FROM postings"))
+        assert keys(index.query(["figma"])) == ["dave"]
+        index.add("erin", "Python and Kubernetes")
+        assert keys(index.query(["kubernetes"])) == ["erin"]
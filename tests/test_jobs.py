@@ -0,0 +1,73 @@
+import pytest
+
+from ats.extract import MAX_PDF_BYTES
+from ats.jobs import JobQueue, run_one
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setenv("ATS_CACHE_DIR", str(tmp_path / "cache"))
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"), backoff=0)
+    yield queue
+    queue.close()
+
+
+def drain(queue, limit=10):
+    for _ in range(limit):
+        if not run_one(queue):
+            return
+
+
+@pytest.mark.parametrize("kind, payload", [("extract", {}), ("score", {"job_description": "Python developer"})])
+def test_unreadable_pdf_is_retried_then_failed(queue, kind, payload):
+    job_id = queue.enqueue(kind, payload, data=b"not a pdf", max_attempts=3)
+    drain(queue)
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["attempts"] == 3
+    assert job["error"] == "no text extracted"
+
+
+def test_extraction_errors_reach_the_queue(queue, monkeypatch):
+    def crash(*args, **kwargs):
+        raise RuntimeError("tesseract crashed")
+
+    monkeypatch.setattr("ats.analyzer.ocr_pdf", crash)
+    job_id = queue.enqueue("extract", {}, data=b"%PDF-1.4 scanned", max_attempts=2)
+    drain(queue)
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "tesseract crashed"
+
+
+def test_failed_job_backs_off(tmp_path, monkeypatch):
+    monkeypatch.setenv("ATS_CACHE_DIR", str(tmp_path / "cache"))
+    queue = JobQueue(str(tmp_path / "jobs.sqlite3"), backoff=60)
+    job_id = queue.enqueue("extract", {}, data=b"not a pdf")
+    assert run_one(queue)
+    assert queue.get(job_id)["status"] == "queued"
+    # Not runnable again until the backoff has passed
+    assert not run_one(queue)
+    queue.close()
+
+
+def test_successful_job_completes(queue, monkeypatch):
+    monkeypatch.setattr("ats.analyzer.ATSAnalyzer.extract_text_from_pdf",
+                        staticmethod(lambda pdf_file, **options: pdf_file.read().decode()))
+    job_id = queue.enqueue("extract", {}, data=b"Python developer")
+    drain(queue)
+    job = queue.get(job_id)
+    assert job["status"] == "done"
+    assert job["result"] == {"text": "Python developer"}
+    assert job["progress"] == 1
+
+
+@pytest.mark.parametrize("kind, payload", [("extract", {}), ("score", {"job_description": "Python developer"})])
+def test_oversized_pdf_fails_without_retry(queue, kind, payload):
+    job_id = queue.enqueue(kind, payload, data=b"x" * (MAX_PDF_BYTES + 1), max_attempts=3)
+    assert run_one(queue)
+    job = queue.get(job_id)
+    assert job["status"] == "failed"
+    assert job["attempts"] == 1
+    assert job["error"].startswith("PDF is larger than")
+    assert not run_one(queue)
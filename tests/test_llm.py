@@ -0,0 +1,150 @@
+import asyncio
+import time
+
+import pytest
+
+from ats.cache import ExtractionCache
+from ats.llm import LLMClient, TokenBucket
+
+
+class FakeTransport:
+    """Async transport that yields ``chunks`` and can fail before or after the first one."""
+
+    def __init__(self, chunks=("Looks ", "good."), fail_before=0, fail_after_first=False, delay=0.0):
+        self.chunks = chunks
+        self.fail_before = fail_before
+        self.fail_after_first = fail_after_first
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, model, contents):
+        self.calls.append(time.monotonic())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.fail_before:
+                self.fail_before -= 1
+                raise ConnectionError("endpoint unavailable")
+            for i, chunk in enumerate(self.chunks):
+                yield chunk
+                if self.fail_after_first and i == 0:
+                    raise ConnectionError("stream reset")
+        finally:
+            self.active -= 1
+
+
+def make_client(transport, **options):
+    options.setdefault("rate_per_sec", 1000.0)
+    options.setdefault("backoff", 0.001)
+    return LLMClient(transport, **options)
+
+
+def test_generate_joins_streamed_chunks():
+    transport = FakeTransport()
+    client = make_client(transport)
+    assert asyncio.run(client.generate("Review", "resume", "jd")) == "Looks good."
+    assert client.stats["requests"] == 1
+
+
+def test_concurrency_is_limited():
+    transport = FakeTransport(delay=0.02)
+    client = make_client(transport, max_concurrency=2)
+
+    async def run():
+        return await asyncio.gather(*(client.generate("Review", f"resume {i}", "jd") for i in range(6)))
+
+    assert asyncio.run(run()) == ["Looks good."] * 6
+    assert transport.peak == 2
+
+
+def test_token_bucket_paces_requests():
+    transport = FakeTransport()
+    client = make_client(transport, rate_per_sec=20.0, burst=1, max_concurrency=10)
+
+    async def run():
+        await asyncio.gather(*(client.generate("Review", f"resume {i}", "jd") for i in range(5)))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    # The first request uses the burst token, the other four wait 1/20 s each
+    assert time.monotonic() - start >= 4 / 20 * 0.9
+    gaps = [b - a for a, b in zip(transport.calls, transport.calls[1:])]
+    assert min(gaps) >= 1 / 20 * 0.8
+
+
+def test_token_bucket_allows_burst():
+    async def run():
+        bucket = TokenBucket(rate=1.0, capacity=3)
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 0.1
+
+
+def test_retries_failure_before_first_chunk():
+    transport = FakeTransport(fail_before=2)
+    client = make_client(transport, retries=3)
+    assert asyncio.run(client.generate("Review", "resume", "jd")) == "Looks good."
+    assert len(transport.calls) == 3
+    assert client.stats["retries"] == 2
+    assert client.stats["failures"] == 0
+
+
+def test_gives_up_after_retries():
+    transport = FakeTransport(fail_before=5)
+    client = make_client(transport, retries=2)
+    with pytest.raises(ConnectionError):
+        asyncio.run(client.generate("Review", "resume", "jd"))
+    assert len(transport.calls) == 3
+    assert client.stats["failures"] == 1
+
+
+def test_no_retry_after_a_chunk_was_streamed():
+    transport = FakeTransport(fail_after_first=True)
+    client = make_client(transport, retries=3)
+
+    async def run():
+        received = []
+        with pytest.raises(ConnectionError):
+            async for chunk in client.stream("Review", "resume", "jd"):
+                received.append(chunk)
+        return received
+
+    assert asyncio.run(run()) == ["Looks "]
+    assert len(transport.calls) == 1
+    assert client.stats["retries"] == 0
+
+
+def test_repeat_is_served_from_cache(tmp_path):
+    transport = FakeTransport()
+    client = make_client(transport, cache=ExtractionCache(str(tmp_path / "llm.sqlite3")))
+    first = asyncio.run(client.generate("Review", "resume", "jd"))
+    second = asyncio.run(client.generate("Review", "resume", "jd"))
+    assert first == second == "Looks good."
+    assert len(transport.calls) == 1
+    assert client.stats["cache_hits"] == 1
+
+    asyncio.run(client.generate("Review", "another resume", "jd"))
+    assert len(transport.calls) == 2
+
+
+def test_failed_request_is_not_cached(tmp_path):
+    transport = FakeTransport(fail_after_first=True)
+    client = make_client(transport, cache=ExtractionCache(str(tmp_path / "llm.sqlite3")))
+    with pytest.raises(ConnectionError):
+        asyncio.run(client.generate("Review", "resume", "jd"))
+    # A partial answer must not be cached
+    transport.fail_after_first = False
+    assert asyncio.run(client.generate("Review", "resume", "jd")) == "Looks good."
+    assert client.stats["cache_hits"] == 0
+
+
+def test_stream_sync_yields_chunks():
+    client = make_client(FakeTransport(chunks=("a", "b", "c")))
+    assert list(client.stream_sync("Review", "resume", "jd")) == ["a", "b", "c"]
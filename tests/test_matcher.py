@@ -0,0 +1,61 @@
+import pytest
+
+from ats.matcher import KeywordMatcher, block_breaks, tokenize
+
+
+@pytest.mark.parametrize("text, found", [
+    ("Java developer", ["java"]),
+    ("JavaScript developer", []),
+    ("java-based services", ["java"]),
+    ("Java/Spring", ["java"]),
+    ("(JAVA)", ["java"]),
+    ("javas", []),
+])
+def test_terms_match_on_word_boundaries(text, found):
+    assert KeywordMatcher(["java"]).match(text).found == found
+
+
+def test_counts_positions_and_ratio():
+    text = "Python, SQL and more python"
+    result = KeywordMatcher(["python", "sql", "go"]).match(text)
+    assert result.counts == {"python": 2, "sql": 1}
+    assert result.positions["python"] == [0, 21]
+    assert result.found == ["python", "sql"] and result.missing == ["go"]
+    assert result.ratio == pytest.approx(2 / 3)
+    assert KeywordMatcher([]).match(text).ratio == 0.0
+
+
+def test_multi_word_terms():
+    matcher = KeywordMatcher(["sql"], phrases=[("code", "review"), ("code", "quality")])
+    result = matcher.match("Code review and code quality, code review again, clean code")
+    assert result.counts == {"code review": 2, "code quality": 1}
+    assert result.positions["code review"] == [0, 30]
+    assert result.terms == ["sql", "code review", "code quality"]
+    # Canonical skill names are single tokens after the taxonomy pass
+    assert KeywordMatcher(["machine learning"]).match("ML and Machine Learning").counts == {"machine learning": 2}
+
+
+def test_reusing_tokens_gives_the_same_result():
+    text = "Python and Amazon Web Services"
+    tokens, offsets = tokenize(text)
+    matcher = KeywordMatcher(["python", "aws"])
+    assert matcher.match(tokens=tokens, offsets=offsets).counts == matcher.match(text).counts == {
+        "python": 1, "aws": 1}
+
+
+def test_block_breaks():
+    text = "skills\npython\n\n  \nexperience led\n\nend"
+    tokens, offsets = tokenize(text)
+    assert [tokens[i] for i in sorted(block_breaks(text, offsets))] == ["experience", "end"]
+    assert block_breaks("no blank lines\nhere", [0, 3, 9, 15]) == set()
+
+
+def test_terms_do_not_match_across_a_block_break():
+    matcher = KeywordMatcher([], phrases=[("code", "review")])
+    assert matcher.match("code\nreview").counts == {"code review": 1}
+    assert matcher.match("code\n\nreview").counts == {}
+    tokens, offsets = tokenize("code\n\nreview")
+    assert matcher.match(tokens=tokens, offsets=offsets, breaks={1}).counts == {}
+    # Skill aliases stop at the break too
+    assert KeywordMatcher(["aws"]).match("amazon web\n\nservices").counts == {}
+    assert KeywordMatcher(["aws"]).match("amazon web\nservices").counts == {"aws": 1}
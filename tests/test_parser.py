@@ -0,0 +1,90 @@
+import io
+
+import pytest
+
+from ats.analyzer import ATSAnalyzer
+from ats.batch import score_pdf
+from ats.matcher import KeywordMatcher
+from ats.parser import parse_resume
+from ats.text import find_headings
+
+RESUME = """Jane Doe
+jane.doe+jobs@example.co.uk | (555) 123-4567 | linkedin.com/in/jane-doe | github.com/janedoe
+
+Professional Summary
+I have experience leading Python teams since 2015-2019.
+
+Work Experience
+Backend engineer at Acme, 2019 - 2024
+
+EDUCATION
+BSc Computer Science
+
+Technical Skills: Python, SQL, Kubernetes
+"""
+
+
+def test_headings_need_a_capitalized_section_word():
+    headings = [section for section, _, _ in find_headings(RESUME)]
+    assert headings == ["summary", "work experience", "education", "skills"]
+    # "experience" inside a sentence is not a heading
+    assert list(find_headings("i have experience with python")) == []
+
+
+def test_inline_heading_body_starts_after_the_colon():
+    ((section, line_start, body_start),) = find_headings("Skills: Python, SQL")
+    assert (section, line_start) == ("skills", 0)
+    assert "Skills: Python, SQL"[body_start:] == " Python, SQL"
+
+
+def test_sections_span_to_the_next_heading():
+    parsed = parse_resume(RESUME)
+    assert parsed.section_names == ["education", "skills", "summary", "work experience"]
+    assert parsed.section_text("work experience").strip() == "Backend engineer at Acme, 2019 - 2024"
+    assert parsed.section_text("skills").strip() == "Python, SQL, Kubernetes"
+
+
+def test_contact_fields():
+    parsed = parse_resume(RESUME)
+    assert parsed.emails == ["jane.doe+jobs@example.co.uk"]
+    assert parsed.phones == ["(555) 123-4567"]
+    assert parsed.linkedin == ["linkedin.com/in/jane-doe"]
+    assert parsed.github == ["github.com/janedoe"]
+    assert parsed.contact_present
+
+
+@pytest.mark.parametrize("text, contact", [
+    ("Call +44 20 7946 0958 any time", True),
+    ("Worked there 2015-2019 and 2019-2024", False),
+    ("Profile: LinkedIn", True),
+    ("Python developer", False),
+])
+def test_contact_present(text, contact):
+    assert parse_resume(text).contact_present is contact
+
+
+def test_tokens_and_offsets():
+    parsed = parse_resume("Ran K8s and\nPython3 daily")
+    assert parsed.tokens == ["ran", "kubernetes", "and", "python", "daily"]
+    assert list(parsed.offsets) == [0, 4, 8, 12, 20]
+    assert parsed.word_count == 5
+    assert not parsed.complex_formatting
+    assert parse_resume("See the table below").complex_formatting
+
+
+def test_score_pdf_matches_keywords_once(monkeypatch):
+    calls = []
+    match = KeywordMatcher.match
+
+    def counting(self, *args, **kwargs):
+        calls.append(self)
+        return match(self, *args, **kwargs)
+
+    monkeypatch.setattr(KeywordMatcher, "match", counting)
+    monkeypatch.setattr(ATSAnalyzer, "extract_text_from_pdf",
+                        staticmethod(lambda pdf_file, **options: pdf_file.read().decode()))
+    record = score_pdf(io.BytesIO(RESUME.encode()), "Python and Go developer", ["python", "go"])
+    assert len(calls) == 1
+    assert record["keywords_found"] == ["python"] and record["keywords_missing"] == ["go"]
+    assert record["term_counts"] == [2, 0]
+    assert record["checks"]["Keywords Match"] == 50.0
@@ -0,0 +1,77 @@
+import csv
+import json
+
+import pytest
+
+from ats.report import CSV_FIELDS, LIST_SEPARATOR, open_writer, render_html, render_pdf, render_text
+
+RECORD = {
+    "path": "resumes/jane.pdf",
+    "score": 72.5,
+    "checks": {"Keywords Match": 62.5, "Has Experience Section": True, "Has Education Section": True,
+               "Has Skills Section": False, "Ideal Length (500-1000 words)": False,
+               "No Complex Formatting": True, "Contact Information Present": True},
+    "keywords_found": ["python", "machine learning", "rest api"],
+    "keywords_missing": ["kubernetes"],
+    "sections": ["work experience", "education"],
+    "error": None,
+}
+
+
+def test_jsonl_round_trip(tmp_path):
+    path = str(tmp_path / "report.jsonl")
+    with open_writer(path) as writer:
+        writer.write(RECORD, rank=1)
+    with open(path, encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == [{**RECORD, "rank": 1}]
+
+
+def test_csv_list_fields_split_back_into_terms(tmp_path):
+    path = str(tmp_path / "report.csv")
+    with open_writer(path) as writer:
+        writer.write(RECORD, rank=1)
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == CSV_FIELDS
+    assert rows[0]["keywords_found"].split(LIST_SEPARATOR) == RECORD["keywords_found"]
+    assert rows[0]["sections"].split(LIST_SEPARATOR) == RECORD["sections"]
+    assert rows[0]["duplicate_of"] == ""
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_arrow_formats(tmp_path, suffix):
+    pa = pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"report{suffix}")
+    with open_writer(path) as writer:
+        for rank in range(1, 4):
+            writer.write(RECORD, rank=rank)
+    if suffix == ".parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(path)
+    else:
+        table = pa.ipc.open_file(path).read_all()
+    assert table.num_rows == 3
+    assert table.column("rank").to_pylist() == [1, 2, 3]
+    assert table.column("keywords_found").to_pylist()[0] == RECORD["keywords_found"]
+    assert table.column("Has Skills Section").to_pylist()[0] is False
+
+
+def test_renderers_share_content():
+    text = render_text(RECORD)
+    html = render_html(RECORD)
+    assert "72.5%" in text and "72.5%" in html
+    assert "machine learning" in text and "machine learning" in html
+    # Skills is missing from the found sections, so it is recommended in every format
+    assert "Skills" in text.split("Recommended Sections to Add:")[1]
+    assert "<h2>Recommended Sections to Add</h2>" in html
+
+
+def test_pdf_is_well_formed():
+    data = render_pdf({**RECORD, "keywords_found": [f"skill{i}" for i in range(100)]})
+    assert data.startswith(b"%PDF-1.4") and data.rstrip().endswith(b"%%EOF")
+    xref = int(data.rsplit(b"startxref\n", 1)[1].split()[0])
+    assert data[xref:xref + 4] == b"xref"
+    count = int(data[xref:].split(b"\n")[1].split()[1])
+    offsets = [int(line.split()[0]) for line in data[xref:].split(b"\n")[3:2 + count]]
+    for number, offset in enumerate(offsets, start=1):
+        assert data[offset:].startswith(b"%d 0 obj" % number)
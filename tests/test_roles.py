@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from ats.analyzer import ATSAnalyzer
+from ats.roles import STRATEGIES, RoleSet
+
+SKILLS = ["python", "django", "aws", "kubernetes", "docker", "sql", "react", "typescript", "ml", "spark",
+          "terraform", "go", "java", "spring", "kafka", "redis", "graphql", "ci/cd", "leadership", "agile"]
+FILLER = ["build", "services", "team", "design", "deliver", "platform", "customers", "data", "reliable"]
+
+RESUME = """Jane Doe
+jane@example.com | +1 555 010 2030
+
+Summary
+Backend engineer building Python and Django services on AWS.
+
+Experience
+Led a team shipping ML models with Spark and Kafka; K8s, Docker and CI/CD pipelines.
+Designed GraphQL and SQL data layers; Redis caching.
+
+Education
+BSc Computer Science
+
+Skills
+Python, Django, AWS, Kubernetes, Docker, SQL, Terraform
+"""
+
+
+def job_descriptions(count, seed=23):
+    rng = random.Random(seed)
+    roles = {}
+    for i in range(count):
+        words = rng.sample(SKILLS, 6) * rng.randint(1, 3) + rng.choices(FILLER, k=20)
+        rng.shuffle(words)
+        roles[f"role-{i}"] = "We need " + " ".join(words) + "."
+    return roles
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES)
+def test_scores_equal_perform_ats_checks(strategy):
+    roles = job_descriptions(40)
+    role_set = RoleSet(roles)
+    results = role_set.match(RESUME, strategy=strategy, top_n=len(roles))
+    assert len(results) == len(roles)
+    for result in results:
+        score, checks, _, _ = ATSAnalyzer.perform_ats_checks(RESUME, roles[result["role"]], strategy=strategy)
+        assert result["score"] == pytest.approx(round(score, 2), abs=0.011)
+        assert result["keyword_score"] == pytest.approx(round(checks["Keywords Match"], 2), abs=0.011)
+
+
+def test_results_are_ranked_and_cut_to_top_n():
+    role_set = RoleSet(job_descriptions(20))
+    results = role_set.match(RESUME, top_n=5)
+    assert [r["rank"] for r in results] == [1, 2, 3, 4, 5]
+    scores = [r["score"] for r in results]
+    assert scores == sorted(scores, reverse=True)
+    best = results[0]
+    terms = role_set.profiles[role_set.ids.index(best["role"])].terms
+    assert sorted(best["keywords_found"] + best["keywords_missing"]) == sorted(terms)
+
+
+def test_from_directory(tmp_path):
+    (tmp_path / "backend.txt").write_text("Python Django AWS engineer", encoding="utf-8")
+    (tmp_path / "frontend.txt").write_text("React TypeScript engineer", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("ignored", encoding="utf-8")
+    role_set = RoleSet.from_directory(str(tmp_path))
+    assert sorted(role_set.ids) == ["backend", "frontend"]
+    assert role_set.match(RESUME, top_n=1)[0]["role"] == "backend"
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        RoleSet(job_descriptions(2)).match(RESUME, strategy="nope")
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from ats.scoring import (ResumeCorpus, bm25_from_counts, bm25_idf, bm25_percent, keyword_relevance,
+                         tfidf_idf)
+
+CORPUS = {
+    "rust": "rust systems engineer python tooling on linux",
+    "python": "python engineer python django python rest apis",
+    "generalist": "python engineer with sql and linux and some docker on aws plus teamwork and writing",
+    "designer": "figma designer with user research and prototyping",
+}
+TERMS = ["python", "rust", "linux"]
+
+
+@pytest.fixture
+def corpus():
+    return ResumeCorpus.from_texts(list(CORPUS.values()), ids=list(CORPUS))
+
+
+@pytest.mark.parametrize("idf", [bm25_idf, tfidf_idf])
+def test_idf_decreases_with_document_frequency(idf):
+    weights = idf(np.arange(0, 11), 10)
+    assert np.all(np.diff(weights) < 0)
+    assert weights[-1] > 0
+
+
+@pytest.mark.parametrize("strategy", ["bm25", "tfidf"])
+def test_rare_terms_weigh_more(corpus, strategy):
+    # "rust" is in one resume and "python" in three, so matching the rare term ranks higher
+    rust_only = corpus.score_text("rust developer", ["python", "rust"], strategy)
+    python_only = corpus.score_text("python developer", ["python", "rust"], strategy)
+    assert rust_only > python_only > 0
+
+
+def test_bm25_saturates_term_frequency():
+    counts = np.array([[1], [2], [3], [4], [50]])
+    scores = bm25_percent(counts, [10] * 5, 10, np.ones(1), np.ones(1))
+    gains = np.diff(scores[:4])
+    assert np.all(gains > 0)
+    assert np.all(np.diff(gains) < 0)
+    assert scores[3] < scores[4] < 100
+
+
+def test_bm25_normalizes_for_length():
+    scores = bm25_percent([[2], [2], [2]], [5, 10, 40], 10, np.ones(1), np.ones(1))
+    assert scores[0] > scores[1] > scores[2]
+    # With b=0 length is ignored
+    flat = bm25_percent([[2], [2], [2]], [5, 10, 40], 10, np.ones(1), np.ones(1), b=0.0)
+    assert flat == pytest.approx([flat[0]] * 3)
+
+
+# BM25 credits the generalist for matching two terms; TF-IDF cosine favours the
+# short resume that repeats "python" over the long one with more unrelated words
+@pytest.mark.parametrize("strategy, expected", [
+    ("bm25", ["rust", "generalist", "python", "designer"]),
+    ("tfidf", ["rust", "python", "generalist", "designer"]),
+])
+def test_ranking_on_a_small_corpus(corpus, strategy, expected):
+    scores = corpus.scores(TERMS, strategy)
+    assert [corpus.ids[i] for i in np.argsort(-scores, kind="stable")] == expected
+    assert scores[corpus.ids.index("designer")] == 0
+    assert np.all((scores >= 0) & (scores <= 100))
+    # Repeated scoring gives the same numbers
+    assert np.array_equal(corpus.scores(TERMS, strategy), scores)
+
+
+@pytest.mark.parametrize("strategy", ["bm25", "tfidf"])
+def test_score_text_agrees_with_corpus_scores(corpus, strategy):
+    scores = corpus.scores(TERMS, strategy)
+    for i, text in enumerate(CORPUS.values()):
+        assert corpus.score_text(text, TERMS, strategy) == pytest.approx(scores[i])
+
+
+def test_bm25_from_counts_matches_the_term_matrix(corpus):
+    counts, _ = corpus.query_columns(TERMS)
+    assert bm25_from_counts(counts, corpus.doc_lengths) == pytest.approx(corpus.scores(TERMS, "bm25"))
+
+
+def test_weights_shift_the_ranking(corpus):
+    unweighted = corpus.scores(["python", "rust"], "bm25")
+    weighted = corpus.scores(["python", "rust"], "bm25", weights={"python": 10.0})
+    python, rust = corpus.ids.index("python"), corpus.ids.index("rust")
+    assert unweighted[rust] > unweighted[python]
+    assert weighted[python] > weighted[rust]
+
+
+def test_single_resume_without_corpus():
+    assert keyword_relevance("python python sql", ["python", "sql"], "bm25") > \
+        keyword_relevance("python go", ["python", "sql"], "bm25") > 0
+    assert keyword_relevance("figma", ["python"], "tfidf") == 0
+    with pytest.raises(ValueError):
+        keyword_relevance("python", ["python"], "keywords")
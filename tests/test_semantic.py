@@ -0,0 +1,145 @@
+import json
+
+import numpy as np
+import pytest
+
+from ats.__main__ import main
+from ats.analyzer import ATSAnalyzer
+from ats.semantic import EmbeddingCache, HashingEmbedder, VectorIndex, semantic_match
+
+
+@pytest.fixture
+def text_extractor(monkeypatch):
+    monkeypatch.setattr(ATSAnalyzer, "extract_text_from_pdf",
+                        staticmethod(lambda pdf_file, **options: pdf_file.read().decode()))
+
+
+def query(index_dir, jd, capsys):
+    capsys.readouterr()
+    assert main(["index", "query", str(jd), "--index", str(index_dir), "--semantic"]) == 0
+    return [json.loads(line)["key"] for line in capsys.readouterr().out.splitlines()]
+
+
+def test_deleted_resume_is_not_returned_by_semantic_query(tmp_path, text_extractor, capsys):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    (resumes / "backend.pdf").write_text("Python backend engineer building Kubernetes services")
+    (resumes / "design.pdf").write_text("Graphic designer working in Figma and Illustrator")
+    jd = tmp_path / "jd.txt"
+    jd.write_text("Python engineer for Kubernetes backend services")
+    index_dir = tmp_path / "index"
+    backend = str(resumes / "backend.pdf")
+
+    assert main(["index", "add", str(resumes), "--index", str(index_dir), "--semantic"]) == 0
+    assert query(index_dir, jd, capsys)[0] == backend
+
+    assert main(["index", "delete", backend, "--index", str(index_dir), "--semantic"]) == 0
+    assert json.loads(capsys.readouterr().err) == {"deleted": 1}
+    assert query(index_dir, jd, capsys) == [str(resumes / "design.pdf")]
+
+
+def test_delete_buffered_and_saved_vectors(tmp_path):
+    embedder = HashingEmbedder(dim=64)
+    index = VectorIndex(str(tmp_path), embedder=embedder)
+    index.add_texts([("a", "python developer"), ("b", "java developer")])
+    assert index.delete("a")
+    index.save()
+    assert index.keys == ["b"]
+    assert index.delete("b") and not index.delete("b")
+
+    reopened = VectorIndex(str(tmp_path), embedder=embedder)
+    assert reopened.keys == [] and reopened.vectors.shape == (0, 64)
+    assert not list(tmp_path.glob("*.tmp*"))
+
+
+@pytest.fixture
+def embedder():
+    return HashingEmbedder()
+
+
+@pytest.mark.parametrize("requirement, line", [
+    ("Experience running Kubernetes clusters in production", "Ran k8s clusters in production"),
+    ("Proven leadership of engineering teams", "Led a team of five engineers"),
+])
+def test_aliases_match_by_meaning(embedder, requirement, line):
+    unrelated = "Wrote Fortran numerical code daily"
+    assert semantic_match(line, requirement, embedder=embedder).score > 50
+    assert semantic_match(unrelated, requirement, embedder=embedder).score == 0
+
+
+def test_similarity_matrix_has_one_row_per_requirement(embedder):
+    jd = ("Five years of Python backend development. Kubernetes and AWS deployment experience. "
+          "Mentoring junior engineers on the team.")
+    resume = ("Built Python REST services\nDeployed k8s clusters on Amazon Web Services\n"
+              "Mentored two junior engineers\nEnjoys hiking mountain trails")
+    match = semantic_match(resume, jd, embedder=embedder, cache=EmbeddingCache())
+    assert match.matrix.shape == (3, 4)
+    assert match.matrix.dtype == np.float32
+    assert [line for _, line, _ in match.pairs()] == [
+        "Built Python REST services", "Deployed k8s clusters on Amazon Web Services", "Mentored two junior engineers"]
+    assert match.best == pytest.approx(match.matrix.max(axis=1))
+    assert 0 < match.score <= 100
+
+
+def test_empty_inputs_give_empty_matrix(embedder):
+    match = semantic_match("", "Python backend development experience", embedder=embedder)
+    assert match.matrix.shape == (1, 0)
+    assert match.score == 0
+    assert list(match.pairs()) == [("Python backend development experience", None, 0.0)]
+
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dim=64)
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return super().embed(texts)
+
+
+def test_embedding_cache_hits_by_text_hash(tmp_path):
+    embedder = CountingEmbedder()
+    cache = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"))
+    first = cache.embed(["python developer", "java developer"], embedder)
+    second = cache.embed(["java developer", "python developer", "go developer"], embedder)
+    assert embedder.calls == [["python developer", "java developer"], ["go developer"]]
+    assert cache.stats == {"hits": 2, "misses": 3}
+    assert np.array_equal(second[1], first[0])
+    assert EmbeddingCache.key(embedder, "python developer") != EmbeddingCache.key(HashingEmbedder(), "python developer")
+    cache.close()
+
+    # A new process reads the same vectors back from SQLite
+    reopened = EmbeddingCache(str(tmp_path / "embeddings.sqlite3"))
+    assert np.array_equal(reopened.embed(["python developer"], embedder)[0], first[0])
+    assert len(embedder.calls) == 2 and reopened.stats["hits"] == 1
+    reopened.close()
+
+
+def test_embedding_cache_evicts_least_recent(embedder):
+    cache = EmbeddingCache(memory_items=2)
+    cache.embed(["a1 b1", "a2 b2", "a3 b3"], embedder)
+    cache.embed(["a1 b1"], embedder)
+    assert cache.stats["misses"] == 4
+
+
+def test_vector_index_add_search_save_reload(tmp_path, embedder):
+    index = VectorIndex(str(tmp_path), embedder=embedder)
+    index.add_texts([("backend", "Python backend engineer with Kubernetes"),
+                     ("design", "Graphic designer working in Figma"),
+                     ("data", "Data analyst writing SQL reports")])
+    assert len(index) == 3
+    (results,) = index.search(["Kubernetes Python engineer"], top_k=2)
+    assert results[0][0] == "backend"
+    assert len(results) == 2 and results[0][1] >= results[1][1]
+
+    # Re-adding a key replaces its vector instead of adding a row
+    index.add_texts([("design", "Figma and Kubernetes platform designer")])
+    index.save()
+    reopened = VectorIndex(str(tmp_path), embedder=embedder)
+    assert sorted(reopened.keys) == ["backend", "data", "design"]
+    assert isinstance(reopened.vectors, np.memmap)
+    assert reopened.search(["Figma designer"], top_k=1) == index.search(["Figma designer"], top_k=1)
+
+    with pytest.raises(ValueError):
+        VectorIndex(str(tmp_path), embedder=HashingEmbedder(dim=64))
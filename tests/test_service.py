@@ -0,0 +1,75 @@
+import io
+import json
+import socket
+import threading
+
+import pytest
+
+from ats.service import ServiceError, make_server, read_multipart
+
+
+@pytest.fixture
+def server():
+    server, service = make_server(port=0, workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def post(port, headers, body=b""):
+    """Send a raw POST /score and return (status code, JSON body or None)."""
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as sock:
+        sock.sendall(b"POST /score HTTP/1.1\r\nHost: test\r\n"
+                     b"Content-Type: multipart/form-data; boundary=b\r\n" + headers + b"\r\n" + body)
+        data = b""
+        while b"\r\n\r\n" not in data:
+            data += sock.recv(4096)
+        head, _, rest = data.partition(b"\r\n\r\n")
+        length = int(next((line.split(b":")[1] for line in head.split(b"\r\n")
+                           if line.lower().startswith(b"content-length")), b"0"))
+        while len(rest) < length:
+            rest += sock.recv(4096)
+    return int(head.split()[1]), json.loads(rest) if rest else None
+
+
+@pytest.mark.parametrize("value", [b"-1", b"abc", b"1.5"])
+def test_invalid_content_length_is_rejected(server, value):
+    status, body = post(server, b"Content-Length: " + value + b"\r\n", b"x" * 1000)
+    assert status == 400
+    assert body == {"error": "invalid Content-Length"}
+
+
+@pytest.mark.parametrize("value", [b"-1", b"abc"])
+def test_invalid_content_length_with_expect_100(server, value):
+    status, _ = post(server, b"Content-Length: " + value + b"\r\nExpect: 100-continue\r\n")
+    assert status == 400
+
+
+def test_oversized_body_is_refused_before_upload(server):
+    status, _ = post(server, b"Content-Length: 999999999\r\nExpect: 100-continue\r\n")
+    assert status == 413
+
+
+def test_missing_job_description(server):
+    body = (b"--b\r\nContent-Disposition: form-data; name=\"resume\"; filename=\"r.pdf\"\r\n\r\n%PDF\r\n--b--\r\n")
+    status, payload = post(server, b"Content-Length: %d\r\n" % len(body), body)
+    assert status == 400
+    assert payload == {"error": "job_description is required"}
+
+
+def test_read_multipart():
+    body = (b"--b\r\nContent-Disposition: form-data; name=\"job_description\"\r\n\r\nPython developer\r\n"
+            b"--b\r\nContent-Disposition: form-data; name=\"resume\"; filename=\"r.pdf\"\r\n"
+            b"Content-Type: application/pdf\r\n\r\n%PDF-1.4 data\r\n--b--\r\n")
+    fields, files = read_multipart(io.BytesIO(body), "multipart/form-data; boundary=b", len(body))
+    assert fields == {"job_description": "Python developer"}
+    assert files == [("resume", "r.pdf", b"%PDF-1.4 data")]
+
+
+def test_read_multipart_rejects_negative_length():
+    with pytest.raises(ServiceError) as error:
+        read_multipart(io.BytesIO(b""), "multipart/form-data; boundary=b", -1)
+    assert error.value.status == 400
@@ -0,0 +1,99 @@
+import json
+import os
+from array import array
+
+import pytest
+
+from ats.matcher import tokenize
+from ats.parser import parse_resume
+from ats.profile import get_profile, jd_hash
+from ats.taxonomy import Taxonomy, builtin_taxonomy, load_taxonomy
+from ats.text import content_words
+
+
+@pytest.fixture
+def taxonomy():
+    return builtin_taxonomy()
+
+
+@pytest.mark.parametrize("tokens, expected", [
+    (["k8s", "and", "kube"], ["kubernetes", "and", "kubernetes"]),
+    (["python3", "py"], ["python", "python"]),
+    (["ml", "engineer"], ["machine learning", "engineer"]),
+    (["amazon", "web", "services"], ["aws"]),
+    (["node", "js", "node.js", "nodejs"], ["node.js", "node.js", "node.js"]),
+    (["ci", "/", "cd"], ["ci/cd"]),
+    (["team", "lead", "."], ["leadership", "."]),
+    (["python", ",", "sql"], ["python", ",", "sql"]),
+    (["plain", "words"], ["plain", "words"]),
+])
+def test_canonicalize(taxonomy, tokens, expected):
+    assert taxonomy.canonicalize(tokens)[0] == expected
+
+
+def test_canonicalize_keeps_offsets_of_first_token(taxonomy):
+    tokens, offsets = taxonomy.canonicalize(["led", "amazon", "web", "services", "teams"], array('I', [0, 4, 11, 15, 24]))
+    assert tokens == ["led", "aws", "teams"]
+    assert offsets == array('I', [0, 4, 24])
+
+
+def test_unchanged_input_is_returned_as_is(taxonomy):
+    tokens, offsets = ["no", "aliases", "here"], [0, 3, 11]
+    assert taxonomy.canonicalize(tokens, offsets) == (tokens, offsets)
+    # Twice, so the screened-token memo is used
+    assert taxonomy.canonicalize(tokens, offsets)[0] is tokens
+
+
+def test_alias_stops_at_block_break(taxonomy):
+    assert taxonomy.canonicalize(["team", "lead"], breaks={1})[0] == ["team", "lead"]
+    assert tokenize("team\n\nlead")[0] == ["team", "lead"]
+    assert tokenize("team\nlead")[0] == ["leadership"]
+
+
+@pytest.mark.parametrize("phrase", ["CI/CD", "Node.js", "K8s", "Amazon Web Services", "ML", "Team-Lead"])
+def test_job_description_and_resume_agree(phrase):
+    resume_tokens = parse_resume(f"Worked with {phrase} daily").tokens
+    terms = get_profile(f"Looking for {phrase} experience, {phrase} again.").terms
+    canonical = [t for t in resume_tokens if t not in ("worked", "with", "daily")]
+    assert len(canonical) == 1
+    assert canonical[0] in terms
+    assert canonical[0] in content_words(f"{phrase} please")
+
+
+def test_load_taxonomy(tmp_path):
+    path = tmp_path / "skills.json"
+    path.write_text(json.dumps([{"name": "Kubernetes", "category": "devops", "aliases": ["k8s", "kube ctl"]}]))
+    taxonomy = load_taxonomy(str(path))
+    assert taxonomy.canonicalize(["k8s", "kube", "ctl"])[0] == ["kubernetes", "kubernetes"]
+    assert taxonomy.category("kubernetes") == "devops"
+    assert taxonomy.version
+
+
+def test_reload_on_change_and_keep_previous_on_error(tmp_path, monkeypatch, isolated_taxonomy):
+    path = tmp_path / "skills.json"
+    path.write_text(json.dumps([{"name": "golang", "aliases": ["go"]}]))
+    monkeypatch.setenv("ATS_TAXONOMY", str(path))
+    monkeypatch.setattr(isolated_taxonomy, "RELOAD_SECONDS", 0)
+    first = isolated_taxonomy.get_taxonomy()
+    assert first.canonicalize(["go"])[0] == ["golang"]
+    key = jd_hash("go developer")
+
+    path.write_text(json.dumps([{"name": "golang", "aliases": ["go", "go lang"]}]))
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    second = isolated_taxonomy.get_taxonomy()
+    assert second is not first
+    assert second.canonicalize(["go", "lang"])[0] == ["golang"]
+    assert jd_hash("go developer") != key
+
+    path.write_text("not json")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    assert isolated_taxonomy.get_taxonomy() is second
+
+
+def test_none_disables_canonicalization(monkeypatch, isolated_taxonomy):
+    monkeypatch.setenv("ATS_TAXONOMY", "none")
+    assert tokenize("k8s")[0] == ["k8s"]
+
+
+def test_empty_taxonomy():
+    assert Taxonomy([]).canonicalize(["k8s"], [0]) == (["k8s"], [0])